@@ -5,11 +5,37 @@ otherwise use the default boto3 credential provider (SSO, role, etc.).
 """
 
 import os
+from functools import lru_cache
 from typing import Any
 
+import boto3
+from botocore.config import Config
+
 from src.config import settings
 
+# Shared client config: large keep-alive pool so concurrent uploads/sends reuse
+# TLS connections, and botocore-level adaptive retries for throttling/5xx.
+# Retrying inside botocore reuses the already serialized body, so callers do
+# not need their own retry loops around uploads.
+_CLIENT_CONFIG = Config(
+    max_pool_connections=settings.aws.pool_connections,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 10},
+)
+
+# Per-service overrides merged on top of _CLIENT_CONFIG. SQS fails fast on
+# connect; the read timeout stays above the 20s long-poll wait, and a small
+# retry budget keeps a stuck send or receive from blocking for minutes.
+_SERVICE_CONFIGS: dict[str, Config] = {
+    "sqs": Config(
+        connect_timeout=3,
+        read_timeout=30,
+        retries={"mode": "adaptive", "max_attempts": 3},
+    ),
+}
 
+
+@lru_cache(maxsize=8)
 def get_boto3_client_kwargs(service: str = "s3") -> dict[str, Any]:
     """Return kwargs for boto3.client() so that explicit credentials are used only when set.
 
@@ -17,6 +43,9 @@ def get_boto3_client_kwargs(service: str = "s3") -> dict[str, Any]:
     they are included so boto3 uses them. Otherwise, no credentials are passed and
     boto3 uses its default chain (SSO, profile, instance role, etc.).
 
+    The result is cached per service for the lifetime of the process; callers
+    must not mutate it. Use reset_client_kwargs_cache() after changing the env.
+
     Args:
         service: Service name for boto3 (e.g. 's3', 'sqs').
 
@@ -33,3 +62,59 @@ def get_boto3_client_kwargs(service: str = "s3") -> dict[str, Any]:
         kwargs["aws_access_key_id"] = access_key
         kwargs["aws_secret_access_key"] = secret_key
     return kwargs
+
+
+def reset_client_kwargs_cache() -> None:
+    """Clear cached client kwargs so the environment is re-read (tests)."""
+    get_boto3_client_kwargs.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def get_session() -> boto3.Session:
+    """Return the boto3 Session shared by all clients built here.
+
+    A Session owns the botocore loader (service model JSON, endpoint data) and
+    the credential resolver, so building every client from one Session loads
+    and resolves those once per process. Region and credentials come from
+    get_boto3_client_kwargs. boto3's global default session is left untouched.
+
+    Returns:
+        Shared boto3 Session
+    """
+    return boto3.Session(**get_boto3_client_kwargs())
+
+
+def reset_session() -> None:
+    """Drop the shared Session so the next get_session() rebuilds it (tests)."""
+    get_session.cache_clear()
+
+
+@lru_cache(maxsize=8)
+def get_client(service: str) -> Any:
+    """Return a process-wide boto3 client for the given service.
+
+    Creating a boto3 client is expensive (service model loading, endpoint
+    resolution, credential lookup), so clients are built once and reused,
+    all from the shared Session (see get_session). boto3 clients
+    are thread-safe.
+
+    Args:
+        service: Service name for boto3 (e.g. 's3', 'sqs').
+
+    Returns:
+        Cached boto3 client
+    """
+    config = _CLIENT_CONFIG
+    if service in _SERVICE_CONFIGS:
+        config = config.merge(_SERVICE_CONFIGS[service])
+    return get_session().client(service, config=config)
+
+
+def get_s3_client() -> Any:
+    """Return the shared boto3 S3 client."""
+    return get_client("s3")
+
+
+def get_sqs_client() -> Any:
+    """Return the shared boto3 SQS client."""
+    return get_client("sqs")
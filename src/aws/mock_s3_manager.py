@@ -1,13 +1,14 @@
 """Mock S3 Manager for local testing without AWS infrastructure."""
 
-import json
+from collections.abc import Callable
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel
 from structlog import get_logger
 
+from src.aws.s3_manager import serialize_json
+
 logger = get_logger(__name__)
 
 
@@ -62,38 +63,12 @@ class MockS3Manager:
         """
         return f"{prefix}{data_type}"
 
-    def _serialize_data(self, data: Any) -> str:
-        """Serialize data to JSON string.
-
-        Handles both Pydantic models, dicts, and lists of Pydantic models.
-
-        Args:
-            data: Data to serialize (dict, Pydantic model, or list)
-
-        Returns:
-            JSON string
-        """
-        if isinstance(data, BaseModel):
-            return data.model_dump_json(by_alias=True)
-        elif isinstance(data, list):
-            # Check if list contains Pydantic models
-            if data and isinstance(data[0], BaseModel):
-                # Convert list of Pydantic models to list of dicts
-                serialized_list = [item.model_dump(by_alias=True) for item in data]
-                return json.dumps(serialized_list, default=str)
-            else:
-                return json.dumps(data, default=str)
-        elif isinstance(data, dict):
-            return json.dumps(data, default=str)
-        else:
-            return json.dumps({"data": str(data)})
-
     def _save_file(
         self,
         hotel_code: str,
         bucket_name: str,
         key: str,
-        content: str,
+        content: bytes,
     ) -> Path:
         """Save file to local directory.
 
@@ -101,7 +76,7 @@ class MockS3Manager:
             hotel_code: Hotel code
             bucket_name: Mock bucket name
             key: File key
-            content: File content
+            content: File content (UTF-8 encoded JSON)
 
         Returns:
             Path to saved file
@@ -121,7 +96,7 @@ class MockS3Manager:
         file_path = output_dir / prefixed_filename
 
         # Write file
-        file_path.write_text(content, encoding="utf-8")
+        file_path.write_bytes(content)
 
         return file_path
 
@@ -153,8 +128,8 @@ class MockS3Manager:
         suffix = custom_suffix or self.timestamp
         key = f"{hotel_code}/{data_type}-{suffix}.json"
 
-        # Serialize data
-        body = self._serialize_data(data)
+        # Serialize data (same single-pass serializer as S3Manager)
+        body = serialize_json(data)
 
         # Save file locally
         file_path = self._save_file(hotel_code, bucket_name, key, body)
@@ -201,8 +176,8 @@ class MockS3Manager:
         suffix = custom_suffix or self.timestamp
         key = f"{hotel_code}/{data_type}-{suffix}.json"
 
-        # Serialize data
-        body = self._serialize_data(data)
+        # Serialize data (same single-pass serializer as S3Manager)
+        body = serialize_json(data)
 
         # Save file locally
         file_path = self._save_file(hotel_code, bucket_name, key, body)
@@ -221,6 +196,34 @@ class MockS3Manager:
 
         return {"key": key, "url": url}
 
+    def upload_many(
+        self,
+        jobs: list[tuple[Callable[..., dict[str, str]], dict[str, Any]]],
+    ) -> list[dict[str, str]]:
+        """Mock batched upload - runs each upload sequentially.
+
+        Args:
+            jobs: List of (upload method, keyword arguments) tuples
+
+        Returns:
+            Upload results in the same order as jobs
+        """
+        return [func(**kwargs) for func, kwargs in jobs]
+
+    async def upload_many_async(
+        self,
+        jobs: list[tuple[Callable[..., dict[str, str]], dict[str, Any]]],
+    ) -> list[dict[str, str]]:
+        """Mock async batched upload - runs each upload sequentially.
+
+        Args:
+            jobs: List of (upload method, keyword arguments) tuples
+
+        Returns:
+            Upload results in the same order as jobs
+        """
+        return self.upload_many(jobs)
+
     def get_object(self, bucket_name: str, key: str) -> str:
         """Mock retrieve object from S3 - reads from local directory.
 
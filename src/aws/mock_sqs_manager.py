@@ -8,6 +8,7 @@ from typing import Any, Optional
 from pydantic import BaseModel
 from structlog import get_logger
 
+from src.aws.sqs_manager import STATIC_QUEUE_ATTRIBUTES
 from src.config import settings
 
 logger = get_logger(__name__)
@@ -251,6 +252,20 @@ class MockSQSManager:
 
         return {"successful": successful, "failed": 0}
 
+    async def send_batch_async(
+        self,
+        messages: list[dict[str, str]],
+    ) -> dict[str, Any]:
+        """Log mock batch messages from async code.
+
+        Args:
+            messages: List of message dicts with keys: hotel_code, file_type, file_key
+
+        Returns:
+            Dictionary with 'successful' and 'failed' message counts
+        """
+        return self.send_batch(messages)
+
     def receive_messages(
         self,
         max_messages: int = 10,
@@ -278,6 +293,36 @@ class MockSQSManager:
 
         return []
 
+    def receive_batch(
+        self,
+        target: int = 100,
+        window: float = 30,
+    ) -> list[dict[str, Any]]:
+        """Mock batch receive - returns empty list.
+
+        Args:
+            target: Number of messages to collect before returning
+            window: Maximum seconds to spend collecting
+
+        Returns:
+            Empty list (no messages in mock)
+        """
+        return self.receive_messages(max_messages=min(target, 10))
+
+    def delete_batch(self, receipt_handles: list[str]) -> dict[str, Any]:
+        """Mock batch delete - logs only.
+
+        Args:
+            receipt_handles: Receipt handles of the messages to delete
+
+        Returns:
+            Dictionary with 'successful' and 'failed' deletion counts
+        """
+        for receipt_handle in receipt_handles:
+            self.delete_message(receipt_handle)
+
+        return {"successful": len(receipt_handles), "failed": 0}
+
     def delete_message(self, receipt_handle: str) -> None:
         """Mock delete message - logs only.
 
@@ -328,3 +373,20 @@ class MockSQSManager:
         )
 
         return attributes
+
+    def get_static_attributes(self) -> dict[str, str]:
+        """Mock static attributes - subset of the mock queue attributes.
+
+        Returns:
+            Dictionary with QueueArn, VisibilityTimeout and MessageRetentionPeriod
+        """
+        attributes = self.get_queue_attributes()
+        return {name: attributes[name] for name in STATIC_QUEUE_ATTRIBUTES}
+
+    def get_queue_depth(self) -> int:
+        """Mock queue depth - always empty.
+
+        Returns:
+            0 (no messages in mock)
+        """
+        return 0
@@ -1,19 +1,138 @@
 """AWS S3 Manager for uploading raw and processed data."""
 
-import json
+import asyncio
+import functools
+import io
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timezone
+from operator import itemgetter
 from typing import Any
+from urllib.parse import urlencode
 
-import boto3
+import orjson
+from boto3.s3.transfer import TransferConfig
+from botocore.compat import HAS_CRT
 from botocore.exceptions import ClientError
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from structlog import get_logger
 
-from src.aws.client_factory import get_boto3_client_kwargs
+from src.aws.client_factory import get_s3_client
 from src.config import settings
 
 logger = get_logger(__name__)
 
+# Data types uploaded by the pipeline; bucket names are precomputed for these
+DATA_TYPES = ("hotel-configs", "reservations", "segments", "inventory", "revenue")
+
+_object_fields = itemgetter("Key", "Size", "LastModified")
+
+# Flexible checksum sent instead of Content-MD5. CRC32C is hardware accelerated
+# but botocore only supports it with the CRT extension; fall back to CRC32.
+CHECKSUM_ALGORITHM = "CRC32C" if HAS_CRT else "CRC32"
+
+# Bodies at or above this size go through multipart upload with parallel parts;
+# smaller bodies use a single put_object to avoid multipart overhead.
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    multipart_chunksize=MULTIPART_THRESHOLD,
+    max_concurrency=8,
+    use_threads=True,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _upload_executor() -> ThreadPoolExecutor:
+    """Return the process-wide pool used to fan out independent uploads.
+
+    Created on first use and shared by every S3Manager, so rebuilding managers
+    (e.g. one orchestrator per event loop) does not leak worker threads.
+    """
+    return ThreadPoolExecutor(
+        max_workers=settings.aws.s3_max_workers or 16,
+        thread_name_prefix="s3-upload",
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _list_adapter(model_cls: type[BaseModel]) -> TypeAdapter:
+    """Return a cached TypeAdapter for serializing lists of a model class."""
+    return TypeAdapter(list[model_cls])
+
+
+def serialize_json(data: Any, pretty: bool = False) -> bytes:
+    """Serialize upload data to UTF-8 encoded JSON bytes in a single pass.
+
+    Handles both Pydantic models, dicts, and lists of Pydantic models. Models
+    are encoded by pydantic-core and everything else by orjson, so fields are
+    walked once and bytes are returned without an extra str -> bytes copy.
+
+    Args:
+        data: Data to serialize (dict, Pydantic model, or list)
+        pretty: Indent output (debugging only)
+
+    Returns:
+        JSON bytes
+    """
+    indent = 2 if pretty else None
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+
+    # Exact type checks first: cheaper than isinstance() on the hot path
+    cls = type(data)
+    if cls is dict:
+        return orjson.dumps(data, default=str, option=option)
+    elif cls is list:
+        # Lists of Pydantic models are encoded by pydantic-core in a
+        # single pass, without materializing intermediate dicts
+        if data and hasattr(type(data[0]), "__pydantic_serializer__"):
+            return _list_adapter(type(data[0])).dump_json(
+                data, by_alias=True, indent=indent
+            )
+        return orjson.dumps(data, default=str, option=option)
+    elif hasattr(cls, "__pydantic_serializer__"):
+        return data.__pydantic_serializer__.to_json(data, by_alias=True, indent=indent)
+    elif isinstance(data, (dict, list)):
+        # dict/list subclasses
+        return orjson.dumps(data, default=str, option=option)
+    else:
+        return orjson.dumps({"data": str(data)}, option=option)
+
+
+def serialize_ndjson(items: list[Any]) -> bytes:
+    """Serialize a list to newline-delimited JSON (one record per line).
+
+    Each record is encoded independently, so consumers can stream the file
+    line by line instead of parsing a single large array.
+
+    Args:
+        items: Records to serialize (Pydantic models or JSON-compatible values)
+
+    Returns:
+        NDJSON bytes, newline-terminated
+    """
+    if not items:
+        return b""
+    if hasattr(type(items[0]), "__pydantic_serializer__"):
+        lines = [item.__pydantic_serializer__.to_json(item, by_alias=True) for item in items]
+    else:
+        lines = [
+            orjson.dumps(item, default=str, option=orjson.OPT_NON_STR_KEYS)
+            for item in items
+        ]
+    return b"\n".join(lines) + b"\n"
+
+
+def _zstd() -> Any:
+    """Import the optional zstandard module, used only when compression is on."""
+    try:
+        import zstandard
+    except ImportError as e:
+        raise S3UploadError(
+            "zstd compression requires the 'zstandard' package (pip install host-pms[zstd])"
+        ) from e
+    return zstandard
+
 
 class S3UploadError(Exception):
     """Raised when S3 upload fails."""
@@ -27,14 +146,26 @@ class S3Manager:
     def __init__(self):
         """Initialize S3 Manager with AWS settings.
 
-        Uses AWS_ACCESS_KEY_ID/AWS_SECRET_ACCESS_KEY if set; otherwise
-        boto3 default credential provider (SSO, role, etc.).
+        The boto3 client is shared process-wide (see client_factory). Uses
+        AWS_ACCESS_KEY_ID/AWS_SECRET_ACCESS_KEY if set; otherwise boto3
+        default credential provider (SSO, role, etc.).
         """
         self.region = settings.aws.region
-        self.s3_client = boto3.client("s3", **get_boto3_client_kwargs("s3"))
+        self.s3_client = get_s3_client()
         self.raw_prefix = settings.aws_s3_raw_prefix
         self.processed_prefix = settings.aws_s3_processed_prefix
+        self._raw_buckets = {dt: self.raw_prefix + dt for dt in DATA_TYPES}
+        self._processed_buckets = {dt: self.processed_prefix + dt for dt in DATA_TYPES}
         self.timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        # Compact JSON by default; indentation only when explicitly requested
+        self.pretty_json = settings.aws.pretty_json
+        # Opt-in zstd compression of upload bodies (keys get a .zst suffix)
+        self.compress = settings.aws.s3_compress
+        # Opt-in NDJSON (.jsonl) for list payloads instead of a JSON array
+        self.ndjson = settings.aws.s3_ndjson
+        # Hotel code / data type are already encoded in bucket and key; only
+        # tag objects with them when explicitly enabled (needs PutObjectTagging)
+        self.object_tagging = settings.aws.s3_object_tagging
 
     def _get_bucket_name(self, prefix: str, data_type: str) -> str:
         """Construct S3 bucket name from prefix and data type.
@@ -48,31 +179,63 @@ class S3Manager:
         """
         return f"{prefix}{data_type}"
 
-    def _serialize_data(self, data: Any) -> str:
-        """Serialize data to JSON string.
-
-        Handles both Pydantic models, dicts, and lists of Pydantic models.
+    def _serialize_data_bytes(self, data: Any) -> bytes:
+        """Serialize data to UTF-8 encoded JSON bytes.
 
         Args:
             data: Data to serialize (dict, Pydantic model, or list)
 
         Returns:
-            JSON string
+            JSON bytes
         """
-        if isinstance(data, BaseModel):
-            return data.model_dump_json(by_alias=True)
-        elif isinstance(data, list):
-            # Check if list contains Pydantic models
-            if data and isinstance(data[0], BaseModel):
-                # Convert list of Pydantic models to list of dicts
-                serialized_list = [item.model_dump(by_alias=True) for item in data]
-                return json.dumps(serialized_list, default=str)
-            else:
-                return json.dumps(data, default=str)
-        elif isinstance(data, dict):
-            return json.dumps(data, default=str)
-        else:
-            return json.dumps({"data": str(data)})
+        return serialize_json(data, pretty=self.pretty_json)
+
+    def _put_body(
+        self,
+        bucket_name: str,
+        key: str,
+        body: bytes,
+        compress: bool = False,
+        tags: dict[str, str] | None = None,
+        content_type: str = "application/json",
+    ) -> None:
+        """Write a JSON body to S3, using multipart upload for large payloads.
+
+        Args:
+            bucket_name: S3 bucket name
+            key: Object key
+            body: Encoded JSON body
+            compress: Compress the body with zstd and set Content-Encoding
+            tags: Object tags, sent only when object tagging is enabled
+            content_type: Content-Type of the (uncompressed) body
+        """
+        extra_args: dict[str, Any] = {
+            "ContentType": content_type,
+            "ChecksumAlgorithm": CHECKSUM_ALGORITHM,
+        }
+        if compress:
+            body = _zstd().ZstdCompressor(level=3).compress(body)
+            extra_args["ContentEncoding"] = "zstd"
+            extra_args["Metadata"] = {"compression": "zstd"}
+        if tags and self.object_tagging:
+            extra_args["Tagging"] = urlencode(tags)
+
+        if len(body) < MULTIPART_THRESHOLD:
+            self.s3_client.put_object(
+                Bucket=bucket_name,
+                Key=key,
+                Body=body,
+                **extra_args,
+            )
+            return
+
+        self.s3_client.upload_fileobj(
+            io.BytesIO(body),
+            bucket_name,
+            key,
+            ExtraArgs=extra_args,
+            Config=_TRANSFER_CONFIG,
+        )
 
     def upload_raw(
         self,
@@ -80,22 +243,26 @@ class S3Manager:
         data_type: str,
         data: Any,
         custom_suffix: str = "",
+        compress: bool | None = None,
     ) -> dict[str, str]:
         """Upload raw data to raw S3 bucket.
 
-        Raw buckets store original API responses for audit trail.
+        Raw buckets store original API responses for audit trail. List payloads are
+        written as NDJSON (.jsonl) when settings.aws.s3_ndjson is enabled.
 
         Args:
             hotel_code: Hotel code identifier
             data_type: Type of data (hotel-configs, reservations, inventory, revenue)
             data: Data to upload (dict or Pydantic model)
             custom_suffix: Optional custom suffix for filename
+            compress: zstd-compress the body (key gets a .zst suffix);
+                defaults to settings.aws.s3_compress
 
         Returns:
             Dictionary with 'key' and 'url' of uploaded file
 
         Raises:
-            S3UploadError: If upload fails
+            S3UploadError: If upload fails after botocore retries are exhausted
         """
         logger.info(
             "Uploading raw data to S3",
@@ -104,24 +271,31 @@ class S3Manager:
         )
 
         try:
-            bucket_name = self._get_bucket_name(self.raw_prefix, data_type)
+            bucket_name = self._raw_buckets.get(data_type) or self._get_bucket_name(
+                self.raw_prefix, data_type
+            )
             suffix = custom_suffix or self.timestamp
-            key = f"{hotel_code}/{data_type}-{suffix}.json"
+            if compress is None:
+                compress = self.compress
+            ndjson = self.ndjson and isinstance(data, list)
+            key = f"{hotel_code}/{data_type}-{suffix}.{'jsonl' if ndjson else 'json'}"
+            if compress:
+                key += ".zst"
 
             # Serialize data
-            body = self._serialize_data(data)
+            if ndjson:
+                body = serialize_ndjson(data)
+            else:
+                body = self._serialize_data_bytes(data)
 
             # Upload to S3
-            self.s3_client.put_object(
-                Bucket=bucket_name,
-                Key=key,
-                Body=body.encode("utf-8"),
-                ContentType="application/json",
-                Metadata={
-                    "hotel-code": hotel_code,
-                    "data-type": data_type,
-                    "upload-timestamp": datetime.now(timezone.utc).isoformat(),
-                },
+            self._put_body(
+                bucket_name,
+                key,
+                body,
+                compress=compress,
+                content_type="application/x-ndjson" if ndjson else "application/json",
+                tags={"hotel-code": hotel_code, "data-type": data_type},
             )
 
             url = f"s3://{bucket_name}/{key}"
@@ -135,7 +309,9 @@ class S3Manager:
 
             return {"key": key, "url": url}
 
-        except ClientError as e:
+        except Exception as e:
+            # Transient S3 errors (503 SlowDown, throttling) were already
+            # retried by botocore's adaptive retry mode before reaching here
             logger.error(
                 "Failed to upload raw data to S3",
                 hotel_code=hotel_code,
@@ -145,16 +321,6 @@ class S3Manager:
             raise S3UploadError(
                 f"Failed to upload raw data for {hotel_code}/{data_type}: {str(e)}"
             ) from e
-        except Exception as e:
-            logger.error(
-                "Unexpected error uploading raw data",
-                hotel_code=hotel_code,
-                data_type=data_type,
-                error=str(e),
-            )
-            raise S3UploadError(
-                f"Unexpected error uploading raw data: {str(e)}"
-            ) from e
 
     def upload_processed(
         self,
@@ -162,22 +328,26 @@ class S3Manager:
         data_type: str,
         data: Any,
         custom_suffix: str = "",
+        compress: bool | None = None,
     ) -> dict[str, str]:
         """Upload processed data to processed S3 bucket.
 
-        Processed buckets store Climber standardized format data.
+        Processed buckets store Climber standardized format data. List payloads are
+        written as NDJSON (.jsonl) when settings.aws.s3_ndjson is enabled.
 
         Args:
             hotel_code: Hotel code identifier
             data_type: Type of data (hotel-configs, reservations, inventory, revenue)
             data: Data to upload (dict or Pydantic model)
             custom_suffix: Optional custom suffix for filename
+            compress: zstd-compress the body (key gets a .zst suffix);
+                defaults to settings.aws.s3_compress
 
         Returns:
             Dictionary with 'key' and 'url' of uploaded file
 
         Raises:
-            S3UploadError: If upload fails
+            S3UploadError: If upload fails after botocore retries are exhausted
         """
         logger.info(
             "Uploading processed data to S3",
@@ -186,24 +356,34 @@ class S3Manager:
         )
 
         try:
-            bucket_name = self._get_bucket_name(self.processed_prefix, data_type)
+            bucket_name = self._processed_buckets.get(
+                data_type
+            ) or self._get_bucket_name(self.processed_prefix, data_type)
             suffix = custom_suffix or self.timestamp
-            key = f"{hotel_code}/{data_type}-{suffix}.json"
+            if compress is None:
+                compress = self.compress
+            ndjson = self.ndjson and isinstance(data, list)
+            key = f"{hotel_code}/{data_type}-{suffix}.{'jsonl' if ndjson else 'json'}"
+            if compress:
+                key += ".zst"
 
             # Serialize data
-            body = self._serialize_data(data)
+            if ndjson:
+                body = serialize_ndjson(data)
+            else:
+                body = self._serialize_data_bytes(data)
 
             # Upload to S3
-            self.s3_client.put_object(
-                Bucket=bucket_name,
-                Key=key,
-                Body=body.encode("utf-8"),
-                ContentType="application/json",
-                Metadata={
+            self._put_body(
+                bucket_name,
+                key,
+                body,
+                compress=compress,
+                content_type="application/x-ndjson" if ndjson else "application/json",
+                tags={
                     "hotel-code": hotel_code,
                     "data-type": data_type,
                     "format": "climber-standardized",
-                    "upload-timestamp": datetime.now(timezone.utc).isoformat(),
                 },
             )
 
@@ -218,7 +398,9 @@ class S3Manager:
 
             return {"key": key, "url": url}
 
-        except ClientError as e:
+        except Exception as e:
+            # Transient S3 errors (503 SlowDown, throttling) were already
+            # retried by botocore's adaptive retry mode before reaching here
             logger.error(
                 "Failed to upload processed data to S3",
                 hotel_code=hotel_code,
@@ -228,16 +410,69 @@ class S3Manager:
             raise S3UploadError(
                 f"Failed to upload processed data for {hotel_code}/{data_type}: {str(e)}"
             ) from e
-        except Exception as e:
-            logger.error(
-                "Unexpected error uploading processed data",
-                hotel_code=hotel_code,
-                data_type=data_type,
-                error=str(e),
-            )
-            raise S3UploadError(
-                f"Unexpected error uploading processed data: {str(e)}"
-            ) from e
+
+    def upload_many(
+        self,
+        jobs: list[tuple[Callable[..., dict[str, str]], dict[str, Any]]],
+    ) -> list[dict[str, str]]:
+        """Run independent uploads concurrently on the shared thread pool.
+
+        Each S3 PUT is network-bound, so running them in parallel cuts
+        wall-clock time roughly by the number of uploads in flight.
+
+        Args:
+            jobs: List of (upload method, keyword arguments) tuples, e.g.
+                (self.upload_raw, {"hotel_code": ..., "data_type": ..., "data": ...})
+
+        Returns:
+            Upload results in the same order as jobs
+
+        Raises:
+            S3UploadError: First failure (in job order) once all uploads finished
+        """
+        futures = [_upload_executor().submit(func, **kwargs) for func, kwargs in jobs]
+        wait(futures)
+
+        for future in futures:
+            error = future.exception()
+            if error is not None:
+                raise error
+
+        return [future.result() for future in futures]
+
+    async def upload_many_async(
+        self,
+        jobs: list[tuple[Callable[..., dict[str, str]], dict[str, Any]]],
+    ) -> list[dict[str, str]]:
+        """Await independent uploads running concurrently on the shared pool.
+
+        Async counterpart of upload_many for pipeline steps: the uploads run
+        on the S3 thread pool while the event loop stays free, completing in
+        the time of the slowest upload rather than their sum.
+
+        Args:
+            jobs: List of (upload method, keyword arguments) tuples
+
+        Returns:
+            Upload results in the same order as jobs
+
+        Raises:
+            S3UploadError: First failure (in job order) once all uploads finished
+        """
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(_upload_executor(), functools.partial(func, **kwargs))
+                for func, kwargs in jobs
+            ),
+            return_exceptions=True,
+        )
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        return results
 
     def get_object(self, bucket_name: str, key: str) -> str:
         """Retrieve object from S3.
@@ -247,7 +482,7 @@ class S3Manager:
             key: Object key
 
         Returns:
-            Object content as string
+            Object content as string (zstd-encoded objects are decompressed)
 
         Raises:
             S3UploadError: If retrieval fails
@@ -260,7 +495,10 @@ class S3Manager:
 
         try:
             response = self.s3_client.get_object(Bucket=bucket_name, Key=key)
-            content = response["Body"].read().decode("utf-8")
+            body = response["Body"].read()
+            if response.get("ContentEncoding") == "zstd":
+                body = _zstd().ZstdDecompressor().decompress(body)
+            content = body.decode("utf-8")
 
             logger.info(
                 "Successfully retrieved object from S3",
@@ -285,12 +523,14 @@ class S3Manager:
         self,
         bucket_name: str,
         prefix: str = "",
+        raw: bool = False,
     ) -> list[dict[str, Any]]:
         """List objects in S3 bucket with optional prefix.
 
         Args:
             bucket_name: S3 bucket name
             prefix: Optional object key prefix
+            raw: Return last_modified as datetime instead of ISO string
 
         Returns:
             List of object metadata dictionaries
@@ -308,17 +548,20 @@ class S3Manager:
             paginator = self.s3_client.get_paginator("list_objects_v2")
             pages = paginator.paginate(Bucket=bucket_name, Prefix=prefix)
 
-            objects = []
-            for page in pages:
-                if "Contents" in page:
-                    for obj in page["Contents"]:
-                        objects.append(
-                            {
-                                "key": obj["Key"],
-                                "size": obj["Size"],
-                                "last_modified": obj["LastModified"].isoformat(),
-                            }
-                        )
+            if raw:
+                objects = [
+                    {"key": key, "size": size, "last_modified": modified}
+                    for page in pages
+                    if "Contents" in page
+                    for key, size, modified in map(_object_fields, page["Contents"])
+                ]
+            else:
+                objects = [
+                    {"key": key, "size": size, "last_modified": modified.isoformat()}
+                    for page in pages
+                    if "Contents" in page
+                    for key, size, modified in map(_object_fields, page["Contents"])
+                ]
 
             logger.info(
                 "Successfully listed objects",
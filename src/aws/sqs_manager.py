@@ -1,19 +1,116 @@
 """AWS SQS Manager for FIFO queue operations."""
 
-import json
+import asyncio
+import hashlib
+import math
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, Optional
 
-import boto3
+import orjson
 from botocore.exceptions import ClientError
 from pydantic import BaseModel
 from structlog import get_logger
 
-from src.aws.client_factory import get_boto3_client_kwargs
+from src.aws.client_factory import get_sqs_client
 from src.config import settings
 
 logger = get_logger(__name__)
 
+# SendMessageBatch accepts at most 10 entries per call
+SQS_BATCH_SIZE = 10
+# Maximum SendMessageBatch calls in flight for send_batch_async
+SQS_MAX_CONCURRENT_BATCHES = 16
+# Queue attributes that are fixed at runtime (cached by get_static_attributes)
+STATIC_QUEUE_ATTRIBUTES = ("QueueArn", "VisibilityTimeout", "MessageRetentionPeriod")
+
+# SHA-1 state primed with the uuid5 namespace; copied per message so only the
+# name part is hashed each time
+_DEDUP_NAMESPACE_SHA1 = hashlib.sha1(uuid.NAMESPACE_DNS.bytes)
+
+
+def _build_dedup_id(hotel_code: str, file_key: str) -> str:
+    """Build the FIFO deduplication id for a hotel file.
+
+    Equivalent to str(uuid.uuid5(uuid.NAMESPACE_DNS, hotel_code + file_key)),
+    reusing the namespace-primed SHA-1 state.
+
+    Args:
+        hotel_code: Hotel code
+        file_key: S3 key of the processed file
+
+    Returns:
+        Deduplication id (UUID string)
+    """
+    h = _DEDUP_NAMESPACE_SHA1.copy()
+    h.update(hotel_code.encode("utf-8"))
+    h.update(file_key.encode("utf-8"))
+    digest = bytearray(h.digest()[:16])
+    digest[6] = (digest[6] & 0x0F) | 0x50  # version 5
+    digest[8] = (digest[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return str(uuid.UUID(bytes=bytes(digest)))
+
+
+def _chunk_lanes(messages: list[dict[str, str]]) -> list[list[list[dict[str, str]]]]:
+    """Split messages into SendMessageBatch chunks grouped into ordered lanes.
+
+    Messages are chunked in their original order (SQS_BATCH_SIZE per chunk).
+    Chunks that share a hotel code (the FIFO MessageGroupId) land in the same
+    lane, in their original order, so a lane must be sent sequentially while
+    different lanes can be sent concurrently without reordering any group.
+
+    Args:
+        messages: Message dicts with keys: hotel_code, file_type, file_key
+
+    Returns:
+        Lanes, each a list of chunks in send order
+    """
+    chunks = [
+        messages[start : start + SQS_BATCH_SIZE]
+        for start in range(0, len(messages), SQS_BATCH_SIZE)
+    ]
+
+    # Union-find over chunk indices, joined through shared hotel codes
+    parent = list(range(len(chunks)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    first_chunk: dict[str, int] = {}
+    for i, chunk in enumerate(chunks):
+        for message in chunk:
+            j = first_chunk.setdefault(message["hotel_code"], i)
+            parent[find(i)] = find(j)
+
+    lanes: dict[int, list[list[dict[str, str]]]] = {}
+    for i, chunk in enumerate(chunks):
+        lanes.setdefault(find(i), []).append(chunk)
+    return list(lanes.values())
+
+
+@lru_cache(maxsize=1)
+def _send_executor() -> ThreadPoolExecutor:
+    """Return the process-wide pool used to send batch lanes in parallel.
+
+    Created on first use and shared by every SQSManager, so rebuilding managers
+    does not leak worker threads. Keep it no larger than AWS_POOL_CONNECTIONS
+    to avoid starving the boto3 connection pool.
+    """
+    return ThreadPoolExecutor(
+        max_workers=settings.aws.sqs_workers or 16,
+        thread_name_prefix="sqs-send",
+    )
+
+
+def _long_poll_floor() -> int:
+    """Shortest WaitTimeSeconds ever sent (AWS_SQS_MIN_WAIT_SECONDS, within 1..20)."""
+    return min(max(settings.aws.sqs_min_wait_seconds, 1), 20)
+
 
 class SQSError(Exception):
     """Raised when SQS operation fails."""
@@ -27,13 +124,16 @@ class SQSManager:
     def __init__(self):
         """Initialize SQS Manager with AWS settings.
 
-        Uses AWS_ACCESS_KEY_ID/AWS_SECRET_ACCESS_KEY if set; otherwise
-        boto3 default credential provider (SSO, role, etc.).
+        The boto3 client is shared process-wide (see client_factory). Uses
+        AWS_ACCESS_KEY_ID/AWS_SECRET_ACCESS_KEY if set; otherwise boto3
+        default credential provider (SSO, role, etc.).
         """
         self.region = settings.aws.region
-        self.sqs_client = boto3.client("sqs", **get_boto3_client_kwargs("sqs"))
-        self.queue_name = settings.aws.sqs_queue_name
-        self._queue_url: Optional[str] = None
+        self.sqs_client = get_sqs_client()
+        self.queue_name = settings.aws_sqs_queue_name
+        # Resolve from config up front so no GetQueueUrl call is needed
+        self._queue_url: Optional[str] = self._configured_queue_url()
+        self._static_attributes: Optional[dict[str, str]] = None
 
         logger.info("SQS Manager initialized", queue_name=self.queue_name)
 
@@ -44,40 +144,58 @@ class SQSManager:
         u = url.strip().lower()
         return "123456789012" in u or "your_account_id" in u
 
+    def _configured_queue_url(self) -> Optional[str]:
+        """Queue URL known from configuration, without calling the SQS API.
+
+        Uses explicit SQS_QUEUE_URL if set and not a placeholder; otherwise
+        builds the URL from AWS_ACCOUNT_ID, region and queue name when the
+        account id is configured.
+
+        Returns:
+            Queue URL, or None if it has to be resolved with GetQueueUrl
+        """
+        # Climber padrão: explicit URL from env only if set and not placeholder
+        explicit_url = getattr(settings, "sqs_queue_url", "") or getattr(
+            settings.aws, "sqs_queue_url", ""
+        )
+        explicit_url = (
+            explicit_url.strip().split("\n")[0].split("#")[0].strip()
+            if explicit_url
+            else ""
+        )
+        if explicit_url and not self._is_placeholder_queue_url(explicit_url):
+            logger.info("Using SQS queue URL from config", queue_url=explicit_url)
+            return explicit_url
+
+        account_id = settings.aws.account_id.strip()
+        if account_id:
+            url = f"https://sqs.{self.region}.amazonaws.com/{account_id}/{self.queue_name}"
+            logger.info("Using SQS queue URL built from account id", queue_url=url)
+            return url
+
+        return None
+
     @property
     def queue_url(self) -> str:
-        """Get queue URL: use explicit SQS_QUEUE_URL if set and not placeholder, else resolve by queue name."""
+        """Get queue URL: configured at init if possible, else resolved once by queue name."""
         if self._queue_url is None:
-            # Climber padrão: explicit URL from env only if set and not placeholder
-            explicit_url = getattr(settings, "sqs_queue_url", "") or getattr(
-                settings.aws, "sqs_queue_url", ""
-            )
-            explicit_url = (
-                explicit_url.strip().split("\n")[0].split("#")[0].strip()
-                if explicit_url
-                else ""
-            )
-            if explicit_url and not self._is_placeholder_queue_url(explicit_url):
-                self._queue_url = explicit_url
-                logger.info("Using SQS queue URL from config", queue_url=self._queue_url)
-            else:
-                try:
-                    response = self.sqs_client.get_queue_url(QueueName=self.queue_name)
-                    self._queue_url = response["QueueUrl"]
-                    logger.info(
-                        "Successfully fetched SQS queue URL",
-                        queue_name=self.queue_name,
-                        queue_url=self._queue_url,
-                    )
-                except ClientError as e:
-                    logger.error(
-                        "Failed to fetch queue URL",
-                        queue_name=self.queue_name,
-                        error=str(e),
-                    )
-                    raise SQSError(
-                        f"Failed to get SQS queue URL for {self.queue_name}: {str(e)}"
-                    ) from e
+            try:
+                response = self.sqs_client.get_queue_url(QueueName=self.queue_name)
+                self._queue_url = response["QueueUrl"]
+                logger.info(
+                    "Successfully fetched SQS queue URL",
+                    queue_name=self.queue_name,
+                    queue_url=self._queue_url,
+                )
+            except ClientError as e:
+                logger.error(
+                    "Failed to fetch queue URL",
+                    queue_name=self.queue_name,
+                    error=str(e),
+                )
+                raise SQSError(
+                    f"Failed to get SQS queue URL for {self.queue_name}: {str(e)}"
+                ) from e
         return self._queue_url
 
     def _serialize_message(self, data: Any) -> str:
@@ -92,9 +210,51 @@ class SQSManager:
         if isinstance(data, BaseModel):
             return data.model_dump_json(by_alias=True)
         elif isinstance(data, dict):
-            return json.dumps(data)
+            return orjson.dumps(data).decode("utf-8")
         else:
-            return json.dumps({"data": str(data)})
+            return orjson.dumps({"data": str(data)}).decode("utf-8")
+
+    def _build_entry(
+        self,
+        hotel_code: str,
+        file_type: str,
+        file_key: str,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Build SendMessage parameters for a file notification.
+
+        Shared by send_message and send_batch so single and batched sends
+        produce identical messages.
+
+        Args:
+            hotel_code: Hotel code (used as MessageGroupId for FIFO ordering)
+            file_type: Type of file (config, reservation, inventory, revenue)
+            file_key: S3 key of the processed file
+            metadata: Optional additional metadata
+
+        Returns:
+            Dict with MessageBody, MessageGroupId, MessageDeduplicationId and
+            MessageAttributes
+        """
+        message_body = {
+            "hotelCode": hotel_code,
+            "fileType": file_type,
+            "fileKey": file_key,
+        }
+        if metadata:
+            message_body = {**message_body, **metadata}
+
+        return {
+            # Body is always a plain dict, so skip the _serialize_message dispatch
+            "MessageBody": orjson.dumps(message_body).decode("utf-8"),
+            "MessageGroupId": hotel_code,  # FIFO group for per-hotel ordering
+            # Deduplication ID to prevent duplicate messages
+            "MessageDeduplicationId": _build_dedup_id(hotel_code, file_key),
+            "MessageAttributes": {
+                "HotelCode": {"StringValue": hotel_code, "DataType": "String"},
+                "FileType": {"StringValue": file_type, "DataType": "String"},
+            },
+        }
 
     def send_processor_message(
         self,
@@ -154,10 +314,10 @@ class SQSManager:
         """Send a message to the SQS FIFO queue.
 
         FIFO queue ensures messages are processed in order per hotel.
-        The GroupId is set to hotel_code to ensure hotel-specific ordering.
+        The MessageGroupId is set to hotel_code to ensure hotel-specific ordering.
 
         Args:
-            hotel_code: Hotel code (used as GroupId for FIFO ordering)
+            hotel_code: Hotel code (used as MessageGroupId for FIFO ordering)
             file_type: Type of file (config, reservation, inventory, revenue)
             file_key: S3 key of the processed file
             metadata: Optional additional metadata
@@ -168,7 +328,7 @@ class SQSManager:
         Raises:
             SQSError: If message send fails
         """
-        logger.info(
+        logger.debug(
             "Sending message to SQS queue",
             hotel_code=hotel_code,
             file_type=file_type,
@@ -176,36 +336,14 @@ class SQSManager:
         )
 
         try:
-            # Create message body
-            message_body = {
-                "hotelCode": hotel_code,
-                "fileType": file_type,
-                "fileKey": file_key,
-            }
-
-            # Add optional metadata
-            if metadata:
-                message_body.update(metadata)
-
-            # Generate deduplication ID to prevent duplicate messages
-            deduplication_id = str(
-                uuid.uuid5(uuid.NAMESPACE_DNS, f"{hotel_code}{file_key}")
-            )
-
             # Send to FIFO queue
             response = self.sqs_client.send_message(
                 QueueUrl=self.queue_url,
-                MessageBody=self._serialize_message(message_body),
-                GroupId=hotel_code,  # FIFO GroupId for ordering
-                MessageDeduplicationId=deduplication_id,
-                MessageAttributes={
-                    "HotelCode": {"StringValue": hotel_code, "DataType": "String"},
-                    "FileType": {"StringValue": file_type, "DataType": "String"},
-                },
+                **self._build_entry(hotel_code, file_type, file_key, metadata),
             )
 
             message_id = response["MessageId"]
-            logger.info(
+            logger.debug(
                 "Successfully sent message to SQS queue",
                 hotel_code=hotel_code,
                 file_type=file_type,
@@ -237,12 +375,78 @@ class SQSManager:
                 f"Unexpected error sending SQS message: {str(e)}"
             ) from e
 
+    def _send_batch_chunk(self, chunk: list[dict[str, str]]) -> tuple[int, int]:
+        """Send up to 10 messages with a single SendMessageBatch call.
+
+        Args:
+            chunk: Message dicts with keys: hotel_code, file_type, file_key
+
+        Returns:
+            Tuple of (successful, failed) counts
+        """
+        entries = [
+            {
+                "Id": str(i),
+                **self._build_entry(
+                    hotel_code=message["hotel_code"],
+                    file_type=message["file_type"],
+                    file_key=message["file_key"],
+                    metadata=message.get("metadata"),
+                ),
+            }
+            for i, message in enumerate(chunk)
+        ]
+
+        try:
+            response = self.sqs_client.send_message_batch(
+                QueueUrl=self.queue_url,
+                Entries=entries,
+            )
+        except ClientError as e:
+            logger.warning(
+                "Failed to send message batch",
+                batch_size=len(entries),
+                error=str(e),
+            )
+            return 0, len(entries)
+
+        failures = response.get("Failed", [])
+        for failure in failures:
+            logger.warning(
+                "Failed to send message in batch",
+                hotel_code=chunk[int(failure["Id"])].get("hotel_code"),
+                error=failure.get("Message", failure.get("Code")),
+            )
+
+        return len(response.get("Successful", [])), len(failures)
+
+    def _send_lane(self, lane: list[list[dict[str, str]]]) -> tuple[int, int]:
+        """Send a lane's chunks one after another to keep FIFO group order.
+
+        Args:
+            lane: Chunks from _chunk_lanes, in send order
+
+        Returns:
+            Tuple of (successful, failed) counts
+        """
+        successful = failed = 0
+        for chunk in lane:
+            sent, not_sent = self._send_batch_chunk(chunk)
+            successful += sent
+            failed += not_sent
+        return successful, failed
+
     def send_batch(
         self,
         messages: list[dict[str, str]],
     ) -> dict[str, Any]:
         """Send multiple messages to the SQS FIFO queue.
 
+        Messages are sent with SendMessageBatch in chunks of 10 (the SQS
+        limit), so N messages cost ceil(N / 10) API calls instead of N.
+        Chunks sharing a hotel code are sent in order; chunks for disjoint
+        sets of hotels are sent in parallel on the shared thread pool.
+
         Args:
             messages: List of message dicts with keys: hotel_code, file_type, file_key
 
@@ -259,26 +463,77 @@ class SQSManager:
         )
 
         try:
-            successful = 0
-            failed = 0
-
-            for message in messages:
-                try:
-                    self.send_message(
-                        hotel_code=message["hotel_code"],
-                        file_type=message["file_type"],
-                        file_key=message["file_key"],
-                        metadata=message.get("metadata"),
-                    )
-                    successful += 1
-                except SQSError as e:
-                    logger.warning(
-                        "Failed to send message in batch",
-                        hotel_code=message.get("hotel_code"),
-                        error=str(e),
-                    )
-                    failed += 1
-                    continue
+            # Resolve the queue URL once before fanning out
+            _ = self.queue_url
+
+            results = list(_send_executor().map(self._send_lane, _chunk_lanes(messages)))
+
+            successful = sum(sent for sent, _ in results)
+            failed = sum(not_sent for _, not_sent in results)
+
+            logger.info(
+                "Batch send complete",
+                total_messages=len(messages),
+                successful=successful,
+                failed=failed,
+            )
+
+            return {"successful": successful, "failed": failed}
+
+        except Exception as e:
+            logger.error(
+                "Unexpected error in batch send",
+                error=str(e),
+            )
+            raise SQSError(f"Unexpected error in batch send: {str(e)}") from e
+
+    async def send_batch_async(
+        self,
+        messages: list[dict[str, str]],
+    ) -> dict[str, Any]:
+        """Send multiple messages concurrently from async code.
+
+        Chunks of 10 are sent with SendMessageBatch on worker threads, with
+        at most SQS_MAX_CONCURRENT_BATCHES calls in flight, so the round-trips
+        overlap instead of running back to back. Chunks sharing a hotel code
+        (FIFO MessageGroupId) are awaited one after another, in order.
+
+        Args:
+            messages: List of message dicts with keys: hotel_code, file_type, file_key
+
+        Returns:
+            Dictionary with 'successful' and 'failed' message counts
+
+        Raises:
+            SQSError: If batch send fails
+        """
+        logger.info(
+            "Sending batch messages to SQS queue (async)",
+            message_count=len(messages),
+            queue_name=self.queue_name,
+        )
+
+        semaphore = asyncio.Semaphore(SQS_MAX_CONCURRENT_BATCHES)
+
+        async def send_lane(lane: list[list[dict[str, str]]]) -> tuple[int, int]:
+            successful = failed = 0
+            for chunk in lane:
+                async with semaphore:
+                    sent, not_sent = await asyncio.to_thread(self._send_batch_chunk, chunk)
+                successful += sent
+                failed += not_sent
+            return successful, failed
+
+        try:
+            # Resolve the queue URL once before fanning out
+            await asyncio.to_thread(lambda: self.queue_url)
+
+            results = await asyncio.gather(
+                *(send_lane(lane) for lane in _chunk_lanes(messages))
+            )
+
+            successful = sum(sent for sent, _ in results)
+            failed = sum(not_sent for _, not_sent in results)
 
             logger.info(
                 "Batch send complete",
@@ -303,9 +558,14 @@ class SQSManager:
     ) -> list[dict[str, Any]]:
         """Receive messages from the SQS FIFO queue.
 
+        Long polling is always used: ``wait_time`` is clamped to
+        ``[AWS_SQS_MIN_WAIT_SECONDS, 20]``. Short polling (0) returns empty
+        responses from a sample of servers and is billed per request, so
+        it is never what a consumer loop wants.
+
         Args:
             max_messages: Maximum number of messages to receive (1-10)
-            wait_time: Long polling wait time in seconds (0-20)
+            wait_time: Long polling wait time in seconds (clamped, max 20)
 
         Returns:
             List of message dictionaries
@@ -313,17 +573,25 @@ class SQSManager:
         Raises:
             SQSError: If receive fails
         """
-        logger.info(
+        logger.debug(
             "Receiving messages from SQS queue",
             queue_name=self.queue_name,
             max_messages=max_messages,
         )
 
+        min_wait = _long_poll_floor()
+        if wait_time < min_wait:
+            logger.warning(
+                "Short polling requested; clamping to long-poll floor",
+                requested_wait_time=wait_time,
+                wait_time=min_wait,
+            )
+
         try:
             response = self.sqs_client.receive_message(
                 QueueUrl=self.queue_url,
                 MaxNumberOfMessages=min(max_messages, 10),
-                WaitTimeSeconds=min(wait_time, 20),
+                WaitTimeSeconds=max(min_wait, min(wait_time, 20)),
                 MessageAttributeNames=["All"],
             )
 
@@ -334,12 +602,12 @@ class SQSManager:
                         {
                             "message_id": message["MessageId"],
                             "receipt_handle": message["ReceiptHandle"],
-                            "body": json.loads(message["Body"]),
+                            "body": orjson.loads(message["Body"]),
                             "attributes": message.get("MessageAttributes", {}),
                         }
                     )
 
-            logger.info(
+            logger.debug(
                 "Successfully received messages",
                 queue_name=self.queue_name,
                 message_count=len(messages),
@@ -355,31 +623,134 @@ class SQSManager:
             )
             raise SQSError(f"Failed to receive SQS messages: {str(e)}") from e
 
-    def delete_message(self, receipt_handle: str) -> None:
-        """Delete a message from the SQS queue.
+    def receive_batch(
+        self,
+        target: int = 100,
+        window: float = 30,
+    ) -> list[dict[str, Any]]:
+        """Collect up to ``target`` messages within a batching window.
+
+        Repeatedly long-polls ReceiveMessage (10 messages per call) until
+        ``target`` messages have been collected or ``window`` seconds have
+        elapsed, so consumers get large batches without a hand-written loop.
+        Stops early once less than the long-poll floor is left in the window.
 
         Args:
-            receipt_handle: Receipt handle from the message
+            target: Number of messages to collect before returning
+            window: Maximum seconds to spend collecting
+
+        Returns:
+            List of message dictionaries (same shape as receive_messages)
 
         Raises:
-            SQSError: If deletion fails
+            SQSError: If a receive fails
         """
+        deadline = time.monotonic() + window
+        min_wait = _long_poll_floor()
+        messages: list[dict[str, Any]] = []
+
+        while len(messages) < target:
+            remaining = deadline - time.monotonic()
+            if remaining < min_wait:
+                break
+            messages.extend(
+                self.receive_messages(
+                    max_messages=min(target - len(messages), 10),
+                    wait_time=min(max(1, math.ceil(remaining)), 20),
+                )
+            )
+
         logger.info(
-            "Deleting message from SQS queue",
+            "Batch receive complete",
             queue_name=self.queue_name,
+            message_count=len(messages),
+            target=target,
         )
 
-        try:
-            self.sqs_client.delete_message(
-                QueueUrl=self.queue_url,
-                ReceiptHandle=receipt_handle,
+        return messages
+
+    def _delete_chunk(self, chunk: list[str]) -> tuple[int, list[dict[str, Any]]]:
+        """Delete up to 10 messages with a single DeleteMessageBatch call.
+
+        Args:
+            chunk: Receipt handles of the messages to delete
+
+        Returns:
+            Tuple of (successful count, Failed entries as returned by SQS)
+
+        Raises:
+            ClientError: If the batch call itself fails
+        """
+        response = self.sqs_client.delete_message_batch(
+            QueueUrl=self.queue_url,
+            Entries=[{"Id": str(i), "ReceiptHandle": handle} for i, handle in enumerate(chunk)],
+        )
+        failures = response.get("Failed", [])
+        for failure in failures:
+            logger.error(
+                "Failed to delete message in batch",
+                queue_name=self.queue_name,
+                entry_id=failure.get("Id"),
+                code=failure.get("Code"),
+                error=failure.get("Message"),
+                sender_fault=failure.get("SenderFault"),
             )
+        return len(response.get("Successful", [])), failures
 
-            logger.info(
-                "Successfully deleted message from SQS queue",
+    def delete_batch(self, receipt_handles: list[str]) -> dict[str, Any]:
+        """Delete multiple messages from the SQS queue.
+
+        Handles are deleted with DeleteMessageBatch in chunks of 10 (the SQS
+        limit), so N acknowledgements cost ceil(N / 10) API calls.
+
+        Args:
+            receipt_handles: Receipt handles of the messages to delete
+
+        Returns:
+            Dictionary with 'successful' and 'failed' deletion counts
+
+        Raises:
+            SQSError: If a batch call fails
+        """
+        successful = 0
+        failed = 0
+
+        try:
+            for start in range(0, len(receipt_handles), SQS_BATCH_SIZE):
+                deleted, failures = self._delete_chunk(
+                    receipt_handles[start : start + SQS_BATCH_SIZE]
+                )
+                successful += deleted
+                failed += len(failures)
+
+        except ClientError as e:
+            logger.error(
+                "Failed to delete messages from SQS",
                 queue_name=self.queue_name,
+                error=str(e),
             )
+            raise SQSError(f"Failed to delete SQS messages: {str(e)}") from e
+
+        logger.info(
+            "Batch delete complete",
+            queue_name=self.queue_name,
+            successful=successful,
+            failed=failed,
+        )
+
+        return {"successful": successful, "failed": failed}
+
+    def delete_message(self, receipt_handle: str) -> None:
+        """Delete a message from the SQS queue.
+
+        Args:
+            receipt_handle: Receipt handle from the message
 
+        Raises:
+            SQSError: If deletion fails
+        """
+        try:
+            _, failures = self._delete_chunk([receipt_handle])
         except ClientError as e:
             logger.error(
                 "Failed to delete message from SQS",
@@ -388,11 +759,17 @@ class SQSManager:
             )
             raise SQSError(f"Failed to delete SQS message: {str(e)}") from e
 
-    def get_queue_attributes(self) -> dict[str, str]:
-        """Get attributes of the SQS queue.
+        if failures:
+            failure = failures[0]
+            raise SQSError(
+                f"Failed to delete SQS message: {failure.get('Code')}: {failure.get('Message')}"
+            )
+
+    def _fetch_attributes(self, names: list[str]) -> dict[str, str]:
+        """Fetch the given queue attributes.
 
         Args:
-            None
+            names: Attribute names to request ("All" for every attribute)
 
         Returns:
             Dictionary of queue attributes
@@ -400,28 +777,68 @@ class SQSManager:
         Raises:
             SQSError: If retrieval fails
         """
-        logger.info(
-            "Getting queue attributes",
-            queue_name=self.queue_name,
-        )
-
         try:
             response = self.sqs_client.get_queue_attributes(
                 QueueUrl=self.queue_url,
-                AttributeNames=["All"],
-            )
-
-            logger.info(
-                "Successfully retrieved queue attributes",
-                queue_name=self.queue_name,
+                AttributeNames=names,
             )
-
-            return response["Attributes"]
+            return response.get("Attributes", {})
 
         except ClientError as e:
             logger.error(
                 "Failed to get queue attributes",
                 queue_name=self.queue_name,
+                attribute_names=names,
                 error=str(e),
             )
             raise SQSError(f"Failed to get queue attributes: {str(e)}") from e
+
+    def get_queue_attributes(self) -> dict[str, str]:
+        """Get all attributes of the SQS queue.
+
+        Prefer get_static_attributes or get_queue_depth, which request only
+        the attributes they need.
+
+        Returns:
+            Dictionary of queue attributes
+
+        Raises:
+            SQSError: If retrieval fails
+        """
+        logger.info(
+            "Getting queue attributes",
+            queue_name=self.queue_name,
+        )
+
+        return self._fetch_attributes(["All"])
+
+    def get_static_attributes(self) -> dict[str, str]:
+        """Get queue attributes that do not change at runtime.
+
+        Fetched once and cached for the lifetime of the manager.
+
+        Returns:
+            Dictionary with QueueArn, VisibilityTimeout and MessageRetentionPeriod
+
+        Raises:
+            SQSError: If retrieval fails
+        """
+        if self._static_attributes is None:
+            self._static_attributes = self._fetch_attributes(
+                list(STATIC_QUEUE_ATTRIBUTES)
+            )
+        return self._static_attributes
+
+    def get_queue_depth(self) -> int:
+        """Get the approximate number of visible messages in the queue.
+
+        Not cached: the value changes constantly.
+
+        Returns:
+            ApproximateNumberOfMessages
+
+        Raises:
+            SQSError: If retrieval fails
+        """
+        attributes = self._fetch_attributes(["ApproximateNumberOfMessages"])
+        return int(attributes.get("ApproximateNumberOfMessages", 0))
@@ -6,6 +6,7 @@ from src.clients.esb_client import (
     ESBClientError,
     ESBNotFoundError,
     ESBServerError,
+    get_esb_client,
 )
 from src.clients.host_api_client import (
     HostAPIAuthenticationError,
@@ -13,6 +14,7 @@ from src.clients.host_api_client import (
     HostAPINotFoundError,
     HostAPIServerError,
     HostPMSAPIClient,
+    get_host_api_client,
 )
 
 __all__ = [
@@ -26,4 +28,6 @@ __all__ = [
     "HostAPIAuthenticationError",
     "HostAPINotFoundError",
     "HostAPIServerError",
+    "get_esb_client",
+    "get_host_api_client",
 ]
@@ -1,16 +1,49 @@
 """Climber ESB API client for hotel configuration and file registration."""
 
 import asyncio
+import random
+import time
+from functools import lru_cache
 from typing import Any, Optional
 
 import httpx
+import orjson
 from structlog import get_logger
 
 from src.clients.redis_token_manager import RedisTokenManager
 from src.config import settings
+from src.utils.http import truncate_body
 
 logger = get_logger(__name__)
 
+# ESB registration endpoint per processed file type (see register_file)
+REGISTER_FILE_ENDPOINTS = {
+    "segments": "/pms-integration/1.0/pmsSegment",
+    "reservations": "/pms-integration/1.0/pmsReservation",
+    "hotel-configs": "/pms-integration/1.0/pmsHotelConfig",
+}
+
+
+@lru_cache(maxsize=1)
+def _esb_base_urls() -> tuple[str, str]:
+    """OAuth and API base URLs derived from settings once per process.
+
+    Returns:
+        Tuple of (base_url, api_base_url)
+    """
+    # OAuth token endpoint uses :9443
+    base_url = settings.esb.base_url.rstrip("/")
+    # API endpoints use /pms-integration/1.0 (no port)
+    # Extract hostname from base URL (e.g., "https://qa-esb.climberrms.com:9443" -> "qa-esb.climberrms.com")
+    if "://" in base_url:
+        # Extract hostname after protocol
+        hostname = base_url.split("://")[1].split(":")[0]
+    else:
+        # No protocol, split by port
+        hostname = base_url.split(":")[0]
+
+    return base_url, f"https://{hostname}/pms-integration/1.0"
+
 
 class ESBClientError(Exception):
     """Base exception for ESB client errors."""
@@ -41,23 +74,32 @@ class ClimberESBClient:
 
     def __init__(self):
         """Initialize the ESB client with settings."""
-        # OAuth token endpoint uses :9443
-        self.base_url = settings.esb.base_url.rstrip("/")
-        # API endpoints use /pms-integration/1.0 (no port)
-        # Extract hostname from base URL (e.g., "https://qa-esb.climberrms.com:9443" -> "qa-esb.climberrms.com")
-        if "://" in self.base_url:
-            # Extract hostname after protocol
-            hostname = self.base_url.split("://")[1].split(":")[0]
-        else:
-            # No protocol, split by port
-            hostname = self.base_url.split(":")[0]
-
-        self.api_base_url = f"https://{hostname}/pms-integration/1.0"
+        self.base_url, self.api_base_url = _esb_base_urls()
 
         self.timeout = settings.esb.request_timeout
         self.max_retries = settings.esb.max_retries
         self.retry_backoff_base = 2  # Exponential backoff base
+        self.retry_backoff_cap = 30  # Max seconds between retries
+        # Caches the token in-process (until its real expiry) and in Redis,
+        # with one shared OAuth fetch for concurrent misses
         self.token_manager = RedisTokenManager()
+        # Serializes 401-driven refreshes (see refresh_token)
+        self._refresh_lock = asyncio.Lock()
+
+        # Static request headers; only Authorization is added per request
+        self._base_headers = {
+            "Accept": "application/json",
+            "User-Agent": "HostPMSConnector/1.0",
+        }
+
+        # Long-lived client: keeps TCP/TLS connections (and HTTP/2 streams)
+        # alive across requests instead of reconnecting for every call
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            headers={"User-Agent": "HostPMSConnector/1.0"},
+        )
 
         logger.debug(
             "ESB client initialized",
@@ -65,18 +107,65 @@ class ClimberESBClient:
             api_base_url=self.api_base_url,
         )
 
+    async def aclose(self) -> None:
+        """Close the underlying HTTP clients and the token manager."""
+        await self._client.aclose()
+        await self.token_manager.close()
+
+    async def __aenter__(self) -> "ClimberESBClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff so concurrent retries don't synchronize.
+
+        Args:
+            attempt: Zero-based attempt number
+
+        Returns:
+            Seconds to wait before the next attempt
+        """
+        return random.uniform(
+            0, min(self.retry_backoff_cap, self.retry_backoff_base ** attempt)
+        )
+
+    async def _get_token(self) -> str:
+        """Get OAuth token from the token manager's local/Redis cache or OAuth.
+
+        Returns:
+            Valid OAuth access token
+        """
+        return await self.token_manager.get_auth_token()
+
+    async def refresh_token(self, stale_token: Optional[str] = None) -> str:
+        """Drop cached tokens (local and Redis) and fetch a fresh one.
+
+        Args:
+            stale_token: Token that was rejected. If another coroutine has
+                already replaced it, that newer token is returned instead of
+                refreshing again.
+
+        Returns:
+            New OAuth access token
+        """
+        async with self._refresh_lock:
+            if stale_token:
+                current = await self.token_manager.get_auth_token()
+                if current != stale_token:
+                    return current
+            await self.token_manager.clear_cache()
+            return await self.token_manager.get_auth_token()
+
     async def _get_headers(self) -> dict[str, str]:
-        """Get default headers for ESB API requests with OAuth token from Redis.
+        """Get default headers for ESB API requests with OAuth token.
 
         Returns:
             Dictionary of HTTP headers including authentication.
         """
-        token = await self.token_manager.get_auth_token()
-        return {
-            "Accept": "application/json",
-            "Authorization": f"Bearer {token}",
-            "User-Agent": "HostPMSConnector/1.0",
-        }
+        token = await self._get_token()
+        return {**self._base_headers, "Authorization": f"Bearer {token}"}
 
     async def _make_request(
         self,
@@ -117,9 +206,14 @@ class ClimberESBClient:
         # Track if we've already attempted token refresh for this request
         token_refreshed = False
 
+        # Serialize the body once (orjson, straight to bytes) for all attempts
+        body = orjson.dumps(data) if data is not None else None
+
         for attempt in range(self.max_retries):
             # Get fresh headers (important: do this inside the loop in case token was refreshed)
             headers = await self._get_headers()
+            if body is not None:
+                headers["Content-Type"] = "application/json"
 
             # Debug: Print request details
             print(f"\n{'=' * 80}")
@@ -137,196 +231,201 @@ class ClimberESBClient:
                 print("Token was refreshed - retrying with fresh token")
             print(f"{'=' * 80}\n")
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.request(
+                response = await self._client.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    content=body,
+                    params=params,
+                )
+
+                status = response.status_code
+
+                # Handle success first: it is by far the most common outcome
+                if 200 <= status < 300:
+                    logger.debug(
+                        "ESB request successful",
+                        endpoint=endpoint,
                         method=method,
-                        url=url,
-                        headers=headers,
-                        json=data,
-                        params=params,
+                        status_code=status,
                     )
-
-                    # Handle authentication errors with automatic token refresh
-                    if response.status_code == 401:
-                        # If we haven't tried refreshing the token yet, do it now
-                        if not token_refreshed:
-                            print(f"\n{'=' * 80}")
-                            print("ESB REQUEST FAILED - AUTHENTICATION ERROR (401)")
-                            print("Attempting automatic token refresh...")
-                            print(f"{'=' * 80}")
-                            print(f"Method: {method}")
-                            print(f"URL: {url}")
-                            if params:
-                                print(f"Query Params: {params}")
-                            print(f"Status Code: {response.status_code}")
-                            print(f"Response: {response.text}")
-                            print(f"Action: Clearing cached token and retrying with fresh token")
-                            print(f"{'=' * 80}\n")
-
-                            logger.warning(
-                                "ESB authentication failed - clearing cached token and retrying",
-                                endpoint=endpoint,
-                                status_code=response.status_code,
-                                url=url,
-                            )
-
-                            # Clear the cached token from Redis
-                            await self.token_manager.clear_cache()
-
-                            # Set flag to prevent infinite retry loop
-                            token_refreshed = True
-
-                            # Continue to next iteration (retry with fresh token)
-                            continue
-                        else:
-                            # Token was already refreshed but still getting 401 - give up
-                            print(f"\n{'=' * 80}")
-                            print("ESB REQUEST FAILED - AUTHENTICATION ERROR (401) AFTER TOKEN REFRESH")
-                            print(f"{'=' * 80}")
-                            print(f"Method: {method}")
-                            print(f"URL: {url}")
-                            if params:
-                                print(f"Query Params: {params}")
-                            print(f"Status Code: {response.status_code}")
-                            print(f"Response: {response.text}")
-                            print(f"Note: Token was refreshed but authentication still failed")
-                            print(f"{'=' * 80}\n")
-
-                            logger.error(
-                                "ESB authentication failed even after token refresh",
-                                endpoint=endpoint,
-                                status_code=response.status_code,
-                                url=url,
-                            )
-                            raise ESBAuthenticationError(
-                                f"Authentication failed for {endpoint} even after token refresh: {response.text}"
-                            )
-
-                    # Handle not found errors
-                    if response.status_code == 404:
-                        # Print full URL for debugging
+                    # Parse raw bytes: avoids decoding the body to str first
+                    if response.content:
+                        return orjson.loads(response.content)
+                    return {}
+
+                # Handle authentication errors with automatic token refresh
+                if status == 401:
+                    # If we haven't tried refreshing the token yet, do it now
+                    if not token_refreshed:
                         print(f"\n{'=' * 80}")
-                        print("ESB REQUEST FAILED - NOT FOUND (404)")
+                        print("ESB REQUEST FAILED - AUTHENTICATION ERROR (401)")
+                        print("Attempting automatic token refresh...")
                         print(f"{'=' * 80}")
                         print(f"Method: {method}")
                         print(f"URL: {url}")
                         if params:
                             print(f"Query Params: {params}")
                         print(f"Status Code: {response.status_code}")
-                        print(f"Response: {response.text}")
+                        print(f"Response: {truncate_body(response)}")
+                        print(f"Action: Clearing cached token and retrying with fresh token")
                         print(f"{'=' * 80}\n")
 
                         logger.warning(
-                            "ESB resource not found",
+                            "ESB authentication failed - clearing cached token and retrying",
                             endpoint=endpoint,
                             status_code=response.status_code,
                             url=url,
                         )
-                        raise ESBNotFoundError(
-                            f"Resource not found: {endpoint}"
+
+                        # Drop cached tokens and fetch a fresh one (unless a
+                        # concurrent request already replaced the rejected token)
+                        await self.refresh_token(
+                            stale_token=headers["Authorization"].removeprefix("Bearer ")
                         )
 
-                    # Handle server errors with retry
-                    if response.status_code >= 500:
-                        if attempt < self.max_retries - 1:
-                            wait_time = self.retry_backoff_base ** attempt
-                            logger.warning(
-                                "ESB server error, retrying",
-                                endpoint=endpoint,
-                                status_code=response.status_code,
-                                attempt=attempt + 1,
-                                max_retries=self.max_retries,
-                                wait_seconds=wait_time,
-                            )
-                            await asyncio.sleep(wait_time)
-                            continue
-                        else:
-                            # Print full URL for debugging
-                            print(f"\n{'=' * 80}")
-                            print("ESB REQUEST FAILED - SERVER ERROR (5xx)")
-                            print(f"{'=' * 80}")
-                            print(f"Method: {method}")
-                            print(f"URL: {url}")
-                            if params:
-                                print(f"Query Params: {params}")
-                            print(f"Status Code: {response.status_code}")
-                            print(f"Response: {response.text}")
-                            print(f"Attempts: {attempt + 1}/{self.max_retries}")
-                            print(f"{'=' * 80}\n")
-
-                            logger.error(
-                                "ESB server error, max retries exceeded",
-                                endpoint=endpoint,
-                                status_code=response.status_code,
-                                url=url,
-                            )
-                            raise ESBServerError(
-                                f"Server error at {endpoint}: {response.text}"
-                            )
-
-                    # Handle client errors (non-auth, non-404)
-                    if 400 <= response.status_code < 500:
-                        # Print full URL for debugging
+                        # Set flag to prevent infinite retry loop
+                        token_refreshed = True
+
+                        # Continue to next iteration (retry with fresh token)
+                        continue
+                    else:
+                        # Token was already refreshed but still getting 401 - give up
                         print(f"\n{'=' * 80}")
-                        print("ESB REQUEST FAILED - CLIENT ERROR (4xx)")
+                        print("ESB REQUEST FAILED - AUTHENTICATION ERROR (401) AFTER TOKEN REFRESH")
                         print(f"{'=' * 80}")
                         print(f"Method: {method}")
                         print(f"URL: {url}")
                         if params:
                             print(f"Query Params: {params}")
                         print(f"Status Code: {response.status_code}")
-                        print(f"Response: {response.text}")
+                        print(f"Response: {truncate_body(response)}")
+                        print(f"Note: Token was refreshed but authentication still failed")
                         print(f"{'=' * 80}\n")
 
                         logger.error(
-                            "ESB client error",
+                            "ESB authentication failed even after token refresh",
                             endpoint=endpoint,
                             status_code=response.status_code,
-                            response_text=response.text,
                             url=url,
                         )
-                        raise ESBClientError(
-                            f"Client error at {endpoint}: {response.text}"
+                        raise ESBAuthenticationError(
+                            f"Authentication failed for {endpoint} even after token refresh: {truncate_body(response)}"
                         )
 
-                    # Handle success
-                    if response.status_code in (200, 201, 202, 204):
-                        logger.debug(
-                            "ESB request successful",
+                # Handle not found errors
+                if status == 404:
+                    # Print full URL for debugging
+                    print(f"\n{'=' * 80}")
+                    print("ESB REQUEST FAILED - NOT FOUND (404)")
+                    print(f"{'=' * 80}")
+                    print(f"Method: {method}")
+                    print(f"URL: {url}")
+                    if params:
+                        print(f"Query Params: {params}")
+                    print(f"Status Code: {response.status_code}")
+                    print(f"Response: {truncate_body(response)}")
+                    print(f"{'=' * 80}\n")
+
+                    logger.warning(
+                        "ESB resource not found",
+                        endpoint=endpoint,
+                        status_code=response.status_code,
+                        url=url,
+                    )
+                    raise ESBNotFoundError(
+                        f"Resource not found: {endpoint}"
+                    )
+
+                # Handle server errors with retry
+                if status >= 500:
+                    if attempt < self.max_retries - 1:
+                        wait_time = self._backoff_delay(attempt)
+                        logger.warning(
+                            "ESB server error, retrying",
                             endpoint=endpoint,
-                            method=method,
                             status_code=response.status_code,
+                            attempt=attempt + 1,
+                            max_retries=self.max_retries,
+                            wait_seconds=wait_time,
                         )
-                        if response.text:
-                            return response.json()
-                        return {}
+                        await asyncio.sleep(wait_time)
+                        continue
+                    else:
+                        # Print full URL for debugging
+                        print(f"\n{'=' * 80}")
+                        print("ESB REQUEST FAILED - SERVER ERROR (5xx)")
+                        print(f"{'=' * 80}")
+                        print(f"Method: {method}")
+                        print(f"URL: {url}")
+                        if params:
+                            print(f"Query Params: {params}")
+                        print(f"Status Code: {response.status_code}")
+                        print(f"Response: {truncate_body(response)}")
+                        print(f"Attempts: {attempt + 1}/{self.max_retries}")
+                        print(f"{'=' * 80}\n")
 
-                    # Unexpected status code
+                        logger.error(
+                            "ESB server error, max retries exceeded",
+                            endpoint=endpoint,
+                            status_code=response.status_code,
+                            url=url,
+                        )
+                        raise ESBServerError(
+                            f"Server error at {endpoint}: {truncate_body(response)}"
+                        )
+
+                # Handle client errors (non-auth, non-404)
+                if 400 <= status < 500:
                     # Print full URL for debugging
                     print(f"\n{'=' * 80}")
-                    print("ESB REQUEST FAILED - UNEXPECTED STATUS CODE")
+                    print("ESB REQUEST FAILED - CLIENT ERROR (4xx)")
                     print(f"{'=' * 80}")
                     print(f"Method: {method}")
                     print(f"URL: {url}")
                     if params:
                         print(f"Query Params: {params}")
                     print(f"Status Code: {response.status_code}")
-                    print(f"Response: {response.text}")
+                    print(f"Response: {truncate_body(response)}")
                     print(f"{'=' * 80}\n")
 
                     logger.error(
-                        "Unexpected ESB response status",
+                        "ESB client error",
                         endpoint=endpoint,
                         status_code=response.status_code,
+                        response_text=truncate_body(response),
                         url=url,
                     )
                     raise ESBClientError(
-                        f"Unexpected response from {endpoint}: {response.status_code}"
+                        f"Client error at {endpoint}: {truncate_body(response)}"
                     )
 
+                # Unexpected status code
+                # Print full URL for debugging
+                print(f"\n{'=' * 80}")
+                print("ESB REQUEST FAILED - UNEXPECTED STATUS CODE")
+                print(f"{'=' * 80}")
+                print(f"Method: {method}")
+                print(f"URL: {url}")
+                if params:
+                    print(f"Query Params: {params}")
+                print(f"Status Code: {response.status_code}")
+                print(f"Response: {truncate_body(response)}")
+                print(f"{'=' * 80}\n")
+
+                logger.error(
+                    "Unexpected ESB response status",
+                    endpoint=endpoint,
+                    status_code=response.status_code,
+                    url=url,
+                )
+                raise ESBClientError(
+                    f"Unexpected response from {endpoint}: {response.status_code}"
+                )
+
             except httpx.TimeoutException as e:
                 if attempt < self.max_retries - 1:
-                    wait_time = self.retry_backoff_base ** attempt
+                    wait_time = self._backoff_delay(attempt)
                     logger.warning(
                         "ESB request timeout, retrying",
                         endpoint=endpoint,
@@ -358,7 +457,7 @@ class ClimberESBClient:
 
             except httpx.RequestError as e:
                 if attempt < self.max_retries - 1:
-                    wait_time = self.retry_backoff_base ** attempt
+                    wait_time = self._backoff_delay(attempt)
                     logger.warning(
                         "ESB request error, retrying",
                         endpoint=endpoint,
@@ -577,30 +676,21 @@ class ClimberESBClient:
         Raises:
             ESBClientError: If the registration fails
         """
-        from datetime import datetime, timezone
-
-        # Map file types to ESB endpoints
-        endpoint_map = {
-            "segments": "/pms-integration/1.0/pmsSegment",
-            "reservations": "/pms-integration/1.0/pmsReservation",
-            "hotel-configs": "/pms-integration/1.0/pmsHotelConfig",
-        }
-
-        endpoint = endpoint_map.get(file_type)
+        endpoint = REGISTER_FILE_ENDPOINTS.get(file_type)
         if not endpoint:
             logger.error(
                 "Unknown file type for ESB registration",
                 hotel_code=hotel_code,
                 file_type=file_type,
-                valid_types=list(endpoint_map.keys()),
+                valid_types=list(REGISTER_FILE_ENDPOINTS),
             )
             raise ESBClientError(
-                f"Unknown file type '{file_type}'. Valid types: {', '.join(endpoint_map.keys())}"
+                f"Unknown file type '{file_type}'. Valid types: {', '.join(REGISTER_FILE_ENDPOINTS)}"
             )
 
         # Generate timestamp for record_date and last_updated
         # Always use current UTC time so each chunk gets a unique timestamp
-        ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        ts = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
         logger.info(
             "Registering file with ESB",
@@ -668,7 +758,7 @@ class ClimberESBClient:
         return response
 
     async def clear_token_cache(self) -> None:
-        """Clear cached OAuth token from Redis.
+        """Clear cached OAuth token (in-process and Redis).
 
         This forces a fresh token to be fetched on the next ESB API request.
         Useful at process start to ensure we're not using stale cached tokens.
@@ -695,3 +785,17 @@ class ClimberESBClient:
             hotel_code=hotel_code,
         )
         return response
+
+
+@lru_cache(maxsize=1)
+def get_esb_client() -> ClimberESBClient:
+    """Return the process-wide ClimberESBClient.
+
+    The client's async pool is bound to the event loop that first uses it;
+    whoever closes it should call ``get_esb_client.cache_clear()`` so the
+    next run builds a fresh instance.
+
+    Returns:
+        Cached ClimberESBClient instance
+    """
+    return ClimberESBClient()
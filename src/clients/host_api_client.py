@@ -1,18 +1,46 @@
 """Host PMS API client for data extraction."""
 
 import asyncio
+import random
 import re
 import time
-from typing import Any, Optional, Tuple
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator, Optional, Tuple
 
 import httpx
+import orjson
 from structlog import get_logger
 
 from src.config import settings
+from src.utils.http import truncate_body
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _default_base_url() -> str:
+    """Host API base URL, resolved from settings once per process.
+
+    Prefers top-level HOST_API_BASE_URL; falls back to nested host_pms.base_url.
+    """
+    base = (settings.host_api_base_url or settings.host_pms.base_url or "").strip()
+    return (base or "https://hostapi.azure-api.net/rms-v2").rstrip("/")
+
+
+@lru_cache(maxsize=1)
+def _default_subscription_key() -> str:
+    """Default subscription key from settings, resolved once per process."""
+    return (
+        (settings.host_api_subscription_key or settings.host_pms.subscription_key or "").strip()
+        or "test-subscription-key-default"
+    )
+
+
+# Hotel configs kept per client for ETag revalidation (see get_hotel_config)
+_MAX_CACHED_CONFIGS = 32
+
+
 class HostAPIClientError(Exception):
     """Base exception for Host API client errors."""
 
@@ -69,24 +97,94 @@ class HostPMSAPIClient:
             subscription_key: Optional hotel-specific subscription key.
                             If not provided, uses default from settings.
         """
-        # Prefer top-level (from .env HOST_API_*); fallback to nested host_pms.*
-        base = (settings.host_api_base_url or settings.host_pms.base_url or "").strip()
-        self.base_url = (base or "https://hostapi.azure-api.net/rms-v2").rstrip("/")
+        self.base_url = _default_base_url()
 
         # Use provided subscription_key, otherwise fallback to settings
-        if subscription_key:
-            self.subscription_key = subscription_key
-        else:
-            self.subscription_key = (
-                (settings.host_api_subscription_key or settings.host_pms.subscription_key or "").strip()
-                or "test-subscription-key-default"
-            )
+        self.subscription_key = subscription_key or _default_subscription_key()
 
         self.timeout = settings.host_pms.request_timeout
         self.max_retries = settings.host_pms.max_retries
         self.retry_backoff_base = 2  # Exponential backoff base
+        self.retry_backoff_cap = 30  # Max seconds between retries
         self.rate_limit_max_retries = 10  # Max retries specifically for 429 responses
 
+        # Request headers never change for a client instance, so they are
+        # built once and set as the HTTP clients' default headers
+        self._base_headers = {
+            "Content-Type": "application/json",
+            "Ocp-Apim-Subscription-Key": self.subscription_key,
+            "User-Agent": "HostPMSConnector/1.0",
+        }
+
+        # Long-lived clients keep TCP/TLS connections alive across requests
+        # (pagination, inventory windows) instead of reconnecting every call.
+        # The async client is created on first use, inside the event loop.
+        self._client = httpx.Client(timeout=self.timeout, headers=self._base_headers)
+        self._async_client: Optional[httpx.AsyncClient] = None
+        # Hotel runs currently sharing the async client (cached instances are
+        # shared by every hotel with the same subscription key)
+        self._async_users = 0
+
+        # hotel_code -> (ETag, raw body) for conditional get_hotel_config,
+        # oldest first and bounded by _MAX_CACHED_CONFIGS
+        self._config_cache: dict[str, tuple[str, bytes]] = {}
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Return the shared async HTTP client, creating it on first use."""
+        if self._async_client is None:
+            # HTTP/2 multiplexes concurrent page/inventory requests over one
+            # connection; the limit matches get_reservations_async's default
+            # concurrency so HTTP/1.1 fallback does not queue on the pool
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers=self._base_headers,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=8, max_keepalive_connections=8, keepalive_expiry=60
+                ),
+            )
+        return self._async_client
+
+    def close(self) -> None:
+        """Close the sync HTTP client and its connection pool."""
+        self._client.close()
+
+    async def aclose(self) -> None:
+        """Close both HTTP clients and their connection pools."""
+        self._client.close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def acquire_async_client(self) -> None:
+        """Register a hotel run using the async pool.
+
+        Pair every call with release_async_client() when the run finishes.
+        """
+        self._async_users += 1
+
+    async def release_async_client(self) -> None:
+        """Release one user of the async pool, closing it after the last one.
+
+        The async client is bound to the running event loop, so shared
+        (cached) instances drop it once no hotel run is using it, while the
+        sync connection pool stays warm for the next caller. Runs still in
+        flight on the same client keep it open.
+        """
+        self._async_users = max(0, self._async_users - 1)
+        if self._async_users == 0 and self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    @asynccontextmanager
+    async def _using_async_client(self) -> AsyncIterator[None]:
+        """Hold the async pool for the duration of an async API call."""
+        self.acquire_async_client()
+        try:
+            yield
+        finally:
+            await self.release_async_client()
+
     @staticmethod
     def _parse_rate_limit_info(
         response: httpx.Response,
@@ -122,30 +220,45 @@ class HostPMSAPIClient:
         except Exception as e:
             logger.debug("Failed to parse rate limit from response body", error=str(e))
 
-        # Parse Retry-After header
+        retry_after = HostPMSAPIClient._parse_retry_after(response)
+
+        return rate_limit, time_window, retry_after
+
+    @staticmethod
+    def _parse_retry_after(response: httpx.Response) -> Optional[float]:
+        """Parse the Retry-After header as seconds.
+
+        Returns:
+            Seconds to wait, or None if absent or not in seconds format
+        """
         retry_after_header = response.headers.get("Retry-After")
         if retry_after_header:
             try:
                 parsed_value = float(retry_after_header)
                 # Ignore values > 10000 (likely timestamps, not seconds)
                 if parsed_value <= 10000:
-                    retry_after = parsed_value
+                    return parsed_value
             except ValueError:
                 logger.debug("Retry-After header is HTTP date format, using default delay")
+        return None
 
-        return rate_limit, time_window, retry_after
+    def _backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Jittered exponential backoff, honouring Retry-After when given.
 
-    def _get_headers(self) -> dict[str, str]:
-        """Get default headers for Host PMS API requests.
+        Jitter keeps hotels that failed together from retrying in lockstep.
+
+        Args:
+            attempt: Zero-based attempt number
+            retry_after: Server-provided Retry-After in seconds, if any
 
         Returns:
-            Dictionary of HTTP headers including subscription key.
+            Seconds to wait before the next attempt, never above
+            retry_backoff_cap (Retry-After included).
         """
-        return {
-            "Content-Type": "application/json",
-            "Ocp-Apim-Subscription-Key": self.subscription_key,
-            "User-Agent": "HostPMSConnector/1.0",
-        }
+        if retry_after is not None:
+            return min(self.retry_backoff_cap, retry_after)
+        wait_time = min(self.retry_backoff_cap, self.retry_backoff_base ** attempt)
+        return min(self.retry_backoff_cap, wait_time + random.uniform(0, wait_time * 0.5))
 
     def _make_request(
         self,
@@ -154,7 +267,9 @@ class HostPMSAPIClient:
         data: Optional[dict[str, Any]] = None,
         params: Optional[dict[str, Any]] = None,
         hotel_code: Optional[str] = None,
-    ) -> dict[str, Any]:
+        headers: Optional[dict[str, str]] = None,
+        raw: bool = False,
+    ) -> Any:
         """Make an HTTP request to the Host PMS API with retry logic.
 
         Args:
@@ -162,9 +277,13 @@ class HostPMSAPIClient:
             endpoint: API endpoint path (without base URL)
             data: Request body data (for POST requests)
             params: Query parameters
+            hotel_code: Hotel code for logging context
+            headers: Extra request headers (e.g. conditional request headers)
+            raw: If True, return the httpx.Response for 2xx and 304 responses
+                instead of the parsed JSON body
 
         Returns:
-            JSON response as a dictionary
+            JSON response as a dictionary, or the response itself if raw
 
         Raises:
             HostAPIAuthenticationError: If authentication fails
@@ -173,121 +292,154 @@ class HostPMSAPIClient:
             HostAPIClientError: For other API errors
         """
         url = f"{self.base_url}{endpoint}"
-        headers = self._get_headers()
 
         for attempt in range(self.max_retries):
             try:
-                with httpx.Client(timeout=self.timeout) as client:
-                    response = client.request(
-                        method=method,
-                        url=url,
-                        headers=headers,
-                        json=data,
-                        params=params,
+                response = self._client.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    json=data,
+                    params=params,
+                )
+
+                # Handle authentication errors
+                if response.status_code == 401:
+                    logger.error(
+                        "Host API authentication failed",
+                        hotel_code=hotel_code,
+                        endpoint=endpoint,
+                        status_code=response.status_code,
+                    )
+                    raise HostAPIAuthenticationError(
+                        f"Authentication failed for {endpoint}: Invalid subscription key"
                     )
 
-                    # Handle authentication errors
-                    if response.status_code == 401:
-                        logger.error(
-                            "Host API authentication failed",
-                            hotel_code=hotel_code,
-                            endpoint=endpoint,
-                            status_code=response.status_code,
-                        )
-                        raise HostAPIAuthenticationError(
-                            f"Authentication failed for {endpoint}: Invalid subscription key"
-                        )
+                # Handle forbidden errors
+                if response.status_code == 403:
+                    logger.error(
+                        "Host API forbidden",
+                        hotel_code=hotel_code,
+                        endpoint=endpoint,
+                        status_code=response.status_code,
+                    )
+                    raise HostAPIAuthenticationError(
+                        f"Access forbidden for {endpoint}: Check subscription key permissions"
+                    )
 
-                    # Handle forbidden errors
-                    if response.status_code == 403:
-                        logger.error(
-                            "Host API forbidden",
+                # Handle not found errors
+                if response.status_code == 404:
+                    logger.warning(
+                        "Host API resource not found",
+                        hotel_code=hotel_code,
+                        endpoint=endpoint,
+                        status_code=response.status_code,
+                    )
+                    raise HostAPINotFoundError(
+                        f"Resource not found: {endpoint}"
+                    )
+
+                # Handle rate limit errors (429), honouring Retry-After; like the
+                # async path, give up rather than wait more than 5 minutes
+                if response.status_code == 429:
+                    rate_limit, time_window, retry_after = self._parse_rate_limit_info(response)
+                    if attempt < self.max_retries - 1 and (retry_after or 0) <= 300:
+                        wait_time = (
+                            retry_after if retry_after is not None else self._backoff_delay(attempt)
+                        )
+                        logger.warning(
+                            "Host API rate limit exceeded, retrying",
                             hotel_code=hotel_code,
                             endpoint=endpoint,
-                            status_code=response.status_code,
-                        )
-                        raise HostAPIAuthenticationError(
-                            f"Access forbidden for {endpoint}: Check subscription key permissions"
+                            rate_limit=rate_limit,
+                            time_window=time_window,
+                            retry_after=retry_after,
+                            attempt=attempt + 1,
+                            max_retries=self.max_retries,
+                            wait_seconds=wait_time,
                         )
+                        time.sleep(wait_time)
+                        continue
+                    raise HostAPIRateLimitError(
+                        f"Rate limit exceeded at {endpoint}: {truncate_body(response)}",
+                        rate_limit=rate_limit,
+                        time_window=time_window,
+                        retry_after=retry_after,
+                    )
 
-                    # Handle not found errors
-                    if response.status_code == 404:
+                # Handle server errors with retry
+                if response.status_code >= 500:
+                    if attempt < self.max_retries - 1:
+                        wait_time = self._backoff_delay(
+                            attempt, self._parse_retry_after(response)
+                        )
                         logger.warning(
-                            "Host API resource not found",
+                            "Host API server error, retrying",
                             hotel_code=hotel_code,
                             endpoint=endpoint,
                             status_code=response.status_code,
+                            attempt=attempt + 1,
+                            max_retries=self.max_retries,
+                            wait_seconds=wait_time,
                         )
-                        raise HostAPINotFoundError(
-                            f"Resource not found: {endpoint}"
-                        )
-
-                    # Handle server errors with retry
-                    if response.status_code >= 500:
-                        if attempt < self.max_retries - 1:
-                            wait_time = self.retry_backoff_base ** attempt
-                            logger.warning(
-                                "Host API server error, retrying",
-                                hotel_code=hotel_code,
-                                endpoint=endpoint,
-                                status_code=response.status_code,
-                                attempt=attempt + 1,
-                                max_retries=self.max_retries,
-                                wait_seconds=wait_time,
-                            )
-                            time.sleep(wait_time)
-                            continue
-                        else:
-                            logger.error(
-                                "Host API server error, max retries exceeded",
-                                hotel_code=hotel_code,
-                                endpoint=endpoint,
-                                status_code=response.status_code,
-                            )
-                            raise HostAPIServerError(
-                                f"Server error at {endpoint}: {response.text}"
-                            )
-
-                    # Handle client errors (non-auth, non-404)
-                    if 400 <= response.status_code < 500:
+                        time.sleep(wait_time)
+                        continue
+                    else:
                         logger.error(
-                            "Host API client error",
+                            "Host API server error, max retries exceeded",
                             hotel_code=hotel_code,
                             endpoint=endpoint,
                             status_code=response.status_code,
-                            response_text=response.text[:200],  # Limit error text
                         )
-                        raise HostAPIClientError(
-                            f"Client error at {endpoint}: {response.text}"
+                        raise HostAPIServerError(
+                            f"Server error at {endpoint}: {truncate_body(response)}"
                         )
 
-                    # Handle success
-                    if response.status_code in (200, 201, 204):
-                        logger.debug(
-                            "Host API request successful",
-                            hotel_code=hotel_code,
-                            endpoint=endpoint,
-                            method=method,
-                            status_code=response.status_code,
-                        )
-                        if response.text:
-                            return response.json()
-                        return {}
-
-                    # Unexpected status code
+                # Handle client errors (non-auth, non-404)
+                if 400 <= response.status_code < 500:
                     logger.error(
-                        "Unexpected Host API response status",
+                        "Host API client error",
                         hotel_code=hotel_code,
                         endpoint=endpoint,
                         status_code=response.status_code,
+                        response_text=truncate_body(response, 200),
                     )
                     raise HostAPIClientError(
-                        f"Unexpected response from {endpoint}: {response.status_code}"
+                        f"Client error at {endpoint}: {truncate_body(response)}"
+                    )
+
+                # Handle success
+                if response.status_code in (200, 201, 204) or (
+                    raw and response.status_code == 304
+                ):
+                    logger.debug(
+                        "Host API request successful",
+                        hotel_code=hotel_code,
+                        endpoint=endpoint,
+                        method=method,
+                        status_code=response.status_code,
                     )
+                    if raw:
+                        return response
+                    # Parse raw bytes with orjson: no str decode, much faster on large pages
+                    if response.content:
+                        return orjson.loads(response.content)
+                    return {}
+
+                # Unexpected status code
+                logger.error(
+                    "Unexpected Host API response status",
+                    hotel_code=hotel_code,
+                    endpoint=endpoint,
+                    status_code=response.status_code,
+                )
+                raise HostAPIClientError(
+                    f"Unexpected response from {endpoint}: {response.status_code}"
+                )
 
             except httpx.TimeoutException as e:
                 if attempt < self.max_retries - 1:
-                    wait_time = self.retry_backoff_base ** attempt
+                    wait_time = self._backoff_delay(attempt)
                     logger.warning(
                         "Host API request timeout, retrying",
                         hotel_code=hotel_code,
@@ -310,7 +462,7 @@ class HostPMSAPIClient:
 
             except httpx.RequestError as e:
                 if attempt < self.max_retries - 1:
-                    wait_time = self.retry_backoff_base ** attempt
+                    wait_time = self._backoff_delay(attempt)
                     logger.warning(
                         "Host API request error, retrying",
                         hotel_code=hotel_code,
@@ -362,177 +514,178 @@ class HostPMSAPIClient:
             HostAPIClientError: For other API errors
         """
         url = f"{self.base_url}{endpoint}"
-        headers = self._get_headers()
         rate_limit_attempts = 0
         general_attempts = 0
 
         # Loop up to max_retries + rate_limit_max_retries to handle both error types
         for _ in range(self.max_retries + self.rate_limit_max_retries):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.request(
-                        method=method,
-                        url=url,
-                        headers=headers,
-                        json=data,
-                        params=params,
+                response = await self._get_async_client().request(
+                    method=method,
+                    url=url,
+                    json=data,
+                    params=params,
+                )
+
+                # Handle authentication errors
+                if response.status_code == 401:
+                    logger.error(
+                        "Host API authentication failed",
+                        hotel_code=hotel_code,
+                        endpoint=endpoint,
+                        status_code=response.status_code,
+                    )
+                    raise HostAPIAuthenticationError(
+                        f"Authentication failed for {endpoint}: Invalid subscription key"
                     )
 
-                    # Handle authentication errors
-                    if response.status_code == 401:
-                        logger.error(
-                            "Host API authentication failed",
-                            hotel_code=hotel_code,
-                            endpoint=endpoint,
-                            status_code=response.status_code,
-                        )
-                        raise HostAPIAuthenticationError(
-                            f"Authentication failed for {endpoint}: Invalid subscription key"
-                        )
+                # Handle forbidden errors
+                if response.status_code == 403:
+                    logger.error(
+                        "Host API forbidden",
+                        hotel_code=hotel_code,
+                        endpoint=endpoint,
+                        status_code=response.status_code,
+                    )
+                    raise HostAPIAuthenticationError(
+                        f"Access forbidden for {endpoint}: Check subscription key permissions"
+                    )
 
-                    # Handle forbidden errors
-                    if response.status_code == 403:
-                        logger.error(
-                            "Host API forbidden",
-                            hotel_code=hotel_code,
-                            endpoint=endpoint,
-                            status_code=response.status_code,
-                        )
-                        raise HostAPIAuthenticationError(
-                            f"Access forbidden for {endpoint}: Check subscription key permissions"
-                        )
+                # Handle not found errors
+                if response.status_code == 404:
+                    logger.warning(
+                        "Host API resource not found",
+                        hotel_code=hotel_code,
+                        endpoint=endpoint,
+                        status_code=response.status_code,
+                    )
+                    raise HostAPINotFoundError(
+                        f"Resource not found: {endpoint}"
+                    )
 
-                    # Handle not found errors
-                    if response.status_code == 404:
-                        logger.warning(
-                            "Host API resource not found",
-                            hotel_code=hotel_code,
+                # Handle rate limit errors (429) with Retry-After
+                if response.status_code == 429:
+                    rate_limit_attempts += 1
+                    rate_limit, time_window, retry_after = self._parse_rate_limit_info(response)
+
+                    # Use Retry-After header if present, otherwise exponential backoff
+                    if retry_after:
+                        wait_time = retry_after
+                    else:
+                        wait_time = min(60.0, 1.0 * (2 ** (rate_limit_attempts - 1)))
+
+                    wait_time = max(1.0, wait_time)
+
+                    # Abort immediately if wait exceeds 5 minutes
+                    if wait_time > 300:
+                        logger.error(
+                            f"[{hotel_code}] Rate limit retry_after too long ({wait_time}s), aborting hotel",
                             endpoint=endpoint,
-                            status_code=response.status_code,
+                            rate_limit=rate_limit,
+                            time_window=time_window,
+                            retry_after=retry_after,
                         )
-                        raise HostAPINotFoundError(
-                            f"Resource not found: {endpoint}"
+                        raise HostAPIRateLimitError(
+                            f"Rate limit exceeded at {endpoint}, retry_after={wait_time}s exceeds 5min limit",
+                            rate_limit=rate_limit,
+                            time_window=time_window,
+                            retry_after=retry_after,
                         )
 
-                    # Handle rate limit errors (429) with Retry-After
-                    if response.status_code == 429:
-                        rate_limit_attempts += 1
-                        rate_limit, time_window, retry_after = self._parse_rate_limit_info(response)
-
-                        # Use Retry-After header if present, otherwise exponential backoff
-                        if retry_after:
-                            wait_time = retry_after
-                        else:
-                            wait_time = min(60.0, 1.0 * (2 ** (rate_limit_attempts - 1)))
-
-                        wait_time = max(1.0, wait_time)
-
-                        # Abort immediately if wait exceeds 5 minutes
-                        if wait_time > 300:
-                            logger.error(
-                                f"[{hotel_code}] Rate limit retry_after too long ({wait_time}s), aborting hotel",
-                                endpoint=endpoint,
-                                rate_limit=rate_limit,
-                                time_window=time_window,
-                                retry_after=retry_after,
-                            )
-                            raise HostAPIRateLimitError(
-                                f"Rate limit exceeded at {endpoint}, retry_after={wait_time}s exceeds 5min limit",
-                                rate_limit=rate_limit,
-                                time_window=time_window,
-                                retry_after=retry_after,
-                            )
+                    logger.warning(
+                        f"[{hotel_code}] Host API rate limit exceeded, retrying",
+                        endpoint=endpoint,
+                        rate_limit=rate_limit,
+                        time_window=time_window,
+                        retry_after=retry_after,
+                        wait_seconds=wait_time,
+                        attempt=rate_limit_attempts,
+                        max_rate_limit_retries=self.rate_limit_max_retries,
+                    )
 
-                        logger.warning(
-                            f"[{hotel_code}] Host API rate limit exceeded, retrying",
-                            endpoint=endpoint,
+                    if rate_limit_attempts >= self.rate_limit_max_retries:
+                        raise HostAPIRateLimitError(
+                            f"Rate limit exceeded at {endpoint}: {truncate_body(response)}",
                             rate_limit=rate_limit,
                             time_window=time_window,
                             retry_after=retry_after,
-                            wait_seconds=wait_time,
-                            attempt=rate_limit_attempts,
-                            max_rate_limit_retries=self.rate_limit_max_retries,
                         )
 
-                        if rate_limit_attempts >= self.rate_limit_max_retries:
-                            raise HostAPIRateLimitError(
-                                f"Rate limit exceeded at {endpoint}: {response.text}",
-                                rate_limit=rate_limit,
-                                time_window=time_window,
-                                retry_after=retry_after,
-                            )
-
-                        await asyncio.sleep(wait_time)
-                        continue
+                    await asyncio.sleep(wait_time)
+                    continue
 
-                    # Handle server errors with retry
-                    if response.status_code >= 500:
-                        general_attempts += 1
-                        if general_attempts < self.max_retries:
-                            wait_time = self.retry_backoff_base ** (general_attempts - 1)
-                            logger.warning(
-                                "Host API server error, retrying",
-                                hotel_code=hotel_code,
-                                endpoint=endpoint,
-                                status_code=response.status_code,
-                                attempt=general_attempts,
-                                max_retries=self.max_retries,
-                                wait_seconds=wait_time,
-                            )
-                            await asyncio.sleep(wait_time)
-                            continue
-                        else:
-                            logger.error(
-                                "Host API server error, max retries exceeded",
-                                hotel_code=hotel_code,
-                                endpoint=endpoint,
-                                status_code=response.status_code,
-                            )
-                            raise HostAPIServerError(
-                                f"Server error at {endpoint}: {response.text}"
-                            )
-
-                    # Handle client errors (non-auth, non-404)
-                    if 400 <= response.status_code < 500:
-                        logger.error(
-                            "Host API client error",
+                # Handle server errors with retry
+                if response.status_code >= 500:
+                    general_attempts += 1
+                    if general_attempts < self.max_retries:
+                        wait_time = self._backoff_delay(
+                            general_attempts - 1, self._parse_retry_after(response)
+                        )
+                        logger.warning(
+                            "Host API server error, retrying",
                             hotel_code=hotel_code,
                             endpoint=endpoint,
                             status_code=response.status_code,
-                            response_text=response.text[:200],  # Limit error text
-                        )
-                        raise HostAPIClientError(
-                            f"Client error at {endpoint}: {response.text}"
+                            attempt=general_attempts,
+                            max_retries=self.max_retries,
+                            wait_seconds=wait_time,
                         )
-
-                    # Handle success
-                    if response.status_code in (200, 201, 204):
-                        logger.debug(
-                            "Host API request successful",
+                        await asyncio.sleep(wait_time)
+                        continue
+                    else:
+                        logger.error(
+                            "Host API server error, max retries exceeded",
                             hotel_code=hotel_code,
                             endpoint=endpoint,
-                            method=method,
                             status_code=response.status_code,
                         )
-                        if response.text:
-                            return response.json()
-                        return {}
+                        raise HostAPIServerError(
+                            f"Server error at {endpoint}: {truncate_body(response)}"
+                        )
 
-                    # Unexpected status code
+                # Handle client errors (non-auth, non-404)
+                if 400 <= response.status_code < 500:
                     logger.error(
-                        "Unexpected Host API response status",
+                        "Host API client error",
                         hotel_code=hotel_code,
                         endpoint=endpoint,
                         status_code=response.status_code,
+                        response_text=truncate_body(response, 200),
                     )
                     raise HostAPIClientError(
-                        f"Unexpected response from {endpoint}: {response.status_code}"
+                        f"Client error at {endpoint}: {truncate_body(response)}"
                     )
 
+                # Handle success
+                if response.status_code in (200, 201, 204):
+                    logger.debug(
+                        "Host API request successful",
+                        hotel_code=hotel_code,
+                        endpoint=endpoint,
+                        method=method,
+                        status_code=response.status_code,
+                        http_version=response.http_version,
+                    )
+                    # Parse raw bytes with orjson: no str decode, much faster on large pages
+                    if response.content:
+                        return orjson.loads(response.content)
+                    return {}
+
+                # Unexpected status code
+                logger.error(
+                    "Unexpected Host API response status",
+                    hotel_code=hotel_code,
+                    endpoint=endpoint,
+                    status_code=response.status_code,
+                )
+                raise HostAPIClientError(
+                    f"Unexpected response from {endpoint}: {response.status_code}"
+                )
+
             except httpx.TimeoutException as e:
                 general_attempts += 1
                 if general_attempts < self.max_retries:
-                    wait_time = self.retry_backoff_base ** (general_attempts - 1)
+                    wait_time = self._backoff_delay(general_attempts - 1)
                     logger.warning(
                         "Host API request timeout, retrying",
                         hotel_code=hotel_code,
@@ -556,7 +709,7 @@ class HostPMSAPIClient:
             except httpx.RequestError as e:
                 general_attempts += 1
                 if general_attempts < self.max_retries:
-                    wait_time = self.retry_backoff_base ** (general_attempts - 1)
+                    wait_time = self._backoff_delay(general_attempts - 1)
                     logger.warning(
                         "Host API request error, retrying",
                         hotel_code=hotel_code,
@@ -589,6 +742,11 @@ class HostPMSAPIClient:
         - Segments (agencies, channels, companies, packages, etc.)
         - Rate plans and pricing configurations
 
+        Configs change rarely, so responses carrying an ETag are cached per
+        hotel and revalidated with If-None-Match; a 304 returns the cached
+        body without transferring it again. The cached bytes are parsed on
+        every call, so each caller gets its own config dict.
+
         Args:
             hotel_code: The hotel code identifier
 
@@ -600,14 +758,75 @@ class HostPMSAPIClient:
         """
         logger.info("Fetching hotel config from Host PMS API", hotel_code=hotel_code)
         params = {"hotelCode": hotel_code}
+
+        # Revalidate a previously fetched config with its ETag
+        cached = self._config_cache.get(hotel_code)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
         response = self._make_request(
-            "GET", "/ExternalRms/Config", params=params, hotel_code=hotel_code
+            "GET",
+            "/ExternalRms/Config",
+            params=params,
+            hotel_code=hotel_code,
+            headers=headers,
+            raw=True,
         )
+
+        if response.status_code == 304 and cached:
+            logger.info(
+                "Hotel config not modified, using cached copy",
+                hotel_code=hotel_code,
+            )
+            return orjson.loads(cached[1]) if cached[1] else {}
+
+        config = orjson.loads(response.content) if response.content else {}
+        etag = response.headers.get("ETag")
+        if etag:
+            self._config_cache.pop(hotel_code, None)
+            self._config_cache[hotel_code] = (etag, response.content)
+            if len(self._config_cache) > _MAX_CACHED_CONFIGS:
+                del self._config_cache[next(iter(self._config_cache))]
+
         logger.info(
             "Successfully fetched hotel config",
             hotel_code=hotel_code,
         )
-        return response
+        return config
+
+    @staticmethod
+    def _log_pagination_summary(
+        hotel_code: str,
+        total_reservations: int,
+        total_rows: int,
+        page_size: int,
+        total_pages: int,
+        failed_page_numbers: list[int],
+        failed_errors: list[str],
+        update_from: Optional[str],
+    ) -> None:
+        """Log one summary record for a paginated reservation fetch.
+
+        Page failures are reported together in a single warning instead of
+        one record per failed page.
+        """
+        if failed_page_numbers:
+            logger.warning(
+                "Failed to fetch reservation pages",
+                hotel_code=hotel_code,
+                pages=failed_page_numbers,
+                errors=failed_errors[:5],
+            )
+
+        logger.info(
+            "Successfully fetched all reservations",
+            hotel_code=hotel_code,
+            total_reservations=total_reservations,
+            total_rows=total_rows,
+            page_size=page_size,
+            pages_fetched=total_pages,
+            failed_pages=len(failed_page_numbers),
+            update_from=update_from,
+        )
 
     def get_reservations(
         self,
@@ -677,16 +896,7 @@ class HostPMSAPIClient:
                 first_page_count=total_rows,
             )
 
-        total_pages = (total_rows // page_size) + (1 if total_rows % page_size else 0) if total_rows else 1
-
-        logger.info(
-            "Pagination started",
-            hotel_code=hotel_code,
-            first_page_count=len(first_page_reservations),
-            total_rows=total_rows,
-            page_size=page_size,
-            total_pages=total_pages,
-        )
+        total_pages = max(1, -(-total_rows // page_size))  # ceil division
 
         # If only one page, return immediately
         if total_pages == 1:
@@ -695,20 +905,18 @@ class HostPMSAPIClient:
                 hotel_code=hotel_code,
                 total_reservations=len(first_page_reservations),
                 total_rows=total_rows,
+                page_size=page_size,
                 pages_fetched=1,
                 update_from=update_from,
             )
             return {"Reservations": first_page_reservations}
 
         # Fetch remaining pages sequentially
-        all_reservations = first_page_reservations.copy()
-        failed_pages = []
-
-        logger.debug(
-            "Starting sequential fetch for remaining pages",
-            hotel_code=hotel_code,
-            total_pages_remaining=total_pages - 1,
-        )
+        # The first page list was freshly parsed from JSON and is not shared,
+        # so later pages are appended to it in place instead of to a copy
+        all_reservations = first_page_reservations
+        failed_page_numbers: list[int] = []
+        failed_errors: list[str] = []
 
         for page_number in range(2, total_pages + 1):
             try:
@@ -733,32 +941,133 @@ class HostPMSAPIClient:
                     "GET", "/ExternalRms/Reservation", params=params, hotel_code=hotel_code
                 )
 
-                reservations = response.get("Reservations", [])
-
-                all_reservations.extend(reservations)
+                all_reservations += response.get("Reservations", [])
 
             except Exception as e:
-                logger.warning(
-                    "Failed to fetch page",
-                    hotel_code=hotel_code,
-                    page_number=page_number,
-                    error=str(e),
-                )
-                failed_pages.append(e)
+                failed_page_numbers.append(page_number)
+                failed_errors.append(str(e))
 
-        logger.info(
-            "Successfully fetched all reservations",
-            hotel_code=hotel_code,
+        self._log_pagination_summary(
+            hotel_code,
             total_reservations=len(all_reservations),
             total_rows=total_rows,
-            pages_fetched=total_pages,
-            failed_pages=len(failed_pages),
+            page_size=page_size,
+            total_pages=total_pages,
+            failed_page_numbers=failed_page_numbers,
+            failed_errors=failed_errors,
             update_from=update_from,
         )
 
         # Return response in same format as single-page response
         return {"Reservations": all_reservations}
 
+    async def get_reservations_async(
+        self,
+        hotel_code: str,
+        update_from: Optional[str] = None,
+        max_concurrent: int = 8,
+    ) -> dict[str, Any]:
+        """Fetch all reservations with pages 2..N requested concurrently.
+
+        Async twin of get_reservations: the first page is fetched to learn
+        TotalRows, then the remaining pages are fetched in parallel (bounded
+        by ``max_concurrent``) and combined in page order.
+
+        Args:
+            hotel_code: The hotel code identifier
+            update_from: ISO format date/time string for incremental sync
+            max_concurrent: Maximum page requests in flight
+
+        Returns:
+            Combined reservations data from all pages
+
+        Raises:
+            HostAPIClientError: If the first page request fails
+        """
+        logger.info(
+            "Fetching all reservations from Host PMS API with concurrent pagination",
+            hotel_code=hotel_code,
+            update_from=update_from,
+        )
+
+        page_size = 100  # API returns ~100 rows per request
+
+        def page_params(page_number: int) -> dict[str, Any]:
+            params: dict[str, Any] = {
+                "start": (page_number - 1) * page_size,
+                "limit": page_size,
+            }
+            if update_from:
+                params["updateFrom"] = update_from
+            return params
+
+        async with self._using_async_client():
+            first_response = await self._make_request_async(
+                "GET", "/ExternalRms/Reservation", params=page_params(1), hotel_code=hotel_code
+            )
+
+            first_page_reservations = first_response.get("Reservations", [])
+            if not first_page_reservations:
+                logger.info(
+                    "No reservations found",
+                    hotel_code=hotel_code,
+                )
+                return {"Reservations": []}
+
+            total_rows = first_page_reservations[0].get("TotalRows")
+            if total_rows is None:
+                total_rows = len(first_page_reservations)
+                logger.warning(
+                    "TotalRows field missing from API response, using first page count",
+                    hotel_code=hotel_code,
+                    first_page_count=total_rows,
+                )
+
+            total_pages = max(1, -(-total_rows // page_size))  # ceil division
+
+            semaphore = asyncio.Semaphore(max_concurrent)
+
+            async def fetch_page(page_number: int) -> list[dict[str, Any]]:
+                async with semaphore:
+                    response = await self._make_request_async(
+                        "GET",
+                        "/ExternalRms/Reservation",
+                        params=page_params(page_number),
+                        hotel_code=hotel_code,
+                    )
+                    return response.get("Reservations", [])
+
+            # gather preserves argument order, so pages are combined in sequence
+            pages = await asyncio.gather(
+                *(fetch_page(page_number) for page_number in range(2, total_pages + 1)),
+                return_exceptions=True,
+            )
+
+            # The first page list was freshly parsed from JSON and is not shared,
+            # so later pages are appended to it in place instead of to a copy
+            all_reservations = first_page_reservations
+            failed_page_numbers: list[int] = []
+            failed_errors: list[str] = []
+            for page_number, page in enumerate(pages, start=2):
+                if isinstance(page, BaseException):
+                    failed_page_numbers.append(page_number)
+                    failed_errors.append(str(page))
+                    continue
+                all_reservations += page
+
+            self._log_pagination_summary(
+                hotel_code,
+                total_reservations=len(all_reservations),
+                total_rows=total_rows,
+                page_size=page_size,
+                total_pages=total_pages,
+                failed_page_numbers=failed_page_numbers,
+                failed_errors=failed_errors,
+                update_from=update_from,
+            )
+
+            return {"Reservations": all_reservations}
+
     def get_inventory(
         self,
         from_date: str,
@@ -1200,3 +1509,101 @@ class HostPMSAPIClient:
             record_count=record_count,
         )
         return response
+
+    async def fetch_all_async(
+        self,
+        hotel_code: str,
+        update_from: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Fetch the independent per-hotel endpoints concurrently.
+
+        Config, reservations and revenue are always fetched; StatSummary is
+        added when both ``start_date`` and ``end_date`` are given. Inventory
+        is not included because it needs the rate codes from the config.
+        Sync endpoints run in worker threads on the pooled sync client.
+
+        One failing endpoint does not cancel the others: its exception is
+        returned in place of its data.
+
+        Args:
+            hotel_code: The hotel code identifier
+            update_from: ISO format date/time string for incremental sync
+            start_date: StatSummary start date ("YYYY-MM-DD")
+            end_date: StatSummary end date ("YYYY-MM-DD")
+
+        Returns:
+            Dict keyed by endpoint ("config", "reservations", "revenue" and
+            optionally "stat_summary") with the response or the exception raised
+        """
+        requests: dict[str, Any] = {
+            "config": asyncio.to_thread(self.get_hotel_config, hotel_code),
+            "reservations": self.get_reservations_async(hotel_code, update_from),
+            "revenue": asyncio.to_thread(self.get_revenue, hotel_code, update_from),
+        }
+        if start_date and end_date:
+            requests["stat_summary"] = asyncio.to_thread(
+                self.get_stat_summary, start_date, end_date, hotel_code
+            )
+
+        async with self._using_async_client():
+            results = await asyncio.gather(*requests.values(), return_exceptions=True)
+
+        failed = [
+            name
+            for name, result in zip(requests, results)
+            if isinstance(result, BaseException)
+        ]
+        if failed:
+            logger.warning(
+                "Some Host API endpoints failed",
+                hotel_code=hotel_code,
+                failed_endpoints=failed,
+            )
+
+        return dict(zip(requests, results))
+
+
+# Upper bound on cached per-key clients (see get_host_api_client)
+_MAX_CACHED_CLIENTS = 64
+
+# subscription key -> client, least recently used first
+_clients: dict[Optional[str], HostPMSAPIClient] = {}
+
+
+def get_host_api_client(subscription_key: Optional[str] = None) -> HostPMSAPIClient:
+    """Return a process-wide HostPMSAPIClient for the given subscription key.
+
+    The subscription key is sent as a default header, so clients are cached
+    per key rather than as a single instance. Callers sharing a client must
+    bracket their use with ``acquire_async_client()`` and
+    ``release_async_client()`` instead of calling ``aclose()``.
+
+    At most _MAX_CACHED_CLIENTS clients are kept; beyond that the least
+    recently used client with no hotel run in flight is closed and dropped.
+
+    Args:
+        subscription_key: Hotel-specific subscription key (defaults to settings)
+
+    Returns:
+        Cached HostPMSAPIClient instance
+    """
+    client = _clients.pop(subscription_key, None)
+    if client is None:
+        client = HostPMSAPIClient(subscription_key=subscription_key)
+    # Re-inserting keeps the dict ordered from least to most recently used
+    _clients[subscription_key] = client
+
+    if len(_clients) > _MAX_CACHED_CLIENTS:
+        idle = next((key for key, c in _clients.items() if not c._async_users), None)
+        if idle is not None:
+            _clients.pop(idle).close()
+    return client
+
+
+def clear_host_api_clients() -> None:
+    """Close and forget every cached client (tests, final shutdown)."""
+    for client in _clients.values():
+        client.close()
+    _clients.clear()
@@ -30,6 +30,11 @@ class MockClimberESBClient:
             self._real_client = ClimberESBClient()
         return self._real_client
 
+    async def aclose(self) -> None:
+        """Close the real passthrough client if one was built."""
+        if self._real_client is not None:
+            await self._real_client.aclose()
+
     async def get_integration(self, integration_type: str) -> list[dict[str, Any]]:
         """Read-only passthrough to the real ESB getIntegration endpoint.
 
@@ -1,15 +1,52 @@
 """Redis-based OAuth token manager for ESB authentication."""
 
+import asyncio
+import base64
+import time
+from functools import lru_cache
 from typing import Any, Optional
+from urllib.parse import urlencode
 
 import httpx
+import orjson
 import redis.asyncio as redis
 from structlog import get_logger
 
 from src.config import settings
+from src.utils.http import truncate_body
 
 logger = get_logger(__name__)
 
+REDIS_MAX_CONNECTIONS = 32
+
+
+@lru_cache(maxsize=1)
+def _get_pool() -> redis.ConnectionPool:
+    """Redis connection pool shared by every RedisTokenManager in the process."""
+    return redis.ConnectionPool(
+        host=settings.redis.host,
+        port=settings.redis.port,
+        db=settings.redis.db,
+        password=settings.redis.password,
+        connection_class=redis.SSLConnection if settings.redis.ssl else redis.Connection,
+        decode_responses=settings.redis.decode_responses,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        socket_timeout=settings.redis.socket_timeout,
+        socket_connect_timeout=settings.redis.socket_connect_timeout,
+    )
+
+
+async def aclose_pool() -> None:
+    """Disconnect the shared Redis pool; the next manager builds a fresh one."""
+    if _get_pool.cache_info().currsize:
+        await _get_pool().aclose()
+        _get_pool.cache_clear()
+
+
+def reset_pool() -> None:
+    """Forget the shared pool without disconnecting it (e.g. its event loop has closed)."""
+    _get_pool.cache_clear()
+
 
 class TokenManagerError(Exception):
     """Raised when token management fails."""
@@ -22,20 +59,44 @@ class RedisTokenManager:
 
     REDIS_KEY = "esb:oauth:token"
     TOKEN_TTL = 3000  # 50 minutes in seconds (less than 1 hour to be safe)
+    LOCAL_SKEW = 30  # Expire the in-process copy this many seconds before Redis does
+    REDIS_FAILURE_THRESHOLD = 3  # Consecutive Redis errors before skipping Redis
+    REDIS_COOLDOWN = 30  # Seconds to skip Redis once the threshold is reached
 
     def __init__(self):
         """Initialize Redis client for token caching."""
-        self.redis_client = redis.Redis(
-            host=settings.redis.host,
-            port=settings.redis.port,
-            db=settings.redis.db,
-            password=settings.redis.password,
-            ssl=settings.redis.ssl,
-            decode_responses=True,
-            socket_timeout=settings.redis.socket_timeout,
-            socket_connect_timeout=settings.redis.socket_connect_timeout,
+        self.redis_client = redis.Redis(connection_pool=_get_pool())
+
+        # In-process copy of the Redis token so most calls skip the round trip
+        self._local_token: Optional[str] = None
+        self._local_exp: float = 0.0
+
+        # Circuit breaker: skip Redis for a while after repeated failures
+        self._redis_fail_count = 0
+        self._redis_fail_until = 0.0
+
+        # Redis TTL derived from the last expires_in (constant for a given grant server)
+        self._last_expires_in = -1
+        self._last_ttl = self.TOKEN_TTL
+
+        # Single-flight refresh: concurrent misses share one OAuth request
+        self._refresh_lock = asyncio.Lock()
+        self._inflight: Optional[asyncio.Task[str]] = None
+
+        # Long-lived OAuth client so token refreshes reuse a warm connection
+        self._http = httpx.AsyncClient(
+            timeout=settings.esb.request_timeout,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
         )
 
+        # The token request URL and form body never change; build them once
+        self._token_url = f"{settings.esb.base_url.rstrip('/')}{settings.esb.oauth_token_url}"
+        self._token_body = urlencode(
+            {"grant_type": settings.esb.oauth_grant_type}
+        ).encode("ascii")
+        self._token_headers: Optional[dict[str, str]] = None
+
     async def get_auth_token(self) -> str:
         """Get OAuth token from Redis cache or fetch new one.
 
@@ -50,19 +111,37 @@ class RedisTokenManager:
         Raises:
             TokenManagerError: If token fetch fails
         """
-        # Step 1: Try to get from Redis
-        try:
-            cached_token = await self._get_cached_token()
-            if cached_token:
-                logger.debug("Using cached OAuth token from Redis")
-                return cached_token
-        except Exception as e:
-            logger.warning(
-                "Failed to get token from Redis, will fetch new token",
-                error=str(e),
-            )
+        if self._local_token and time.monotonic() < self._local_exp:
+            return self._local_token
+
+        # Step 1: Try to get from Redis (token and remaining TTL in one round trip)
+        cached_token, pttl_ms = await self._get_cached_token()
+        if cached_token:
+            logger.debug("Using cached OAuth token from Redis")
+            if pttl_ms > 0:
+                self._remember_token(cached_token, pttl_ms / 1000)
+            return cached_token
+
+        # Step 2: If null, fetch new token via OAuth (one fetch for all waiters)
+        async with self._refresh_lock:
+            if self._local_token and time.monotonic() < self._local_exp:
+                return self._local_token
+            if self._inflight is None or self._inflight.done():
+                self._inflight = asyncio.create_task(self._refresh_token())
+            inflight = self._inflight
+
+        # Shield so a cancelled waiter does not cancel the fetch others share
+        return await asyncio.shield(inflight)
+
+    async def _refresh_token(self) -> str:
+        """Fetch a new token via OAuth and store it in Redis and locally.
+
+        Returns:
+            Fresh OAuth access token
 
-        # Step 2: If null, fetch new token via OAuth
+        Raises:
+            TokenManagerError: If token fetch fails
+        """
         logger.info("Fetching new OAuth token from ESB")
         try:
             token_data = await self._fetch_new_token()
@@ -70,9 +149,10 @@ class RedisTokenManager:
             expires_in = token_data.get("expires_in", 3600)
 
             # Step 3: Store in Redis with TTL (use 50min instead of full 1h for safety buffer)
-            # Clamp TTL to at least 1 second to avoid non-positive values when expires_in is short-lived
-            ttl = max(1, min(expires_in - 600, self.TOKEN_TTL))  # 10 min buffer
-            await self._store_token(token, ttl)
+            ttl = self._ttl_for(expires_in)
+            # Another process may have stored a token first; prefer theirs
+            token = await self._store_token(token, ttl)
+            self._remember_token(token, ttl)
 
             return token
 
@@ -80,32 +160,86 @@ class RedisTokenManager:
             logger.error(
                 "Failed to fetch OAuth token",
                 error=str(e),
-                exc_info=True,
+                exc_info=settings.debug,
             )
-            raise TokenManagerError(f"Failed to obtain OAuth token: {str(e)}") from e
+            # The OAuth error text can echo credentials; only surface it in debug mode
+            detail = repr(e) if settings.debug else type(e).__name__
+            raise TokenManagerError(f"Failed to obtain OAuth token: {detail}") from e
+
+    def _ttl_for(self, expires_in: int) -> int:
+        """Redis TTL for a token lifetime, recomputed only when expires_in changes.
 
-    async def _get_cached_token(self) -> Optional[str]:
-        """Get token from Redis cache.
+        Args:
+            expires_in: Token lifetime reported by the OAuth server, in seconds
 
         Returns:
-            Cached token if available, None otherwise
+            TTL in seconds, 10 minutes short of expiry and capped at TOKEN_TTL
         """
+        if expires_in != self._last_expires_in:
+            # Clamp to at least 1 second so short-lived tokens never yield a non-positive TTL
+            self._last_ttl = max(1, min(expires_in - 600, self.TOKEN_TTL))
+            self._last_expires_in = expires_in
+        return self._last_ttl
+
+    def _remember_token(self, token: str, ttl: float) -> None:
+        """Keep a process-local copy of the token until shortly before it expires.
+
+        Args:
+            token: OAuth access token
+            ttl: Remaining lifetime in seconds
+        """
+        self._local_token = token
+        self._local_exp = time.monotonic() + ttl - self.LOCAL_SKEW
+
+    async def _get_cached_token(self) -> tuple[Optional[str], int]:
+        """Get token and its remaining TTL from Redis in one pipelined round trip.
+
+        Returns:
+            Tuple of (cached token or None, remaining TTL in milliseconds)
+        """
+        if not self._redis_available():
+            return None, -2
         try:
-            token = await self.redis_client.get(self.REDIS_KEY)
-            return token if token else None
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.get(self.REDIS_KEY)
+                pipe.pttl(self.REDIS_KEY)
+                token, pttl_ms = await pipe.execute()
         except Exception as e:
             logger.warning("Redis get operation failed", error=str(e))
-            return None
+            self._record_redis_failure()
+            return None, -2
+        self._redis_fail_count = 0
+        if isinstance(token, bytes):
+            token = token.decode("ascii")
+        return (token or None), pttl_ms
 
-    async def _store_token(self, token: str, ttl: int) -> None:
-        """Store token in Redis with TTL.
+    async def _store_token(self, token: str, ttl: int) -> str:
+        """Store token in Redis with TTL unless another process already stored one.
+
+        Uses SET NX EX so concurrent refreshes across processes converge on the
+        first token written.
 
         Args:
             token: OAuth access token
             ttl: Time to live in seconds
+
+        Returns:
+            The token to use: the one already in Redis if another writer won, else ``token``
         """
+        if not self._redis_available():
+            return token
         try:
-            await self.redis_client.setex(self.REDIS_KEY, ttl, token)
+            stored = await self.redis_client.set(
+                self.REDIS_KEY, token.encode("ascii"), ex=ttl, nx=True
+            )
+            if not stored:
+                existing = await self.redis_client.get(self.REDIS_KEY)
+                self._redis_fail_count = 0
+                if existing:
+                    logger.info("Using OAuth token stored by another process")
+                    return existing.decode("ascii") if isinstance(existing, bytes) else existing
+                return token
+            self._redis_fail_count = 0
             logger.info(
                 "Stored OAuth token in Redis",
                 ttl_seconds=ttl,
@@ -115,24 +249,37 @@ class RedisTokenManager:
                 "Failed to store token in Redis (will still use token)",
                 error=str(e),
             )
+            self._record_redis_failure()
             # Don't raise - token is still valid even if caching fails
+        return token
+
+    def _redis_available(self) -> bool:
+        """Whether Redis should be tried (False while the circuit breaker is open)."""
+        return time.monotonic() >= self._redis_fail_until
+
+    def _record_redis_failure(self) -> None:
+        """Count a Redis error and open the circuit breaker after repeated failures."""
+        self._redis_fail_count += 1
+        if self._redis_fail_count >= self.REDIS_FAILURE_THRESHOLD:
+            self._redis_fail_until = time.monotonic() + self.REDIS_COOLDOWN
+            self._redis_fail_count = 0
+            logger.warning(
+                "Redis unavailable, skipping token cache",
+                cooldown_seconds=self.REDIS_COOLDOWN,
+            )
 
-    async def _fetch_new_token(self) -> dict[str, Any]:
-        """Fetch new OAuth token from ESB using Basic Authentication.
+    def _build_token_headers(self) -> dict[str, str]:
+        """Build the OAuth request headers, including Basic Authentication.
 
         The ESB requires Basic Authentication (client_id:client_secret encoded in base64)
         in the Authorization header, not credentials in the request body.
 
         Returns:
-            OAuth token response with access_token and expires_in
+            Headers for the token request
 
         Raises:
-            httpx.HTTPError: If OAuth request fails
+            TokenManagerError: If credentials are missing or malformed
         """
-        import base64
-
-        token_url = f"{settings.esb.base_url.rstrip('/')}{settings.esb.oauth_token_url}"
-
         # Prepare Basic Auth header (client_id:client_secret encoded in base64)
         # Check both top-level settings.esb_basic_auth and nested settings.esb.basic_auth
         basic_auth_value = (
@@ -162,15 +309,6 @@ class RedisTokenManager:
             auth_header = f"Basic {encoded}"
             logger.debug("Auto-encoded Basic Auth from client_id:client_secret")
 
-        payload = {
-            "grant_type": settings.esb.oauth_grant_type,
-        }
-
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Authorization": auth_header,
-        }
-
         # Validate the Authorization header format
         auth_parts = auth_header.split()
         if len(auth_parts) != 2:
@@ -182,37 +320,54 @@ class RedisTokenManager:
                 f"Invalid Authorization method. Expected 'Basic', got '{auth_parts[0]}'"
             )
 
+        return {
+            "Content-Type": "application/x-www-form-urlencoded",
+            "Authorization": auth_header,
+        }
+
+    async def _fetch_new_token(self) -> dict[str, Any]:
+        """Fetch new OAuth token from ESB using Basic Authentication.
+
+        Returns:
+            OAuth token response with access_token and expires_in
+
+        Raises:
+            httpx.HTTPError: If OAuth request fails
+            TokenManagerError: If credentials are missing or malformed
+        """
+        # Credentials are fixed for the process; build and validate the headers once
+        if self._token_headers is None:
+            self._token_headers = self._build_token_headers()
+
         logger.debug(
             "Requesting OAuth token with Basic Auth",
-            token_url=token_url,
+            token_url=self._token_url,
             grant_type=settings.esb.oauth_grant_type,
-            auth_header_format=f"Basic <{len(auth_parts[1])} chars>",
         )
 
-        async with httpx.AsyncClient(timeout=settings.esb.request_timeout) as client:
-            response = await client.post(
-                token_url,
-                data=payload,
-                headers=headers,
-            )
+        response = await self._http.post(
+            self._token_url,
+            content=self._token_body,
+            headers=self._token_headers,
+        )
 
-            if response.status_code != 200:
-                logger.error(
-                    "OAuth token request failed",
-                    status_code=response.status_code,
-                    response_text=response.text,
-                )
-                response.raise_for_status()
+        if response.status_code != 200:
+            logger.error(
+                "OAuth token request failed",
+                status_code=response.status_code,
+                response_text=truncate_body(response),
+            )
+            response.raise_for_status()
 
-            token_data = response.json()
-            access_token = token_data.get("access_token", "")
+        token_data = orjson.loads(response.content)
+        access_token = token_data.get("access_token", "")
 
-            logger.info(
-                "Successfully fetched OAuth token",
-                expires_in=token_data.get("expires_in"),
-                token_preview=f"{access_token[:20]}..." if len(access_token) > 20 else access_token,
-            )
-            return token_data
+        logger.info(
+            "Successfully fetched OAuth token",
+            expires_in=token_data.get("expires_in"),
+            token_preview=f"{access_token[:20]}..." if len(access_token) > 20 else access_token,
+        )
+        return token_data
 
     async def clear_cache(self) -> None:
         """Clear cached OAuth token from Redis.
@@ -220,6 +375,8 @@ class RedisTokenManager:
         This forces a fresh token to be fetched on the next request.
         Useful at process start to avoid using stale cached tokens.
         """
+        self._local_token = None
+        self._local_exp = 0.0
         try:
             deleted = await self.redis_client.delete(self.REDIS_KEY)
             if deleted:
@@ -234,12 +391,13 @@ class RedisTokenManager:
             # Don't raise - this is a nice-to-have cleanup
 
     async def close(self) -> None:
-        """Close Redis connection.
+        """Close the OAuth HTTP client and release this manager's Redis client.
 
-        Should be called when the token manager is no longer needed.
+        The shared connection pool stays open; use ``aclose_pool()`` at shutdown.
         """
+        await self._http.aclose()
         try:
-            await self.redis_client.close()
-            logger.debug("Closed Redis connection")
+            await self.redis_client.aclose()
+            logger.debug("Closed Redis client")
         except Exception as e:
             logger.warning("Error closing Redis connection", error=str(e))
@@ -1,6 +1,6 @@
 """Configuration package."""
 
 from src.config.logging import configure_logging, get_logger
-from src.config.settings import Settings, settings
+from src.config.settings import Settings, get_settings, settings
 
-__all__ = ["settings", "Settings", "configure_logging", "get_logger"]
+__all__ = ["settings", "Settings", "get_settings", "configure_logging", "get_logger"]
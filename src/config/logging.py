@@ -1,8 +1,13 @@
 """Structured logging configuration using structlog."""
+import atexit
 import logging
+import os
+import queue
 import sys
-from typing import Any
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
 
+import orjson
 import structlog
 from pythonjsonlogger import jsonlogger
 
@@ -29,6 +34,14 @@ def _console_renderer(
     return line
 
 
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serializer for structlog's JSONRenderer backed by orjson."""
+    return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode()
+
+
 def add_hotel_code_prefix(
     logger: Any,
     method_name: str,
@@ -36,8 +49,7 @@ def add_hotel_code_prefix(
 ) -> dict[str, Any]:
     """Add [HOTELCODE] prefix to log message if hotel_code is present.
 
-    This processor runs before formatters to ensure the prefix appears
-    in both JSON and console outputs.
+    Used only in the console chain; JSON output keeps hotel_code as a field.
 
     Args:
         logger: The logger instance
@@ -47,19 +59,47 @@ def add_hotel_code_prefix(
     Returns:
         Modified event dictionary with hotel code prefix
     """
-    hotel_code = event_dict.get("hotel_code")
     worker_id = event_dict.pop("worker_id", None)
-    if hotel_code:
-        current_event = event_dict.get("event", "")
-        if worker_id is not None:
-            event_dict["event"] = f"[{hotel_code}-{worker_id}] {current_event}"
-        else:
-            event_dict["event"] = f"[{hotel_code}] {current_event}"
+    hotel_code = event_dict.get("hotel_code")
+    if not hotel_code:
+        return event_dict
+    tag = hotel_code if worker_id is None else f"{hotel_code}-{worker_id}"
+    event_dict["event"] = f"[{tag}] {event_dict.get('event', '')}"
     return event_dict
 
 
+class _DropOldestQueueHandler(QueueHandler):
+    """QueueHandler that drops the oldest queued record instead of blocking when full."""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                pass
+
+
+# Background listener writing queued records to the real handler (see configure_logging)
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the background listener, if running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def configure_logging() -> None:
     """Configure structlog for the application."""
+    global _listener
 
     # Configure standard library logging
     log_level = getattr(logging, settings.logging.level)
@@ -74,35 +114,53 @@ def configure_logging() -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     root_logger.handlers.clear()
-    root_logger.addHandler(handler)
+    _stop_listener()
+
+    # Outside Lambda, callers only enqueue records and a listener thread does
+    # the stdout writes. Lambda may freeze the process as soon as the handler
+    # returns, so there records are written synchronously.
+    if settings.logging.queue_handler and not os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+        log_queue: queue.Queue = queue.Queue(maxsize=settings.logging.queue_size)
+        root_logger.addHandler(_DropOldestQueueHandler(log_queue))
+        _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        _listener.start()
+    else:
+        root_logger.addHandler(handler)
 
     # Silence noisy third-party loggers
     logging.getLogger("httpcore").setLevel(logging.WARNING)
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("urllib3").setLevel(logging.WARNING)
 
+    # Build the processor chain once. JSON consumers read hotel_code as a field,
+    # so the [HOTELCODE] prefix is only added for the console renderer.
+    processors: list[Any] = [
+        structlog.stdlib.filter_by_level,
+        structlog.stdlib.add_logger_name,
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.PositionalArgumentsFormatter(),
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+        structlog.processors.UnicodeDecoder(),
+    ]
+    if settings.logging.format == "json":
+        processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
+    else:
+        processors.extend([add_hotel_code_prefix, _console_renderer])
+
     # Configure structlog
     structlog.configure(
-        processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            add_hotel_code_prefix,  # Add [HOTELCODE] prefix before rendering
-            structlog.processors.JSONRenderer()
-            if settings.logging.format == "json"
-            else _console_renderer,
-        ],
+        processors=processors,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
-        cache_logger_on_first_use=False,
+        cache_logger_on_first_use=True,
     )
 
 
+atexit.register(_stop_listener)
+
+
 def get_logger(name: str) -> structlog.typing.FilteringBoundLogger:
     """Get a configured logger instance.
 
@@ -1,6 +1,8 @@
 """Application settings and configuration management."""
-from typing import Literal, Optional
+from functools import lru_cache
+from typing import Any, Literal, Optional
 
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -17,12 +19,21 @@ class AWSSettings(BaseSettings):
     """AWS service configuration."""
 
     region: str = "eu-west-2"
+    account_id: str = ""  # Optional; lets the SQS queue URL be built without GetQueueUrl
     s3_raw_prefix: str = "{env}-pms-raw-"
     s3_processed_prefix: str = "{env}-pms-"
     sqs_queue_name: str = "{env}-pms-processor-queue.fifo"
     sqs_queue_url: str = ""  # Optional, will be constructed if empty
     max_retries: int = 3
     request_timeout: int = 30
+    pool_connections: int = 64  # boto3 keep-alive pool size per client (>= s3_max_workers)
+    pretty_json: bool = False  # Indent S3 JSON bodies (debugging only)
+    s3_max_workers: int = 16  # Thread pool size for concurrent S3 uploads
+    sqs_workers: int = 16  # Thread pool size for parallel SQS batch sends
+    sqs_min_wait_seconds: int = 1  # Long-poll floor for ReceiveMessage (1-20)
+    s3_compress: bool = False  # zstd-compress S3 bodies (.json.zst); needs `zstandard`
+    s3_ndjson: bool = False  # Upload list payloads as NDJSON (.jsonl) instead of JSON arrays
+    s3_object_tagging: bool = False  # Tag objects with hotel-code/data-type (s3:PutObjectTagging)
 
     # Climber padrão: explicit bucket/queue when set (no AWS_ prefix for these)
     s3_raw_reservations_bucket: str = ""
@@ -89,7 +100,7 @@ class RedisSettings(BaseSettings):
     db: int = 0
     password: Optional[str] = None
     ssl: bool = False
-    decode_responses: bool = True
+    decode_responses: bool = False  # Token bytes are decoded once in RedisTokenManager
     socket_timeout: int = 5
     socket_connect_timeout: int = 5
 
@@ -101,6 +112,9 @@ class LoggingSettings(BaseSettings):
 
     level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
     format: Literal["json", "console"] = "console"
+    # Hand records to a background thread so callers never block on stdout
+    queue_handler: bool = True
+    queue_size: int = 100_000  # Oldest records are dropped when full
 
     model_config = SettingsConfigDict(env_prefix="LOG_")
 
@@ -157,6 +171,43 @@ class Settings(BaseSettings):
         extra="ignore",  # Ignore extra env vars (e.g., DATABASE_URL for local testing)
     )
 
+    # Derived values, resolved once in model_post_init
+    _s3_raw_prefix: str = PrivateAttr(default="")
+    _s3_processed_prefix: str = PrivateAttr(default="")
+    _sqs_queue_name: str = PrivateAttr(default="")
+    _padrao_raw_bucket: str = PrivateAttr(default="")
+    _padrao_reservations_bucket: str = PrivateAttr(default="")
+    _padrao_segments_bucket: str = PrivateAttr(default="")
+    _padrao_hotel_configs_bucket: str = PrivateAttr(default="")
+    _padrao_sqs_queue_url: str = PrivateAttr(default="")
+    _padrao_sqs_message_group_id: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context: Any) -> None:
+        """Resolve {env} interpolation and padrão fallbacks once per instance."""
+        env = self.environment
+        self._s3_raw_prefix = self.aws.s3_raw_prefix.replace("{env}", env)
+        self._s3_processed_prefix = self.aws.s3_processed_prefix.replace("{env}", env)
+        self._sqs_queue_name = self.aws.sqs_queue_name.replace("{env}", env)
+
+        self._padrao_raw_bucket = (
+            self.s3_raw_reservations_bucket or self.aws.s3_raw_reservations_bucket or ""
+        )
+        self._padrao_reservations_bucket = (
+            self.s3_reservations_bucket or self.aws.s3_reservations_bucket or ""
+        )
+        self._padrao_segments_bucket = (
+            self.s3_segments_bucket or self.aws.s3_segments_bucket or ""
+        )
+        self._padrao_hotel_configs_bucket = (
+            self.s3_hotel_configs_bucket or self.aws.s3_hotel_configs_bucket or ""
+        )
+        self._padrao_sqs_queue_url = self.sqs_queue_url or self.aws.sqs_queue_url or ""
+
+        # Ignore values that look like .env comments (e.g. '# Optional...')
+        code_s3 = (self.hotel_code_s3 or self.hotel.hotel_code_s3 or "").strip()
+        raw = (self.sqs_message_group_id or self.aws.sqs_message_group_id or "").strip()
+        self._padrao_sqs_message_group_id = raw if raw and not raw.startswith("#") else code_s3
+
     def validate_climber_padrao(self) -> list[str]:
         """Validate required vars for Climber padrão flow. Returns list of missing var names."""
         missing = []
@@ -182,51 +233,49 @@ class Settings(BaseSettings):
 
     def padrao_raw_bucket(self) -> str:
         """S3 raw reservations bucket (padrão)."""
-        return self.s3_raw_reservations_bucket or self.aws.s3_raw_reservations_bucket or ""
+        return self._padrao_raw_bucket
 
     def padrao_reservations_bucket(self) -> str:
         """S3 reservations bucket (padrão)."""
-        return self.s3_reservations_bucket or self.aws.s3_reservations_bucket or ""
+        return self._padrao_reservations_bucket
 
     def padrao_segments_bucket(self) -> str:
         """S3 segments bucket (padrão)."""
-        return self.s3_segments_bucket or self.aws.s3_segments_bucket or ""
+        return self._padrao_segments_bucket
 
     def padrao_hotel_configs_bucket(self) -> str:
         """S3 hotel configs bucket (padrão). Where pms-processor expects config files."""
-        return (
-            self.s3_hotel_configs_bucket
-            or self.aws.s3_hotel_configs_bucket
-            or ""
-        )
+        return self._padrao_hotel_configs_bucket
 
     def padrao_sqs_queue_url(self) -> str:
         """SQS queue URL (padrão)."""
-        return self.sqs_queue_url or self.aws.sqs_queue_url or ""
+        return self._padrao_sqs_queue_url
 
     def padrao_sqs_message_group_id(self) -> str:
-        """SQS MessageGroupId (padrão). Ignore values that look like .env comments (e.g. '# Optional...')."""
-        code_s3 = (self.hotel_code_s3 or self.hotel.hotel_code_s3 or "").strip()
-        raw = (self.sqs_message_group_id or self.aws.sqs_message_group_id or "").strip()
-        if raw and not raw.startswith("#"):
-            return raw
-        return code_s3 or ""
+        """SQS MessageGroupId (padrão); defaults to HOTEL_CODE_S3."""
+        return self._padrao_sqs_message_group_id
 
     @property
     def aws_s3_raw_prefix(self) -> str:
         """Get S3 raw prefix with environment interpolation."""
-        return self.aws.s3_raw_prefix.replace("{env}", self.environment)
+        return self._s3_raw_prefix
 
     @property
     def aws_s3_processed_prefix(self) -> str:
         """Get S3 processed prefix with environment interpolation."""
-        return self.aws.s3_processed_prefix.replace("{env}", self.environment)
+        return self._s3_processed_prefix
 
     @property
     def aws_sqs_queue_name(self) -> str:
         """Get SQS queue name with environment interpolation."""
-        return self.aws.sqs_queue_name.replace("{env}", self.environment)
+        return self._sqs_queue_name
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings, loading the environment and .env once."""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
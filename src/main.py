@@ -1,17 +1,81 @@
 """Main entry point for the Host PMS Connector application."""
 
 import asyncio
-import json
 import os
 import sys
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Coroutine, Optional, TypeVar
+
+import orjson
 
 from src.config import configure_logging, get_logger, settings
 from src.services import HostPMSConnectorOrchestrator
 
 logger = get_logger(__name__)
 
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+T = TypeVar("T")
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize results with orjson, falling back to str() for unknown types."""
+    option = _JSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _JSON_OPTIONS
+    return orjson.dumps(obj, option=option, default=str)
+
+
+# One event loop for the life of the process. The orchestrator's HTTP and
+# Redis pools belong to the loop that opened them, so every invocation runs on
+# this loop instead of a fresh asyncio.run() loop (see _run)
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Reused across warm Lambda invocations (see _get_orchestrator)
+_orchestrator: Optional[HostPMSConnectorOrchestrator] = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide event loop, creating it on first use.
+
+    Uses uvloop when it is installed (pip install host-pms[uvloop]).
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        try:
+            import uvloop
+        except ImportError:
+            _loop = asyncio.new_event_loop()
+        else:
+            _loop = uvloop.new_event_loop()
+    return _loop
+
+
+def _run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on the process-wide event loop."""
+    return _get_loop().run_until_complete(coro)
+
+
+def _get_orchestrator() -> HostPMSConnectorOrchestrator:
+    """Return the process-wide orchestrator, keeping its connection pools warm."""
+    global _orchestrator
+    if _orchestrator is None:
+        _orchestrator = HostPMSConnectorOrchestrator()
+    return _orchestrator
+
+
+async def _close_orchestrator() -> None:
+    """Close the shared orchestrator at final shutdown."""
+    global _orchestrator
+    if _orchestrator is not None:
+        await _orchestrator.aclose()
+        _orchestrator = None
+
+
+def _print_results(obj: Any) -> None:
+    """Pretty-print results to stdout, except in Lambda where stdout goes to CloudWatch."""
+    if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+        return
+    print(_dumps(obj, indent=True).decode())
+
 
 async def main() -> int:
     """Main async function to run the ETL pipeline.
@@ -28,7 +92,7 @@ async def main() -> int:
     )
 
     try:
-        orchestrator = HostPMSConnectorOrchestrator()
+        orchestrator = _get_orchestrator()
 
         # Check if specific hotel code is configured (use hotel_code_s3 for Climber ESB)
         hotel_code_s3 = (settings.hotel_code_s3 or settings.hotel.hotel_code_s3 or "").strip()
@@ -44,7 +108,7 @@ async def main() -> int:
                 success=result["success"],
             )
 
-            print(json.dumps(result, indent=2, default=str))
+            _print_results(result)
             return 0 if result["success"] else 1
         else:
             # Multi-hotel mode
@@ -65,14 +129,14 @@ async def main() -> int:
                 failed_hotels=results["failed_hotels"],
             )
 
-            print(json.dumps(results, indent=2, default=str))
+            _print_results(results)
 
             # Save full results to logs/
             os.makedirs("logs", exist_ok=True)
             ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
             result_file = os.path.join("logs", f"etl_result_{ts}.json")
-            with open(result_file, "w") as f:
-                json.dump(results, f, indent=2, default=str)
+            with open(result_file, "wb") as f:
+                f.write(_dumps(results, indent=True))
             logger.info("ETL results saved", file=result_file)
 
             if results["successful_hotels"] > 0:
@@ -88,10 +152,13 @@ async def main() -> int:
         logger.error(
             "Fatal error in main application",
             error=str(e),
-            exc_info=True,
+            exc_info=settings.debug,
         )
         return 1
 
+    finally:
+        await _close_orchestrator()
+
 
 def run_sync() -> int:
     """Run the async main function synchronously.
@@ -99,12 +166,28 @@ def run_sync() -> int:
     Returns:
         Exit code from main()
     """
-    return asyncio.run(main())
+    return _run(main())
 
 
-async def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
+def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     """AWS Lambda handler for the Host PMS Connector.
 
+    Warm invocations run on the same event loop, so the shared orchestrator
+    and its pools stay usable between them.
+
+    Args:
+        event: Lambda event (can contain override parameters)
+        context: Lambda context
+
+    Returns:
+        Lambda response dictionary
+    """
+    return _run(_handle_lambda_event(event, context))
+
+
+async def _handle_lambda_event(event: dict[str, Any], context: Any) -> dict[str, Any]:
+    """Process one Lambda invocation on the shared orchestrator.
+
     Args:
         event: Lambda event (can contain override parameters)
         context: Lambda context
@@ -119,8 +202,8 @@ async def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     )
 
     try:
-        # Create orchestrator
-        orchestrator = HostPMSConnectorOrchestrator()
+        # Reuse the orchestrator (and its warm pools) across invocations
+        orchestrator = _get_orchestrator()
 
         # Check if specific hotel code is provided (use hotel_code_s3 for Climber ESB)
         hotel_code_s3 = event.get("hotelCodeS3") or event.get("hotel_code_s3")
@@ -142,7 +225,7 @@ async def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
         return {
             "statusCode": 200 if success else 400,
-            "body": json.dumps(result, default=str),
+            "body": _dumps(result).decode(),
         }
 
     except Exception as e:
@@ -150,17 +233,17 @@ async def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             "Lambda execution failed",
             request_id=context.request_id,
             error=str(e),
-            exc_info=True,
+            exc_info=settings.debug,
         )
 
         return {
             "statusCode": 500,
-            "body": json.dumps(
+            "body": _dumps(
                 {
                     "error": str(e),
                     "request_id": context.request_id,
                 }
-            ),
+            ).decode(),
         }
 
 
@@ -1,5 +1,7 @@
 """Shared pre-validators for Pydantic model fields."""
 
+from datetime import datetime
+
 
 def _extract_code_str(value):
     """Normalize a code/name field that may arrive as a dict like
@@ -11,3 +13,17 @@ def _extract_code_str(value):
     if isinstance(value, dict):
         return value.get("code") or value.get("id") or str(value)
     return value if isinstance(value, str) else str(value)
+
+
+def _parse_date_only(value):
+    """Parse a ``YYYY-MM-DD`` string to a midnight ``datetime``.
+
+    Uses the C-implemented ``datetime.fromisoformat``; anything that is not a
+    date-only string is returned unchanged for Pydantic to validate.
+    """
+    if isinstance(value, str) and len(value) == 10 and value[4] == "-" and value[7] == "-":
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return value
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class RoomInventoryItem(BaseModel):
@@ -40,6 +40,10 @@ class RoomInventoryItem(BaseModel):
         extra = "allow"
 
 
+# Serializes a whole item list in one pydantic-core call (see to_climber_dict)
+_ITEM_LIST_ADAPTER = TypeAdapter(list[RoomInventoryItem])
+
+
 class RoomInventoryData(BaseModel):
     """Room inventory collection in Climber format.
 
@@ -63,9 +67,7 @@ class RoomInventoryData(BaseModel):
             Dictionary with camelCase keys for Climber API
         """
         return {
-            "roomInventory": [
-                item.model_dump(by_alias=True) for item in self.room_inventory
-            ]
+            "roomInventory": _ITEM_LIST_ADAPTER.dump_python(self.room_inventory, by_alias=True)
         }
 
 
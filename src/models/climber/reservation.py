@@ -1,5 +1,6 @@
 """Pydantic models for Climber standardized reservation format."""
 
+import sys
 from datetime import datetime
 from typing import Optional
 
@@ -16,62 +17,62 @@ class ClimberReservation(BaseModel):
     """
 
     record_date: str = Field(
-        alias="recordDate",
+        serialization_alias="recordDate",
         description="Date range that this reservation state is valid, e.g., '[2021-06-02,)'",
     )
     calendar_date: str = Field(
-        alias="calendarDate",
+        serialization_alias="calendarDate",
         description="The day of stay (ISO format date)",
     )
     calendar_date_start: str = Field(
-        alias="calendarDateStart",
+        serialization_alias="calendarDateStart",
         description="The first stay day of this reservation (ISO format date)",
     )
     calendar_date_end: str = Field(
-        alias="calendarDateEnd",
+        serialization_alias="calendarDateEnd",
         description="The last stay day of this reservation (ISO format date)",
     )
     created_date: str = Field(
-        alias="createdDate",
+        serialization_alias="createdDate",
         description="The day that this reservation was created (ISO format date)",
     )
     pax: int = Field(description="Number of persons in the room")
     reservation_id: str = Field(
-        alias="reservationId",
+        serialization_alias="reservationId",
         description="Reservation ID (internal, as string)",
     )
     reservation_id_external: str = Field(
-        alias="reservationIdExternal",
+        serialization_alias="reservationIdExternal",
         description="Reservation ID in the PMS (external, as string)",
     )
     revenue_fb: float = Field(
         default=0.0,
-        alias="revenueFb",
+        serialization_alias="revenueFb",
         description="F&B value",
     )
     revenue_fb_invoice: float = Field(
         default=0.0,
-        alias="revenueFbInvoice",
+        serialization_alias="revenueFbInvoice",
         description="F&B value invoiced (only valid for past stays at checkout)",
     )
     revenue_others: float = Field(
         default=0.0,
-        alias="revenueOthers",
+        serialization_alias="revenueOthers",
         description="Other values in the reservation",
     )
     revenue_others_invoice: float = Field(
         default=0.0,
-        alias="revenueOthersInvoice",
+        serialization_alias="revenueOthersInvoice",
         description="Other values invoiced (only valid for past stays at checkout)",
     )
     revenue_room: float = Field(
         default=0.0,
-        alias="revenueRoom",
+        serialization_alias="revenueRoom",
         description="Room value",
     )
     revenue_room_invoice: float = Field(
         default=0.0,
-        alias="revenueRoomInvoice",
+        serialization_alias="revenueRoomInvoice",
         description="Room value invoiced (only valid for past stays at checkout)",
     )
     rooms: int = Field(
@@ -81,50 +82,50 @@ class ClimberReservation(BaseModel):
         description="Status code: 0=CANCELLED, 1=CHECKED_IN, 2=CHECKED_OUT, 3=CONFIRMED, 4=NO_SHOW, 5=TENTATIVE",
     )
     agency_code: str = Field(
-        alias="agencyCode",
+        serialization_alias="agencyCode",
         description="Agency segment code (UNASSIGNED if not supported)",
     )
     channel_code: str = Field(
-        alias="channelCode",
+        serialization_alias="channelCode",
         description="Channel segment code (UNASSIGNED if not supported)",
     )
     company_code: str = Field(
-        alias="companyCode",
+        serialization_alias="companyCode",
         description="Company segment code (UNASSIGNED if not supported)",
     )
     cro_code: str = Field(
-        alias="croCode",
+        serialization_alias="croCode",
         description="CRO segment code (UNASSIGNED if not supported)",
     )
     group_code: str = Field(
-        alias="groupCode",
+        serialization_alias="groupCode",
         description="Group segment code (UNASSIGNED if not supported)",
     )
     package_code: str = Field(
-        alias="packageCode",
+        serialization_alias="packageCode",
         description="Package segment code (UNASSIGNED if not supported)",
     )
     rate_code: str = Field(
-        alias="rateCode",
+        serialization_alias="rateCode",
         description="Rate segment code (UNASSIGNED if not supported)",
     )
     room_code: str = Field(
-        alias="roomCode",
+        serialization_alias="roomCode",
         description="Room segment code (UNASSIGNED if not supported)",
     )
     segment_code: str = Field(
-        alias="segmentCode",
+        serialization_alias="segmentCode",
         description="Segment code (UNASSIGNED if not supported)",
     )
     sub_segment_code: str = Field(
-        alias="subSegmentCode",
+        serialization_alias="subSegmentCode",
         description="Sub-segment code (UNASSIGNED if not supported)",
     )
 
+    # Built by field name in the transformers and only emitted with camelCase keys,
+    # so aliases apply to serialization only and validation needs a single lookup.
     model_config = ConfigDict(
-        populate_by_name=True,
         extra="forbid",  # Reject any extra fields not in this model
-        alias_priority="alias",  # Use alias names for serialization
     )
 
     @field_validator(
@@ -150,6 +151,33 @@ class ClimberReservation(BaseModel):
             return 0.0
         return round(float(value), 2)
 
+    @field_validator(
+        "agency_code",
+        "channel_code",
+        "company_code",
+        "cro_code",
+        "group_code",
+        "package_code",
+        "rate_code",
+        "room_code",
+        "segment_code",
+        "sub_segment_code",
+    )
+    @classmethod
+    def intern_code(cls, value: str) -> str:
+        """Intern segment codes so records share one string per distinct code.
+
+        Codes come from a small set ("UNASSIGNED", room types, segments) but each
+        Host PMS reservation carries its own copies; every night record holds ten.
+
+        Args:
+            value: Segment code
+
+        Returns:
+            The interned code
+        """
+        return sys.intern(value)
+
 
 class ReservationCollection(BaseModel):
     """Collection of reservations in Climber standardized format."""
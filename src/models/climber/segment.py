@@ -1,6 +1,6 @@
 """Pydantic models for Climber standardized segment format."""
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 from src.models._normalizers import _extract_code_str
 
@@ -35,6 +35,24 @@ class SegmentItem(BaseModel):
         populate_by_name = True
 
 
+# Serializes a whole item list in one pydantic-core call (see to_climber_dict)
+_ITEM_LIST_ADAPTER = TypeAdapter(list[SegmentItem])
+
+# (Climber output key, SegmentCollection attribute), in Climber's expected order
+_SEGMENT_FIELDS = (
+    ("agencies", "agencies"),
+    ("channels", "channels"),
+    ("companies", "companies"),
+    ("cros", "cros"),
+    ("groups", "groups"),
+    ("packages", "packages"),
+    ("rates", "rates"),
+    ("rooms", "rooms"),
+    ("segments", "segments"),
+    ("subSegments", "sub_segments"),
+)
+
+
 class SegmentCollection(BaseModel):
     """Collection of segments organized by type, matching Climber expected format."""
 
@@ -81,17 +99,5 @@ class SegmentCollection(BaseModel):
         Returns:
             Dictionary with camelCase keys for Climber API
         """
-        return {
-            "agencies": [item.model_dump(by_alias=True) for item in self.agencies],
-            "channels": [item.model_dump(by_alias=True) for item in self.channels],
-            "companies": [item.model_dump(by_alias=True) for item in self.companies],
-            "cros": [item.model_dump(by_alias=True) for item in self.cros],
-            "groups": [item.model_dump(by_alias=True) for item in self.groups],
-            "packages": [item.model_dump(by_alias=True) for item in self.packages],
-            "rates": [item.model_dump(by_alias=True) for item in self.rates],
-            "rooms": [item.model_dump(by_alias=True) for item in self.rooms],
-            "segments": [item.model_dump(by_alias=True) for item in self.segments],
-            "subSegments": [
-                item.model_dump(by_alias=True) for item in self.sub_segments
-            ],
-        }
+        dump = _ITEM_LIST_ADAPTER.dump_python
+        return {out: dump(getattr(self, attr), by_alias=True) for out, attr in _SEGMENT_FIELDS}
@@ -1,6 +1,8 @@
 """Pydantic models for Host PMS API configuration responses."""
 
+from collections import defaultdict
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Optional
 
 from pydantic import BaseModel, Field, field_validator
@@ -28,7 +30,7 @@ class ConfigItem(BaseModel):
         return _extract_code_str(value)
 
     class Config:
-        extra = "allow"
+        extra = "ignore"
         populate_by_name = True
 
 
@@ -48,7 +50,7 @@ class HotelInfo(BaseModel):
     duration: Optional[float] = Field(None, alias="Duration")
 
     class Config:
-        extra = "allow"
+        extra = "ignore"
         populate_by_name = True
 
 
@@ -62,9 +64,17 @@ class HotelConfigResponse(BaseModel):
     hotel_info: HotelInfo = Field(alias="HotelInfo")
 
     class Config:
-        extra = "allow"
+        extra = "ignore"
         populate_by_name = True
 
+    @cached_property
+    def config_by_type(self) -> dict[str, list[ConfigItem]]:
+        """Configuration items grouped by type, built in one pass over config_info."""
+        index: defaultdict[str, list[ConfigItem]] = defaultdict(list)
+        for item in self.config_info:
+            index[item.config_type].append(item)
+        return dict(index)
+
     def get_config_by_type(self, config_type: str) -> list[ConfigItem]:
         """Filter configuration items by type.
 
@@ -72,9 +82,9 @@ class HotelConfigResponse(BaseModel):
             config_type: Type to filter (e.g., "CATEGORY", "SEGMENT", "DIST CHANNEL")
 
         Returns:
-            List of matching ConfigItem objects
+            List of matching ConfigItem objects (shared; do not mutate)
         """
-        return [item for item in self.config_info if item.config_type == config_type]
+        return self.config_by_type.get(config_type, [])
 
     @property
     def rooms(self) -> list[ConfigItem]:
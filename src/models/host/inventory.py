@@ -18,7 +18,7 @@ class DailyInventory(BaseModel):
     status: Optional[str] = None  # AVAILABLE, SOLD_OUT, CLOSED, etc.
 
     class Config:
-        extra = "allow"
+        extra = "ignore"
         populate_by_name = True
 
 
@@ -34,7 +34,7 @@ class RoomInventory(BaseModel):
     )
 
     class Config:
-        extra = "allow"
+        extra = "ignore"
         populate_by_name = True
 
 
@@ -50,5 +50,5 @@ class InventoryResponse(BaseModel):
     last_update_date: Optional[str] = Field(None, alias="lastUpdateDate")
 
     class Config:
-        extra = "allow"
+        extra = "ignore"
         populate_by_name = True
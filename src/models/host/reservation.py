@@ -1,9 +1,14 @@
 """Pydantic models for Host PMS API reservation responses."""
 
+from collections import defaultdict
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+
+from src.models._normalizers import _parse_date_only
 
 
 class Guest(BaseModel):
@@ -33,20 +38,22 @@ class Guest(BaseModel):
     @classmethod
     def parse_birth_date(cls, v):
         """Parse date-only strings to datetime."""
-        if isinstance(v, str) and v and len(v) == 10:  # YYYY-MM-DD format
-            try:
-                return datetime.strptime(v, "%Y-%m-%d")
-            except ValueError:
-                pass
-        return v
+        return _parse_date_only(v)
 
     class Config:
-        extra = "allow"
+        extra = "ignore"
         populate_by_name = True
 
 
-class PriceItem(BaseModel):
-    """Price/charge line item in reservation."""
+@pydantic_dataclass(
+    config=ConfigDict(extra="ignore", populate_by_name=True), slots=True, kw_only=True
+)
+class PriceItem:
+    """Price/charge line item in reservation.
+
+    A slotted dataclass rather than a BaseModel: reservations carry one per
+    charge line per night, and only the fields below are ever read.
+    """
 
     global_res_guest_id: str = Field(alias="GlobalResguestId")  # may be alphanumeric
     sales_group: int = Field(alias="SalesGroup")  # 0=Room, 1=F&B, etc.
@@ -69,16 +76,7 @@ class PriceItem(BaseModel):
     @classmethod
     def parse_date(cls, v):
         """Parse date-only strings to datetime."""
-        if isinstance(v, str) and v and len(v) == 10:  # YYYY-MM-DD format
-            try:
-                return datetime.strptime(v, "%Y-%m-%d")
-            except ValueError:
-                pass
-        return v
-
-    class Config:
-        extra = "allow"
-        populate_by_name = True
+        return _parse_date_only(v)
 
 
 class HostReservation(BaseModel):
@@ -126,42 +124,47 @@ class HostReservation(BaseModel):
         return str(value)
 
     class Config:
-        extra = "allow"
+        extra = "ignore"
         populate_by_name = True
 
+    @cached_property
+    def revenue_by_sales_group(self) -> dict[int, float]:
+        """Total revenue by sales group, computed once per reservation.
+
+        Prices are not expected to change after validation; the result is cached.
+        """
+        revenue: defaultdict[int, float] = defaultdict(float)
+        for price in self.prices:
+            revenue[price.sales_group] += price.amount
+        return dict(revenue)
+
     def get_revenue_by_sales_group(self) -> dict[int, float]:
         """Calculate total revenue by sales group.
 
         Returns:
             Dictionary mapping sales_group to total amount
         """
-        revenue = {}
-        for price in self.prices:
-            if price.sales_group not in revenue:
-                revenue[price.sales_group] = 0.0
-            revenue[price.sales_group] += price.amount
-        return revenue
+        return self.revenue_by_sales_group
 
     @property
     def room_revenue(self) -> float:
         """Get total room revenue (SalesGroup 0)."""
-        return self.get_revenue_by_sales_group().get(0, 0.0)
+        return self.revenue_by_sales_group.get(0, 0.0)
 
     @property
     def fb_revenue(self) -> float:
         """Get total F&B revenue (SalesGroup 1)."""
-        return self.get_revenue_by_sales_group().get(1, 0.0)
+        return self.revenue_by_sales_group.get(1, 0.0)
 
     @property
     def other_revenue(self) -> float:
         """Get total other revenue (SalesGroup > 1)."""
-        revenue_map = self.get_revenue_by_sales_group()
-        return sum(v for k, v in revenue_map.items() if k > 1)
+        return sum(v for k, v in self.revenue_by_sales_group.items() if k > 1)
 
     @property
     def total_revenue(self) -> float:
         """Get total revenue from all charges."""
-        return sum(self.get_revenue_by_sales_group().values())
+        return sum(self.revenue_by_sales_group.values())
 
 
 class ReservationResponse(BaseModel):
@@ -170,7 +173,7 @@ class ReservationResponse(BaseModel):
     reservations: list[HostReservation] = Field(alias="Reservations")
 
     class Config:
-        extra = "allow"
+        extra = "ignore"
         populate_by_name = True
 
 
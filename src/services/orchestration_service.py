@@ -9,7 +9,8 @@ from structlog import get_logger
 
 from src.aws import S3Manager, SQSManager
 from src.config import settings
-from src.clients import ClimberESBClient, HostPMSAPIClient
+from src.clients import HostPMSAPIClient, get_esb_client, get_host_api_client
+from src.clients.redis_token_manager import aclose_pool
 from src.services.pipeline import Pipeline, PipelineContext
 from src.services.pipeline.steps import (
     FetchParametersStep,
@@ -39,12 +40,18 @@ class HostPMSConnectorOrchestrator:
 
     def __init__(self):
         """Initialize the orchestrator with all required services."""
-        self.esb_client = ClimberESBClient()
+        self.esb_client = get_esb_client()
         self.s3_manager = S3Manager()
         self.sqs_manager = SQSManager()
         self._summary_lock = asyncio.Lock()
         self._summary_file: str | None = None
 
+    async def aclose(self) -> None:
+        """Release long-lived clients (HTTP connection pools)."""
+        await self.esb_client.aclose()
+        get_esb_client.cache_clear()
+        await aclose_pool()
+
     def _init_summary_file(self, total_hotels: int) -> None:
         """Create the summary file with a header at the start of execution."""
         os.makedirs(self.SUMMARY_DIR, exist_ok=True)
@@ -160,6 +167,9 @@ class HostPMSConnectorOrchestrator:
             worker_id=worker_id,
         )
 
+        # Close the client's connection pools afterwards only if we create it here
+        owns_client = host_api_client is None
+
         try:
             # If no client provided, fetch credentials from getIntegration
             if host_api_client is None:
@@ -185,7 +195,8 @@ class HostPMSConnectorOrchestrator:
                     "Creating Host API client with hotel-specific credentials",
                     hotel_code=hotel_code,
                 )
-                host_api_client = HostPMSAPIClient(subscription_key=subscription_key)
+                host_api_client = get_host_api_client(subscription_key)
+                host_api_client.acquire_async_client()
 
             # Validate subscription key before running pipeline
             logger.info(
@@ -260,6 +271,9 @@ class HostPMSConnectorOrchestrator:
                 "s3_uploads": {},
                 "sqs_messages": [],
             }
+        finally:
+            if owns_client and host_api_client is not None:
+                await host_api_client.release_async_client()
 
     async def process_single_hotel(
         self,
@@ -313,13 +327,15 @@ class HostPMSConnectorOrchestrator:
             Dictionary with processing results
         """
         worker_id = await worker_pool.get()
+        host_api_client: Optional[HostPMSAPIClient] = None
         try:
             logger.info(
                 "Creating Host API client with hotel-specific credentials",
                 hotel_code=hotel_code,
                 worker_id=worker_id,
             )
-            host_api_client = HostPMSAPIClient(subscription_key=subscription_key)
+            host_api_client = get_host_api_client(subscription_key)
+            host_api_client.acquire_async_client()
 
             result = await self.process_hotel(hotel_code, host_api_client, worker_id=worker_id)
             await self._append_hotel_summary(result)
@@ -340,6 +356,8 @@ class HostPMSConnectorOrchestrator:
             await self._append_hotel_summary(result)
             return result
         finally:
+            if host_api_client is not None:
+                await host_api_client.release_async_client()
             worker_pool.put_nowait(worker_id)
 
     async def process_all_hotels(self, integration_type: str = "BITZ", only_hotel: str | None = None) -> dict[str, Any]:
@@ -1,7 +1,5 @@
 """Step to process segments."""
 
-import asyncio
-
 from src.aws import S3Manager
 from src.clients import ClimberESBClient
 from src.services.pipeline import PipelineContext, PipelineStep
@@ -43,22 +41,29 @@ class ProcessSegmentsStep(PipelineStep):
             return False
 
         try:
-            # Upload raw segments to S3 (same as processed, as segments are derived from config)
-            raw_upload = await asyncio.to_thread(
-                self.s3_manager.upload_raw,
-                hotel_code=context.hotel_code,
-                data_type="segments",
-                data=context.segments_collection,
+            # Upload raw and processed segments to S3 concurrently
+            # (raw is the same as processed, as segments are derived from config)
+            raw_upload, processed_upload = await self.s3_manager.upload_many_async(
+                [
+                    (
+                        self.s3_manager.upload_raw,
+                        {
+                            "hotel_code": context.hotel_code,
+                            "data_type": "segments",
+                            "data": context.segments_collection,
+                        },
+                    ),
+                    (
+                        self.s3_manager.upload_processed,
+                        {
+                            "hotel_code": context.hotel_code,
+                            "data_type": "segments",
+                            "data": context.segments_collection,
+                        },
+                    ),
+                ],
             )
             context.add_s3_upload("segments_raw", raw_upload)
-
-            # Upload processed segments to S3
-            processed_upload = await asyncio.to_thread(
-                self.s3_manager.upload_processed,
-                hotel_code=context.hotel_code,
-                data_type="segments",
-                data=context.segments_collection,
-            )
             context.add_s3_upload("segments_processed", processed_upload)
 
             # Calculate total segments
@@ -0,0 +1,19 @@
+"""Small helpers shared by the HTTP API clients."""
+
+import httpx
+
+
+def truncate_body(response: httpx.Response, limit: int = 500) -> str:
+    """Return at most ``limit`` bytes of a response body as text, for logs/errors.
+
+    Slices the raw bytes before decoding, so large error pages are never
+    decoded (or cached on the response as ``.text``) in full.
+
+    Args:
+        response: HTTP response
+        limit: Maximum number of body bytes to include
+
+    Returns:
+        Decoded body prefix (invalid UTF-8 replaced)
+    """
+    return response.content[:limit].decode("utf-8", errors="replace")
@@ -2,10 +2,24 @@ import json
 from pathlib import Path
 import pytest
 
+from src.aws.client_factory import get_client, reset_client_kwargs_cache, reset_session
+
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture(autouse=True)
+def reset_boto3_clients():
+    """Drop cached boto3 clients so each test sees its own patched client."""
+    reset_client_kwargs_cache()
+    reset_session()
+    get_client.cache_clear()
+    yield
+    reset_client_kwargs_cache()
+    reset_session()
+    get_client.cache_clear()
+
+
 @pytest.fixture
 def host_config_response():
     """Load Host PMS config response from fixture."""
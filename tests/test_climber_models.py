@@ -0,0 +1,103 @@
+"""Unit tests for Climber output models."""
+
+import pytest
+from pydantic import ValidationError
+
+from src.models.climber.inventory import RoomInventoryData, RoomInventoryItem
+from src.models.climber.reservation import ClimberReservation
+from src.models.climber.segment import SegmentCollection, SegmentItem
+
+
+def test_inventory_to_climber_dict_uses_aliases():
+    """Inventory rows are dumped with camelCase keys."""
+    data = RoomInventoryData(
+        room_inventory=[RoomInventoryItem(calendar_date="[2024-01-01,)", room_code="DBL")]
+    )
+
+    assert data.to_climber_dict() == {
+        "roomInventory": [
+            {
+                "calendarDate": "[2024-01-01,)",
+                "inventory": 0,
+                "inventoryOOI": 0,
+                "inventoryOOO": 0,
+                "roomCode": "DBL",
+            }
+        ]
+    }
+
+
+def test_segments_to_climber_dict_keeps_extras():
+    """Every segment list is dumped with aliases, including extra fields."""
+    collection = SegmentCollection(
+        rooms=[SegmentItem(code="DBL", name="Double", source="host")],
+        sub_segments=[SegmentItem(code="S1", name="Sub", enabled_otb=False)],
+    )
+
+    result = collection.to_climber_dict()
+
+    assert result["rooms"] == [
+        {
+            "code": "DBL",
+            "name": "Double",
+            "enabledOtb": True,
+            "enabledRevenue": True,
+            "position": 9999,
+            "source": "host",
+        }
+    ]
+    assert result["subSegments"][0]["enabledOtb"] is False
+    assert result["agencies"] == []
+    assert len(result) == 10
+
+
+def _reservation_fields() -> dict:
+    """Minimal ClimberReservation keyword arguments."""
+    segment_fields = (
+        "agency_code",
+        "channel_code",
+        "company_code",
+        "cro_code",
+        "group_code",
+        "package_code",
+        "rate_code",
+        "room_code",
+        "segment_code",
+        "sub_segment_code",
+    )
+    return {
+        "record_date": "[2024-01-01,)",
+        "calendar_date": "2024-01-01",
+        "calendar_date_start": "2024-01-01",
+        "calendar_date_end": "2024-01-02",
+        "created_date": "2023-12-01",
+        "pax": 2,
+        "reservation_id": "1",
+        "reservation_id_external": "R1",
+        "rooms": 1,
+        "status": 3,
+        **{name: "UNASSIGNED" for name in segment_fields},
+    }
+
+
+def test_reservation_serializes_with_camel_case():
+    """Reservations are built by field name and dumped with Climber keys."""
+    dumped = ClimberReservation(**_reservation_fields()).model_dump(by_alias=True)
+
+    assert dumped["recordDate"] == "[2024-01-01,)"
+    assert dumped["subSegmentCode"] == "UNASSIGNED"
+    assert "record_date" not in dumped
+
+
+def test_reservation_rejects_unknown_fields():
+    """extra='forbid' still rejects fields outside the Climber spec."""
+    with pytest.raises(ValidationError):
+        ClimberReservation(**_reservation_fields(), hotel_code="H1")
+
+
+def test_reservation_segment_codes_interned():
+    """Equal codes from separate payloads end up as one shared string object."""
+    first = ClimberReservation(**{**_reservation_fields(), "room_code": "".join(["DB", "L"])})
+    second = ClimberReservation(**{**_reservation_fields(), "room_code": "".join(["DB", "L"])})
+
+    assert first.room_code is second.room_code
@@ -0,0 +1,80 @@
+"""Unit tests for ClimberESBClient."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from src.clients import ClimberESBClient
+
+
+@pytest.fixture
+async def esb_client():
+    """ESB client whose token manager hands out token-1, then token-2 after a clear."""
+    client = ClimberESBClient()
+    tokens = ["token-1"]
+    client.token_manager.get_auth_token = AsyncMock(side_effect=lambda: tokens[-1])
+    client.token_manager.clear_cache = AsyncMock(
+        side_effect=lambda: tokens.append(f"token-{len(tokens) + 1}")
+    )
+    yield client
+    await client.aclose()
+
+
+class TestTokenRefresh:
+    """Tests for OAuth token handling, cached by the token manager."""
+
+    async def test_headers_use_token_manager(self, esb_client):
+        """Headers carry the token manager's current token."""
+        headers = await esb_client._get_headers()
+
+        assert headers["Authorization"] == "Bearer token-1"
+
+    async def test_refresh_token_clears_caches(self, esb_client):
+        """refresh_token drops the cached token and fetches a new one."""
+        token = await esb_client.refresh_token()
+
+        assert token == "token-2"
+        esb_client.token_manager.clear_cache.assert_awaited_once()
+
+    async def test_refresh_skipped_when_token_already_replaced(self, esb_client):
+        """A 401 on an already-replaced token reuses the newer token."""
+        await esb_client.refresh_token(stale_token="token-1")
+
+        token = await esb_client.refresh_token(stale_token="token-1")
+
+        assert token == "token-2"
+        esb_client.token_manager.clear_cache.assert_awaited_once()
+
+    async def test_concurrent_refreshes_clear_once(self, esb_client):
+        """Concurrent 401s on the same token trigger a single refresh."""
+        tokens = await asyncio.gather(
+            *(esb_client.refresh_token(stale_token="token-1") for _ in range(3))
+        )
+
+        assert set(tokens) == {"token-2"}
+        esb_client.token_manager.clear_cache.assert_awaited_once()
+
+
+async def test_register_file_posts_json_bytes(esb_client):
+    """Request bodies are sent pre-serialized with a JSON content type."""
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["content_type"] = request.headers["content-type"]
+        seen["body"] = json.loads(request.content)
+        return httpx.Response(200, json={"ok": True})
+
+    await esb_client._client.aclose()
+    esb_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    result = await esb_client.register_file(
+        "HOTEL001", "segments", "s3://bucket/key.json", "key.json", record_count=3
+    )
+
+    assert result == {"ok": True}
+    assert seen["content_type"] == "application/json"
+    assert seen["body"]["payload"]["code"] == "HOTEL001"
+    assert seen["body"]["payload"]["file"] == "key.json"
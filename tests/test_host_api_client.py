@@ -0,0 +1,253 @@
+"""Unit tests for HostPMSAPIClient."""
+
+import httpx
+import pytest
+
+from src.clients import HostPMSAPIClient, get_host_api_client
+from src.clients import host_api_client
+from src.clients.host_api_client import HostAPIClientError
+
+
+def _reservation_handler(total_rows: int):
+    """MockTransport handler serving TotalRows reservations in pages."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        start = int(request.url.params["start"])
+        limit = int(request.url.params["limit"])
+        rows = [
+            {"Id": i, "TotalRows": total_rows}
+            for i in range(start, min(start + limit, total_rows))
+        ]
+        return httpx.Response(200, json={"Reservations": rows})
+
+    return handler
+
+
+@pytest.fixture
+async def host_client():
+    """Host API client whose async HTTP client is served by a handler."""
+    client = HostPMSAPIClient(subscription_key="test-key")
+    yield client
+    await client.aclose()
+
+
+class TestGetReservationsAsync:
+    """Tests for concurrent reservation pagination."""
+
+    async def test_pages_combined_in_order(self, host_client):
+        """All pages are fetched and combined in page order."""
+        host_client._async_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(_reservation_handler(250))
+        )
+
+        result = await host_client.get_reservations_async("HOTEL001", max_concurrent=2)
+
+        assert [r["Id"] for r in result["Reservations"]] == list(range(250))
+
+    async def test_no_reservations(self, host_client):
+        """An empty first page returns an empty list."""
+        host_client._async_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(_reservation_handler(0))
+        )
+
+        result = await host_client.get_reservations_async("HOTEL001")
+
+        assert result == {"Reservations": []}
+
+
+def test_subscription_key_sent_as_default_header():
+    """The subscription key header is set once on the pooled client."""
+    client = HostPMSAPIClient(subscription_key="hotel-key")
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.update(request.headers)
+        return httpx.Response(200, json={})
+
+    client._client = httpx.Client(
+        transport=httpx.MockTransport(handler), headers=client._base_headers
+    )
+    client.get_hotel_config("HOTEL001")
+
+    assert seen["ocp-apim-subscription-key"] == "hotel-key"
+
+
+class TestBackoffDelay:
+    """Tests for retry backoff."""
+
+    @pytest.mark.parametrize("attempt", [0, 1, 3, 10])
+    def test_jittered_and_capped(self, host_client, attempt):
+        """Delay is base**attempt plus up to 50% jitter, never above the cap."""
+        base = min(host_client.retry_backoff_cap, host_client.retry_backoff_base ** attempt)
+        delay = host_client._backoff_delay(attempt)
+        assert base <= delay <= min(host_client.retry_backoff_cap, base * 1.5)
+
+    def test_retry_after_takes_precedence(self, host_client):
+        """Retry-After replaces the computed backoff but is still capped."""
+        assert host_client._backoff_delay(0, retry_after=7) == 7
+        assert host_client._backoff_delay(0, retry_after=120) == host_client.retry_backoff_cap
+
+    def test_sync_server_error_caps_large_retry_after(self, monkeypatch):
+        """A huge Retry-After on a 5xx never blocks the sync path beyond the cap."""
+        sleeps: list[float] = []
+        monkeypatch.setattr(host_api_client.time, "sleep", sleeps.append)
+        responses = iter(
+            [httpx.Response(503, headers={"Retry-After": "3600"}), httpx.Response(200, json={})]
+        )
+        client = HostPMSAPIClient(subscription_key="test-key")
+        client._client = httpx.Client(transport=httpx.MockTransport(lambda _: next(responses)))
+
+        assert client._make_request("GET", "/Config", hotel_code="H1") == {}
+        assert sleeps == [client.retry_backoff_cap]
+
+    def test_sync_rate_limit_waits_full_retry_after(self, monkeypatch):
+        """A 429 on the sync path sleeps for the server's Retry-After before retrying."""
+        sleeps: list[float] = []
+        monkeypatch.setattr(host_api_client.time, "sleep", sleeps.append)
+        responses = iter(
+            [httpx.Response(429, headers={"Retry-After": "60"}), httpx.Response(200, json={})]
+        )
+        client = HostPMSAPIClient(subscription_key="test-key")
+        client._client = httpx.Client(transport=httpx.MockTransport(lambda _: next(responses)))
+
+        assert client._make_request("GET", "/Config", hotel_code="H1") == {}
+        assert sleeps == [60.0]
+
+
+def test_error_body_truncated_to_bytes():
+    """Error messages carry a bounded, byte-sliced body prefix."""
+    client = HostPMSAPIClient(subscription_key="hotel-key")
+    client._client = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(400, content=b"x" * 5000))
+    )
+
+    with pytest.raises(HostAPIClientError) as excinfo:
+        client.get_hotel_config("HOTEL001")
+
+    assert str(excinfo.value).endswith("x" * 500)
+    assert "x" * 501 not in str(excinfo.value)
+
+
+def test_hotel_config_revalidated_with_etag():
+    """A 304 for a cached ETag returns the cached config."""
+    client = HostPMSAPIClient(subscription_key="hotel-key")
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"hotelCode": "HOTEL001"}, headers={"ETag": '"v1"'})
+
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    first = client.get_hotel_config("HOTEL001")
+    second = client.get_hotel_config("HOTEL001")
+
+    assert first == second == {"hotelCode": "HOTEL001"}
+    assert first is not second
+    assert "if-none-match" not in requests[0].headers
+    assert requests[1].headers["if-none-match"] == '"v1"'
+
+
+def test_hotel_config_cache_bounded(monkeypatch):
+    """Only the most recently fetched configs keep their ETag."""
+    monkeypatch.setattr(host_api_client, "_MAX_CACHED_CONFIGS", 2)
+    client = HostPMSAPIClient(subscription_key="hotel-key")
+    client._client = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json={}, headers={"ETag": '"v1"'})
+        )
+    )
+
+    for hotel_code in ("H1", "H2", "H3"):
+        client.get_hotel_config(hotel_code)
+
+    assert list(client._config_cache) == ["H2", "H3"]
+
+
+async def test_fetch_all_async_isolates_failures(host_client):
+    """A failing endpoint is returned as an exception without cancelling others."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/Revenue"):
+            return httpx.Response(404)
+        if request.url.path.endswith("/Reservation"):
+            return httpx.Response(200, json={"Reservations": [{"Id": 1, "TotalRows": 1}]})
+        return httpx.Response(200, json={"hotelCode": "HOTEL001"})
+
+    transport = httpx.MockTransport(handler)
+    host_client._client = httpx.Client(transport=transport)
+    host_client._async_client = httpx.AsyncClient(transport=transport)
+
+    results = await host_client.fetch_all_async("HOTEL001")
+
+    assert results["config"] == {"hotelCode": "HOTEL001"}
+    assert results["reservations"] == {"Reservations": [{"Id": 1, "TotalRows": 1}]}
+    assert isinstance(results["revenue"], HostAPIClientError)
+    assert "stat_summary" not in results
+
+
+async def test_get_host_api_client_cached_per_key():
+    """Clients are shared per subscription key and survive release_async_client."""
+    host_api_client.clear_host_api_clients()
+    try:
+        client = get_host_api_client("key-a")
+        assert get_host_api_client("key-a") is client
+        assert get_host_api_client("key-b") is not client
+
+        client._get_async_client()
+        await client.release_async_client()
+
+        assert client._async_client is None
+        assert not client._client.is_closed
+    finally:
+        host_api_client.clear_host_api_clients()
+
+
+def test_get_host_api_client_evicts_idle_clients(monkeypatch):
+    """Past the cache bound the least recently used idle client is closed."""
+    monkeypatch.setattr(host_api_client, "_MAX_CACHED_CLIENTS", 2)
+    host_api_client.clear_host_api_clients()
+    try:
+        busy = get_host_api_client("key-a")
+        busy.acquire_async_client()
+        idle = get_host_api_client("key-b")
+        get_host_api_client("key-c")
+
+        assert idle._client.is_closed
+        assert not busy._client.is_closed
+        assert list(host_api_client._clients) == ["key-a", "key-c"]
+    finally:
+        busy._async_users = 0
+        host_api_client.clear_host_api_clients()
+
+
+async def test_async_entry_points_hold_the_pool(host_client):
+    """get_reservations_async keeps the pool open for a run that already holds it."""
+    host_client.acquire_async_client()
+    pool = httpx.AsyncClient(transport=httpx.MockTransport(_reservation_handler(10)))
+    host_client._async_client = pool
+
+    await host_client.get_reservations_async("HOTEL001")
+    assert host_client._async_client is pool
+
+    await host_client.release_async_client()
+    assert pool.is_closed
+
+
+async def test_async_client_kept_open_until_last_user_releases():
+    """A shared client keeps its async pool while another hotel run still uses it."""
+    client = HostPMSAPIClient(subscription_key="shared-key")
+    client.acquire_async_client()
+    client.acquire_async_client()
+    pool = client._get_async_client()
+
+    await client.release_async_client()
+    assert client._async_client is pool
+    assert not pool.is_closed
+
+    await client.release_async_client()
+    assert client._async_client is None
+    assert pool.is_closed
+    client.close()
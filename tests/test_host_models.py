@@ -0,0 +1,130 @@
+"""Unit tests for Host PMS response models."""
+
+from datetime import datetime
+
+from src.models.host.config import HotelConfigResponse
+from src.models.host.reservation import Guest, HostReservation, PriceItem
+
+
+def _price(sales_group: int, amount: float) -> dict:
+    """Minimal Host PMS price line."""
+    return {
+        "GlobalResguestId": 782000,
+        "SalesGroup": sales_group,
+        "SalesGroupDesc": f"Group {sales_group}",
+        "Date": "2026-01-01",
+        "Charge": "ALOJ",
+        "Amount": amount,
+        "PaxTypeDesc": "Adult",
+    }
+
+
+def _reservation(**overrides) -> HostReservation:
+    """Minimal HostReservation built from a Host PMS payload."""
+    payload = {
+        "ResNo": 12345,
+        "ResId": 6365,
+        "DetailId": 1,
+        "GlobalResGuestId": 782000,
+        "CreatedOn": "2025-12-01T00:00:00",
+        "LastUpdate": "2025-12-01T00:00:00",
+        "CheckIn": "2026-01-01T00:00:00",
+        "CheckOut": "2026-01-02T00:00:00",
+        "Category": "STD",
+        "Agency": "DIRECT",
+        "ResStatus": 1,
+        "GuestId": 1,
+        "Pax": 2,
+        "PriceList": "RACK",
+        "SegmentDescription": "LEISURE",
+        "SubSegmentDescription": "INDIVIDUAL",
+        "ChannelDescription": "DIRECT",
+    }
+    payload.update(overrides)
+    return HostReservation.model_validate(payload)
+
+
+class TestHostReservationRevenue:
+    """Tests for the per-sales-group revenue helpers."""
+
+    def test_revenue_split_by_sales_group(self):
+        """Room, F&B and other revenue come from one grouped total."""
+        prices = [_price(0, 100.0), _price(0, 50.0), _price(1, 20.0), _price(2, 5.0), _price(3, 1.5)]
+        reservation = _reservation(Prices=prices)
+
+        assert reservation.get_revenue_by_sales_group() == {0: 150.0, 1: 20.0, 2: 5.0, 3: 1.5}
+        assert reservation.room_revenue == 150.0
+        assert reservation.fb_revenue == 20.0
+        assert reservation.other_revenue == 6.5
+        assert reservation.total_revenue == 176.5
+
+    def test_revenue_cached_and_not_dumped(self):
+        """The grouped totals are computed once and never serialized as a field."""
+        reservation = _reservation(Prices=[_price(0, 100.0)])
+
+        assert reservation.revenue_by_sales_group is reservation.revenue_by_sales_group
+        assert "revenue_by_sales_group" not in reservation.model_dump()
+
+    def test_no_prices(self):
+        """Reservations without prices report zero revenue."""
+        reservation = _reservation()
+
+        assert reservation.room_revenue == 0.0
+        assert reservation.total_revenue == 0
+
+
+class TestHotelConfigResponse:
+    """Tests for config lookups by type."""
+
+    def test_items_grouped_by_type(self):
+        """Each accessor returns the items of its type in response order."""
+        config = HotelConfigResponse.model_validate(
+            {
+                "HotelInfo": {"HotelId": 1, "HotelCode": "H1", "HotelName": "Hotel"},
+                "ConfigInfo": [
+                    {"ConfigType": "CATEGORY", "ConfigId": 1, "Code": "DBL", "Description": "Double"},
+                    {"ConfigType": "SEGMENT", "ConfigId": 2, "Code": "LEI", "Description": "Leisure"},
+                    {"ConfigType": "CATEGORY", "ConfigId": 3, "Code": "SGL", "Description": "Single"},
+                ],
+            }
+        )
+
+        assert [item.code for item in config.rooms] == ["DBL", "SGL"]
+        assert [item.code for item in config.segments] == ["LEI"]
+        assert config.charges == []
+
+
+class TestUnknownFields:
+    """Unknown Host PMS keys are dropped at intake."""
+
+    def test_reservation_ignores_unknown_keys(self):
+        """Extra keys are not stored on the reservation or its nested models."""
+        reservation = _reservation(
+            NewUpstreamField="x",
+            Guests=[{"GuestId": 1, "GuestNo": 1, "NameFormatted": "Doe, J", "Unexpected": 1}],
+        )
+
+        assert reservation.model_extra is None
+        assert reservation.guests[0].model_extra is None
+        assert "NewUpstreamField" not in reservation.model_dump(by_alias=True)
+
+
+class TestDateOnlyParsing:
+    """Tests for date-only string handling on guest and price dates."""
+
+    def test_price_date_only_string(self):
+        """A YYYY-MM-DD price date becomes midnight of that day."""
+        price = PriceItem(**_price(0, 10.0))
+        assert price.date == datetime(2026, 1, 1)
+
+    def test_price_full_timestamp_untouched(self):
+        """Full timestamps are left to Pydantic's own parsing."""
+        price = PriceItem(**{**_price(0, 10.0), "Date": "2026-01-01T12:30:00"})
+        assert price.date == datetime(2026, 1, 1, 12, 30)
+
+    def test_guest_birth_date(self):
+        """Guest birth dates accept the date-only form."""
+        guest = Guest.model_validate(
+            {"GuestId": 1, "GuestNo": 1, "NameFormatted": "Doe, J", "BirthDate": "1980-05-17"}
+        )
+        assert guest.birth_date == datetime(1980, 5, 17)
@@ -43,7 +43,7 @@ def mock_sqs_manager():
 def mock_esb_client():
     """Create a mock ClimberESBClient."""
     with patch(
-        "src.services.orchestration_service.ClimberESBClient"
+        "src.services.orchestration_service.get_esb_client"
     ) as mock:
         client = Mock()
         client.get_hotels = AsyncMock(
@@ -65,7 +65,7 @@ def mock_esb_client():
 def mock_host_api_client():
     """Create a mock HostPMSAPIClient."""
     with patch(
-        "src.services.orchestration_service.HostPMSAPIClient"
+        "src.services.orchestration_service.get_host_api_client"
     ) as mock:
         client = Mock()
         client.get_hotel_config = AsyncMock(
@@ -97,7 +97,7 @@ def mock_host_api_client():
 class TestS3ManagerIntegration:
     """Integration tests for S3Manager."""
 
-    @patch("boto3.client")
+    @patch("boto3.session.Session.client")
     def test_upload_raw_success(self, mock_boto_client):
         """Test successful raw data upload."""
         mock_s3 = Mock()
@@ -114,7 +114,7 @@ class TestS3ManagerIntegration:
         assert "s3://" in result["url"]
         mock_s3.put_object.assert_called_once()
 
-    @patch("boto3.client")
+    @patch("boto3.session.Session.client")
     def test_upload_processed_success(self, mock_boto_client):
         """Test successful processed data upload."""
         mock_s3 = Mock()
@@ -131,7 +131,7 @@ class TestS3ManagerIntegration:
         assert "s3://" in result["url"]
         mock_s3.put_object.assert_called_once()
 
-    @patch("boto3.client")
+    @patch("boto3.session.Session.client")
     def test_list_objects_success(self, mock_boto_client):
         """Test successfully listing S3 objects."""
         mock_s3 = Mock()
@@ -162,7 +162,7 @@ class TestS3ManagerIntegration:
 class TestSQSManagerIntegration:
     """Integration tests for SQSManager."""
 
-    @patch("boto3.client")
+    @patch("boto3.session.Session.client")
     def test_send_message_success(self, mock_boto_client):
         """Test successfully sending SQS message."""
         mock_sqs = Mock()
@@ -182,9 +182,9 @@ class TestSQSManagerIntegration:
         assert result["message_id"] == "msg-123"
         mock_sqs.send_message.assert_called_once()
 
-        # Verify GroupId and MessageDeduplicationId are set (FIFO specific)
+        # Verify MessageGroupId and MessageDeduplicationId are set (FIFO specific)
         call_args = mock_sqs.send_message.call_args
-        assert call_args.kwargs["GroupId"] == "HOTEL001"
+        assert call_args.kwargs["MessageGroupId"] == "HOTEL001"
         assert "MessageDeduplicationId" in call_args.kwargs
 
 
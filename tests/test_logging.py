@@ -0,0 +1,33 @@
+"""Unit tests for logging processors."""
+
+from datetime import datetime
+from decimal import Decimal
+
+from src.config.logging import _orjson_dumps, add_hotel_code_prefix
+
+
+def test_prefix_with_hotel_code():
+    """The event is prefixed with the hotel code."""
+    event = add_hotel_code_prefix(None, "info", {"event": "Done", "hotel_code": "H1"})
+    assert event["event"] == "[H1] Done"
+
+
+def test_prefix_with_worker_id():
+    """The worker id is folded into the prefix and removed from the payload."""
+    event = add_hotel_code_prefix(
+        None, "info", {"event": "Done", "hotel_code": "H1", "worker_id": 3}
+    )
+    assert event["event"] == "[H1-3] Done"
+    assert "worker_id" not in event
+
+
+def test_no_hotel_code_leaves_event():
+    """Records without a hotel code are unchanged apart from worker_id."""
+    event = add_hotel_code_prefix(None, "info", {"event": "Done", "worker_id": 3})
+    assert event == {"event": "Done"}
+
+
+def test_orjson_serializer_handles_arbitrary_values():
+    """Unknown types fall back to str() and datetimes are rendered as UTC ISO strings."""
+    rendered = _orjson_dumps({"at": datetime(2024, 1, 1), "amount": Decimal("1.5")})
+    assert rendered == '{"at":"2024-01-01T00:00:00Z","amount":"1.5"}'
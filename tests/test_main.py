@@ -0,0 +1,42 @@
+"""Unit tests for the application entry points."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src import main
+
+
+@pytest.fixture
+def orchestrator_cls():
+    """Patch the orchestrator class and reset the module-level singleton."""
+    with patch.object(main, "HostPMSConnectorOrchestrator") as cls:
+        cls.side_effect = lambda: Mock(aclose=AsyncMock())
+        main._orchestrator = None
+        yield cls
+        main._orchestrator = None
+
+
+def test_invocations_share_loop_and_orchestrator(orchestrator_cls):
+    """Warm invocations run on one event loop and reuse one orchestrator."""
+
+    async def current():
+        return asyncio.get_running_loop(), main._get_orchestrator()
+
+    first_loop, first = main._run(current())
+    second_loop, second = main._run(current())
+
+    assert first_loop is second_loop
+    assert first is second
+    assert orchestrator_cls.call_count == 1
+
+
+async def test_close_orchestrator_resets_singleton(orchestrator_cls):
+    """Final shutdown closes the orchestrator and forgets it."""
+    orchestrator = main._get_orchestrator()
+
+    await main._close_orchestrator()
+
+    orchestrator.aclose.assert_awaited_once()
+    assert main._orchestrator is None
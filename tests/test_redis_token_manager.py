@@ -0,0 +1,215 @@
+"""Unit tests for RedisTokenManager."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from src.clients.redis_token_manager import RedisTokenManager, TokenManagerError, aclose_pool
+from src.config import settings
+
+
+class _FakePipeline:
+    """Minimal stand-in for a non-transactional redis.asyncio pipeline."""
+
+    def __init__(self, redis_client: "_FakeRedis"):
+        self._redis = redis_client
+        self._commands: list[tuple[str, str]] = []
+
+    async def __aenter__(self) -> "_FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    def get(self, key: str) -> "_FakePipeline":
+        self._commands.append(("get", key))
+        return self
+
+    def pttl(self, key: str) -> "_FakePipeline":
+        self._commands.append(("pttl", key))
+        return self
+
+    async def execute(self) -> list:
+        self._redis.round_trips += 1
+        results = []
+        for command, key in self._commands:
+            value, ttl = self._redis.store.get(key, (None, -2))
+            results.append(value if command == "get" else ttl * 1000 if value else -2)
+        return results
+
+
+class _FakeRedis:
+    """In-memory Redis double counting round trips."""
+
+    def __init__(self):
+        self.store: dict[str, tuple[bytes, int]] = {}
+        self.round_trips = 0
+        self.set = AsyncMock(side_effect=self._set)
+        self.aclose = AsyncMock()
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    async def _set(self, key: str, value: bytes, ex: int, nx: bool = False) -> bool | None:
+        self.round_trips += 1
+        if nx and key in self.store:
+            return None
+        self.store[key] = (value, ex)
+        return True
+
+    async def get(self, key: str) -> bytes | None:
+        self.round_trips += 1
+        return self.store.get(key, (None, -2))[0]
+
+    async def delete(self, key: str) -> int:
+        self.round_trips += 1
+        return 1 if self.store.pop(key, None) else 0
+
+
+@pytest.fixture
+async def token_manager(monkeypatch):
+    """Token manager with an in-memory Redis and OAuth transport."""
+    monkeypatch.setattr(settings.esb, "basic_auth", "Y2xpZW50OnNlY3JldA==")
+    manager = RedisTokenManager()
+    await manager.redis_client.aclose()
+    manager.redis_client = _FakeRedis()
+    yield manager
+    await manager.close()
+
+
+def _oauth_transport(calls: list[httpx.Request]) -> httpx.MockTransport:
+    """MockTransport answering the OAuth token endpoint."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"access_token": f"token-{len(calls)}", "expires_in": 3600})
+
+    return httpx.MockTransport(handler)
+
+
+async def test_fetch_reuses_http_client(token_manager):
+    """Token fetches go through the long-lived OAuth client."""
+    calls: list[httpx.Request] = []
+    token_manager._http = httpx.AsyncClient(transport=_oauth_transport(calls))
+
+    first = await token_manager._fetch_new_token()
+    second = await token_manager._fetch_new_token()
+
+    assert first["access_token"] == "token-1"
+    assert second["access_token"] == "token-2"
+    assert calls[0].headers["authorization"] == "Basic Y2xpZW50OnNlY3JldA=="
+    assert calls[0].content == b"grant_type=client_credentials"
+
+
+async def test_local_cache_skips_redis(token_manager):
+    """A Redis hit costs one round trip, then the token is served locally."""
+    token_manager.redis_client.store[RedisTokenManager.REDIS_KEY] = (b"redis-token", 600)
+
+    assert await token_manager.get_auth_token() == "redis-token"
+    assert await token_manager.get_auth_token() == "redis-token"
+
+    assert token_manager.redis_client.round_trips == 1
+
+
+async def test_clear_cache_drops_local_token(token_manager):
+    """clear_cache forces the next call back to Redis and OAuth."""
+    calls: list[httpx.Request] = []
+    token_manager._http = httpx.AsyncClient(transport=_oauth_transport(calls))
+    token_manager.redis_client.store[RedisTokenManager.REDIS_KEY] = (b"redis-token", 600)
+
+    assert await token_manager.get_auth_token() == "redis-token"
+    await token_manager.clear_cache()
+
+    assert await token_manager.get_auth_token() == "token-1"
+    assert len(calls) == 1
+
+
+async def test_concurrent_misses_share_one_fetch(token_manager):
+    """Concurrent callers on a cold cache trigger a single OAuth request."""
+    calls: list[httpx.Request] = []
+    token_manager._http = httpx.AsyncClient(transport=_oauth_transport(calls))
+
+    tokens = await asyncio.gather(*(token_manager.get_auth_token() for _ in range(10)))
+
+    assert tokens == ["token-1"] * 10
+    assert len(calls) == 1
+    token_manager.redis_client.set.assert_awaited_once_with(
+        RedisTokenManager.REDIS_KEY, b"token-1", ex=3000, nx=True
+    )
+
+
+async def test_managers_share_connection_pool():
+    """All managers use one Redis pool until it is closed."""
+    first = RedisTokenManager()
+    second = RedisTokenManager()
+    try:
+        assert first.redis_client.connection_pool is second.redis_client.connection_pool
+    finally:
+        await first.close()
+        await second.close()
+
+    pool = first.redis_client.connection_pool
+    await aclose_pool()
+    third = RedisTokenManager()
+    try:
+        assert third.redis_client.connection_pool is not pool
+    finally:
+        await third.close()
+        await aclose_pool()
+
+
+async def test_missing_credentials_raise(token_manager, monkeypatch):
+    """Without Basic auth or client credentials the fetch fails fast."""
+    monkeypatch.setattr(settings.esb, "basic_auth", "")
+    monkeypatch.setattr(settings, "esb_basic_auth", "")
+    monkeypatch.setattr(settings.esb, "oauth_client_id", "")
+
+    with pytest.raises(TokenManagerError, match="credentials not configured"):
+        await token_manager._fetch_new_token()
+
+
+def test_ttl_clamped_to_token_lifetime(token_manager):
+    """TTL keeps a 10 minute buffer, is capped at TOKEN_TTL and never drops below 1s."""
+    assert token_manager._ttl_for(3600) == RedisTokenManager.TOKEN_TTL
+    assert token_manager._ttl_for(1800) == 1200
+    assert token_manager._ttl_for(300) == 1
+
+
+async def test_redis_skipped_after_repeated_failures(token_manager):
+    """After three Redis errors the manager stops calling Redis for the cooldown."""
+    calls: list[httpx.Request] = []
+    token_manager._http = httpx.AsyncClient(transport=_oauth_transport(calls))
+    token_manager.redis_client.pipeline = Mock(side_effect=ConnectionError("down"))
+    token_manager.redis_client.set = AsyncMock(side_effect=ConnectionError("down"))
+
+    for _ in range(3):
+        await token_manager.clear_cache()
+        await token_manager.get_auth_token()
+
+    assert token_manager.redis_client.pipeline.call_count == 2
+    assert token_manager.redis_client.set.await_count == 1
+    assert not token_manager._redis_available()
+    assert len(calls) == 3
+
+
+async def test_store_prefers_token_from_other_process(token_manager):
+    """If another process stored a token first, its token wins."""
+    token_manager.redis_client.store[RedisTokenManager.REDIS_KEY] = (b"other-token", 600)
+
+    assert await token_manager._store_token("my-token", 600) == "other-token"
+    assert token_manager.redis_client.store[RedisTokenManager.REDIS_KEY][0] == b"other-token"
+
+
+async def test_refresh_error_hides_detail_outside_debug(token_manager, monkeypatch):
+    """Outside debug mode the raised error names only the exception type."""
+    monkeypatch.setattr(settings, "debug", False)
+    token_manager._http = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(401, text="bad secret"))
+    )
+
+    with pytest.raises(TokenManagerError) as excinfo:
+        await token_manager.get_auth_token()
+
+    assert str(excinfo.value) == "Failed to obtain OAuth token: HTTPStatusError"
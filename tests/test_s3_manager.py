@@ -0,0 +1,127 @@
+"""Unit tests for S3Manager."""
+
+import threading
+from unittest.mock import Mock, patch
+
+import orjson
+import pytest
+
+from src.aws import S3Manager, S3UploadError
+from src.aws.s3_manager import _upload_executor
+
+
+@pytest.fixture
+def s3_manager():
+    """S3Manager backed by a mocked boto3 client."""
+    with patch("boto3.session.Session.client") as mock_boto_client:
+        mock_boto_client.return_value = Mock()
+        yield S3Manager()
+
+
+class TestUploadMany:
+    """Tests for concurrent uploads."""
+
+    def test_results_keep_job_order(self, s3_manager):
+        """Results are returned in the order jobs were submitted."""
+        results = s3_manager.upload_many(
+            [
+                (s3_manager.upload_raw, {"hotel_code": "H1", "data_type": "segments", "data": {"a": 1}}),
+                (s3_manager.upload_processed, {"hotel_code": "H1", "data_type": "segments", "data": {"a": 1}}),
+            ]
+        )
+
+        assert results[0]["url"].startswith(f"s3://{s3_manager.raw_prefix}segments/")
+        assert results[1]["url"].startswith(f"s3://{s3_manager.processed_prefix}segments/")
+        assert s3_manager.s3_client.put_object.call_count == 2
+
+    def test_failure_is_raised(self, s3_manager):
+        """A failing upload surfaces as S3UploadError."""
+        s3_manager.s3_client.put_object.side_effect = RuntimeError("boom")
+
+        with pytest.raises(S3UploadError):
+            s3_manager.upload_many(
+                [(s3_manager.upload_raw, {"hotel_code": "H1", "data_type": "segments", "data": {}})]
+            )
+
+
+    def test_managers_share_one_pool(self, s3_manager):
+        """Uploads from separate managers run on the same process-wide pool."""
+        threads = []
+
+        def record_thread(**kwargs):
+            threads.append(threading.current_thread().name)
+            return {}
+
+        for manager in (s3_manager, S3Manager()):
+            manager.upload_many([(record_thread, {})])
+
+        assert all(name.startswith("s3-upload") for name in threads)
+        assert _upload_executor() is _upload_executor()
+
+
+class TestPutBody:
+    """Tests for small vs multipart upload selection."""
+
+    def test_small_body_uses_put_object(self, s3_manager):
+        """Small payloads are written with a single put_object."""
+        s3_manager.upload_raw(hotel_code="H1", data_type="segments", data={"a": 1})
+
+        s3_manager.s3_client.put_object.assert_called_once()
+        s3_manager.s3_client.upload_fileobj.assert_not_called()
+
+    def test_large_body_uses_multipart(self, s3_manager):
+        """Payloads above the threshold go through upload_fileobj."""
+        with patch("src.aws.s3_manager.MULTIPART_THRESHOLD", 16):
+            s3_manager.upload_raw(
+                hotel_code="H1", data_type="segments", data={"payload": "x" * 64}
+            )
+
+        s3_manager.s3_client.put_object.assert_not_called()
+        s3_manager.s3_client.upload_fileobj.assert_called_once()
+
+
+class TestSerializeData:
+    """Tests for JSON body serialization."""
+
+    def test_model_list_matches_per_item_dump(self, s3_manager):
+        """Lists of models serialize the same as dumping each item by alias."""
+        from src.models.climber.segment import SegmentItem
+
+        items = [SegmentItem(code="A", name="Alpha"), SegmentItem(code="B", name="Beta")]
+
+        body = s3_manager._serialize_data_bytes(items)
+
+        assert orjson.loads(body) == [item.model_dump(by_alias=True) for item in items]
+
+
+class TestUploadManyAsync:
+    """Tests for awaitable concurrent uploads."""
+
+    async def test_results_keep_job_order(self, s3_manager):
+        """Async fan-out returns results in job order."""
+        results = await s3_manager.upload_many_async(
+            [
+                (s3_manager.upload_raw, {"hotel_code": "H1", "data_type": "segments", "data": {}}),
+                (s3_manager.upload_processed, {"hotel_code": "H1", "data_type": "segments", "data": {}}),
+            ]
+        )
+
+        assert results[0]["url"].startswith(f"s3://{s3_manager.raw_prefix}")
+        assert results[1]["url"].startswith(f"s3://{s3_manager.processed_prefix}")
+
+
+class TestNdjson:
+    """Tests for NDJSON list uploads."""
+
+    def test_list_uploaded_as_ndjson_when_enabled(self, s3_manager):
+        """With NDJSON enabled, lists become one record per line under .jsonl."""
+        s3_manager.ndjson = True
+
+        result = s3_manager.upload_processed(
+            hotel_code="H1", data_type="reservations", data=[{"a": 1}, {"a": 2}]
+        )
+
+        call = s3_manager.s3_client.put_object.call_args.kwargs
+        assert result["key"].endswith(".jsonl")
+        assert call["ContentType"] == "application/x-ndjson"
+        assert call["Body"] == b'{"a":1}\n{"a":2}\n'
@@ -0,0 +1,20 @@
+"""Unit tests for derived settings values."""
+
+from src.config import Settings
+
+
+def test_env_interpolation_resolved_once():
+    """{env} placeholders are substituted with the configured environment."""
+    config = Settings(environment="qa")
+    assert config.aws_s3_raw_prefix == "qa-pms-raw-"
+    assert config.aws_s3_processed_prefix == "qa-pms-"
+    assert config.aws_sqs_queue_name == "qa-pms-processor-queue.fifo"
+
+
+def test_padrao_message_group_id_ignores_comments():
+    """A commented-out group id falls back to HOTEL_CODE_S3."""
+    config = Settings(sqs_message_group_id="# Optional", hotel_code_s3="H1")
+    assert config.padrao_sqs_message_group_id() == "H1"
+
+    config = Settings(sqs_message_group_id="group-1", hotel_code_s3="H1")
+    assert config.padrao_sqs_message_group_id() == "group-1"
@@ -0,0 +1,295 @@
+"""Unit tests for SQSManager."""
+
+import threading
+import time
+import uuid
+from unittest.mock import Mock, patch
+
+import boto3
+import orjson
+import pytest
+
+from src.aws import SQSManager
+from src.aws import sqs_manager as sqs_manager_module
+from src.aws.client_factory import get_boto3_client_kwargs, get_session
+from src.aws.sqs_manager import SQSError, _build_dedup_id, _chunk_lanes, _send_executor
+from src.config import settings
+
+
+@pytest.fixture
+def sqs_manager():
+    """SQSManager backed by a mocked boto3 client and a fixed queue URL."""
+    with patch("boto3.session.Session.client") as mock_boto_client:
+        mock_boto_client.return_value = Mock()
+        manager = SQSManager()
+        manager._queue_url = "https://sqs.eu-west-2.amazonaws.com/000000000000/test.fifo"
+        yield manager
+
+
+def _messages(count: int) -> list[dict[str, str]]:
+    return [
+        {"hotel_code": f"H{i}", "file_type": "reservations", "file_key": f"H{i}/file.json"}
+        for i in range(count)
+    ]
+
+
+def _hotel_messages(hotel_code: str, count: int) -> list[dict[str, str]]:
+    return [
+        {"hotel_code": hotel_code, "file_type": "reservations", "file_key": f"{hotel_code}/{i}.json"}
+        for i in range(count)
+    ]
+
+
+class TestSendBatch:
+    """Tests for batched sends."""
+
+    def test_sends_in_chunks_of_ten(self, sqs_manager):
+        """25 messages for one hotel are sent with three ordered SendMessageBatch calls."""
+        sqs_manager.sqs_client.send_message_batch.side_effect = lambda **kw: {
+            "Successful": [{"Id": e["Id"]} for e in kw["Entries"]]
+        }
+
+        result = sqs_manager.send_batch(_hotel_messages("H0", 25))
+
+        assert result == {"successful": 25, "failed": 0}
+        calls = sqs_manager.sqs_client.send_message_batch.call_args_list
+        assert [len(c.kwargs["Entries"]) for c in calls] == [10, 10, 5]
+        first = calls[0].kwargs["Entries"][0]
+        assert first["MessageGroupId"] == "H0"
+        assert "MessageDeduplicationId" in first
+        file_keys = [
+            orjson.loads(e["MessageBody"])["fileKey"] for c in calls for e in c.kwargs["Entries"]
+        ]
+        assert file_keys == [f"H0/{i}.json" for i in range(25)]
+
+    def test_lanes_run_on_shared_pool(self, sqs_manager):
+        """Batch lanes from every manager run on the process-wide sqs-send pool."""
+        threads = []
+
+        def send_message_batch(**kw):
+            threads.append(threading.current_thread().name)
+            return {"Successful": [{"Id": e["Id"]} for e in kw["Entries"]]}
+
+        sqs_manager.sqs_client.send_message_batch.side_effect = send_message_batch
+        sqs_manager.send_batch(_messages(15))
+
+        assert threads and all(name.startswith("sqs-send") for name in threads)
+        assert _send_executor() is _send_executor()
+
+    def test_chunks_sharing_a_group_share_a_lane(self):
+        """Chunks linked through a hotel code are kept in one ordered lane."""
+        messages = _hotel_messages("A", 15) + _messages(10) + _hotel_messages("A", 1)
+
+        lanes = _chunk_lanes(messages)
+
+        assert len(lanes) == 1
+        assert [len(chunk) for chunk in lanes[0]] == [10, 10, 6]
+
+    def test_disjoint_chunks_get_separate_lanes(self):
+        """Chunks with no hotel code in common can be sent independently."""
+        lanes = _chunk_lanes(_hotel_messages("A", 10) + _hotel_messages("B", 12))
+
+        assert [[len(chunk) for chunk in lane] for lane in lanes] == [[10], [10, 2]]
+
+    def test_counts_failed_entries(self, sqs_manager):
+        """Per-entry failures reported by SQS are counted as failed."""
+        sqs_manager.sqs_client.send_message_batch.return_value = {
+            "Successful": [{"Id": "0"}],
+            "Failed": [{"Id": "1", "Code": "InternalError", "SenderFault": False}],
+        }
+
+        result = sqs_manager.send_batch(_messages(2))
+
+        assert result == {"successful": 1, "failed": 1}
+
+    async def test_send_batch_async_aggregates_chunks(self, sqs_manager):
+        """Async batch send fans out chunks and sums the results."""
+        sqs_manager.sqs_client.send_message_batch.side_effect = lambda **kw: {
+            "Successful": [{"Id": e["Id"]} for e in kw["Entries"]]
+        }
+
+        result = await sqs_manager.send_batch_async(_messages(23))
+
+        assert result == {"successful": 23, "failed": 0}
+        assert sqs_manager.sqs_client.send_message_batch.call_count == 3
+
+    async def test_send_batch_async_keeps_group_order(self, sqs_manager):
+        """A hotel spanning several chunks has its chunks sent one at a time, in order."""
+        in_flight: dict[str, int] = {}
+        overlaps: list[str] = []
+        sent_keys: list[str] = []
+
+        def send_message_batch(**kw):
+            groups = {e["MessageGroupId"] for e in kw["Entries"]}
+            for group in groups:
+                if in_flight.get(group):
+                    overlaps.append(group)
+                in_flight[group] = in_flight.get(group, 0) + 1
+            time.sleep(0.01)
+            sent_keys.extend(
+                orjson.loads(e["MessageBody"])["fileKey"]
+                for e in kw["Entries"]
+                if e["MessageGroupId"] == "A"
+            )
+            for group in groups:
+                in_flight[group] -= 1
+            return {"Successful": [{"Id": e["Id"]} for e in kw["Entries"]]}
+
+        sqs_manager.sqs_client.send_message_batch.side_effect = send_message_batch
+        messages = _hotel_messages("A", 35) + _hotel_messages("B", 20)
+
+        result = await sqs_manager.send_batch_async(messages)
+
+        assert result == {"successful": 55, "failed": 0}
+        assert overlaps == []
+        assert sent_keys == [f"A/{i}.json" for i in range(35)]
+
+
+class TestDeleteBatch:
+    """Tests for batched deletes."""
+
+    def test_deletes_in_chunks_and_counts_failures(self, sqs_manager):
+        """Handles are deleted ten at a time and per-entry failures counted."""
+        sqs_manager.sqs_client.delete_message_batch.side_effect = lambda **kw: {
+            "Successful": [{"Id": e["Id"]} for e in kw["Entries"][1:]],
+            "Failed": [{"Id": kw["Entries"][0]["Id"], "Code": "ReceiptHandleIsInvalid"}],
+        }
+
+        result = sqs_manager.delete_batch([f"rh{i}" for i in range(12)])
+
+        assert result == {"successful": 10, "failed": 2}
+        calls = sqs_manager.sqs_client.delete_message_batch.call_args_list
+        assert [len(c.kwargs["Entries"]) for c in calls] == [10, 2]
+
+    def test_delete_message_raises_on_failure(self, sqs_manager):
+        """Single delete is a wrapper that raises when the entry fails."""
+        sqs_manager.sqs_client.delete_message_batch.return_value = {
+            "Failed": [
+                {
+                    "Id": "0",
+                    "Code": "ReceiptHandleIsInvalid",
+                    "Message": "The receipt handle has expired",
+                }
+            ]
+        }
+
+        with pytest.raises(
+            SQSError, match="ReceiptHandleIsInvalid: The receipt handle has expired"
+        ):
+            sqs_manager.delete_message("rh")
+
+
+class TestQueueAttributes:
+    """Tests for queue attribute lookups."""
+
+    def test_static_attributes_are_cached(self, sqs_manager):
+        """Static attributes are fetched once and never request 'All'."""
+        sqs_manager.sqs_client.get_queue_attributes.return_value = {
+            "Attributes": {"QueueArn": "arn", "VisibilityTimeout": "30"}
+        }
+
+        first = sqs_manager.get_static_attributes()
+        second = sqs_manager.get_static_attributes()
+
+        assert first is second
+        sqs_manager.sqs_client.get_queue_attributes.assert_called_once()
+        names = sqs_manager.sqs_client.get_queue_attributes.call_args.kwargs["AttributeNames"]
+        assert "All" not in names
+
+    def test_queue_depth_is_not_cached(self, sqs_manager):
+        """Queue depth requests a single attribute on every call."""
+        sqs_manager.sqs_client.get_queue_attributes.return_value = {
+            "Attributes": {"ApproximateNumberOfMessages": "7"}
+        }
+
+        assert sqs_manager.get_queue_depth() == 7
+        assert sqs_manager.get_queue_depth() == 7
+        assert sqs_manager.sqs_client.get_queue_attributes.call_count == 2
+
+
+class TestReceiveMessages:
+    """Tests for long-poll receives."""
+
+    @pytest.mark.parametrize("requested,expected", [(0, 1), (5, 5), (60, 20)])
+    def test_wait_time_is_clamped(self, sqs_manager, requested, expected):
+        """Short polling is never issued and the SQS maximum is respected."""
+        sqs_manager.sqs_client.receive_message.return_value = {}
+
+        assert sqs_manager.receive_messages(wait_time=requested) == []
+
+        kwargs = sqs_manager.sqs_client.receive_message.call_args.kwargs
+        assert kwargs["WaitTimeSeconds"] == expected
+
+    def test_receive_batch_collects_until_target(self, sqs_manager):
+        """receive_batch keeps polling until the target count is reached."""
+        sqs_manager.sqs_client.receive_message.side_effect = lambda **kw: {
+            "Messages": [
+                {"MessageId": str(i), "ReceiptHandle": f"rh{i}", "Body": "{}"}
+                for i in range(kw["MaxNumberOfMessages"])
+            ]
+        }
+
+        messages = sqs_manager.receive_batch(target=25, window=5)
+
+        assert len(messages) == 25
+        calls = sqs_manager.sqs_client.receive_message.call_args_list
+        assert [c.kwargs["MaxNumberOfMessages"] for c in calls] == [10, 10, 5]
+
+    def test_receive_batch_stops_below_long_poll_floor(self, sqs_manager, monkeypatch):
+        """The window tail shorter than the floor is not polled (and not clamped up)."""
+        clock = [0.0]
+        monkeypatch.setattr(sqs_manager_module.time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(settings.aws, "sqs_min_wait_seconds", 5)
+
+        def receive_message(**kw):
+            clock[0] += kw["WaitTimeSeconds"]
+            return {}
+
+        sqs_manager.sqs_client.receive_message.side_effect = receive_message
+
+        assert sqs_manager.receive_batch(target=10, window=22.5) == []
+        calls = sqs_manager.sqs_client.receive_message.call_args_list
+        assert [c.kwargs["WaitTimeSeconds"] for c in calls] == [20]
+
+        sqs_manager.sqs_client.receive_message.reset_mock()
+        assert sqs_manager.receive_batch(target=10, window=3) == []
+        sqs_manager.sqs_client.receive_message.assert_not_called()
+
+
+def test_sqs_client_has_small_retry_budget():
+    """SQS overrides the shared adaptive retry budget with a smaller one."""
+    with patch("boto3.session.Session.client") as mock_boto_client:
+        SQSManager()
+
+    config = mock_boto_client.call_args.kwargs["config"]
+    # botocore rewrites max_attempts as total_max_attempts (retries + 1) once a client is built
+    retries = config.retries
+    assert retries.get("total_max_attempts", retries.get("max_attempts", 0) + 1) == 4
+    assert config.read_timeout == 30
+
+
+@pytest.mark.parametrize(
+    "hotel_code,file_key",
+    [("HOTEL001", "HOTEL001/reservations-20240115.json"), ("PTLIS", "PTLIS/ação.json"), ("", "")],
+)
+def test_dedup_id_matches_uuid5(hotel_code, file_key):
+    """Primed SHA-1 dedup id is identical to uuid5 over the concatenated name."""
+    expected = str(uuid.uuid5(uuid.NAMESPACE_DNS, f"{hotel_code}{file_key}"))
+    assert _build_dedup_id(hotel_code, file_key) == expected
+
+
+def test_entries_use_dedup_id(sqs_manager):
+    """Built entries carry the dedup id for hotel code + file key."""
+    entry = sqs_manager._build_entry("H1", "reservations", "H1/file.json")
+    assert entry["MessageDeduplicationId"] == _build_dedup_id("H1", "H1/file.json")
+
+
+def test_clients_share_session_without_touching_boto3_default(monkeypatch):
+    """Clients come from one Session built from the client kwargs; boto3's default is untouched."""
+    monkeypatch.setattr(boto3, "DEFAULT_SESSION", None)
+
+    session = get_session()
+
+    assert session is get_session()
+    assert session.region_name == get_boto3_client_kwargs()["region_name"]
+    assert boto3.DEFAULT_SESSION is None